@@ -5,27 +5,62 @@ A development dashboard for your projects.
 
 from __future__ import annotations
 
-from devboard._internal.app import Devboard
-from devboard._internal.board import Column, DataTable, Row
+from devboard._internal.app import Devboard, FilterInput
+from devboard._internal.asyncgit import run_git, set_git_env
+from devboard._internal.bench import bench_board, benchmark_columns, format_bench_report
+from devboard._internal.board import Column, DataTable, ErrorCell, Row, default_sort_key
 from devboard._internal.cli import get_parser, main
+from devboard._internal.daemon import BoardDaemon, DaemonClient, connect_daemon, serve_board
 from devboard._internal.datatable import Checkbox, SelectableRow, SelectableRowsDataTable
+from devboard._internal.details import DetailsCache
+from devboard._internal.discovery import discover_projects
+from devboard._internal.invalidation import ProjectsChanged
+from devboard._internal.memo import RowsCache, memoize_rows
+from devboard._internal.metrics import MetricsExporter, export_metrics
 from devboard._internal.modal import Modal, ModalMixin
-from devboard._internal.notifications import NotifyMixin
+from devboard._internal.notifications import BulkOperation, NotifyMixin
+from devboard._internal.objects import ObjectReader
+from devboard._internal.pager import Pager, PagerView
 from devboard._internal.projects import Project, Status
+from devboard._internal.refs import Refs
 
 __all__: list[str] = [
+    "BoardDaemon",
+    "BulkOperation",
     "Checkbox",
     "Column",
+    "DaemonClient",
     "DataTable",
+    "DetailsCache",
     "Devboard",
+    "ErrorCell",
+    "FilterInput",
+    "MetricsExporter",
     "Modal",
     "ModalMixin",
     "NotifyMixin",
+    "ObjectReader",
+    "Pager",
+    "PagerView",
     "Project",
+    "ProjectsChanged",
+    "Refs",
     "Row",
+    "RowsCache",
     "SelectableRow",
     "SelectableRowsDataTable",
     "Status",
+    "bench_board",
+    "benchmark_columns",
+    "connect_daemon",
+    "default_sort_key",
+    "discover_projects",
+    "export_metrics",
+    "format_bench_report",
     "get_parser",
     "main",
+    "memoize_rows",
+    "run_git",
+    "serve_board",
+    "set_git_env",
 ]
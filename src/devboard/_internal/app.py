@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import ast
+import contextlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from importlib.util import module_from_spec, spec_from_file_location
-from multiprocessing import Pool
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from appdirs import user_config_dir
 from rich.markdown import Markdown
+from rich.markup import escape
+from rich.text import Text
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.widgets import Footer
+from textual.widgets import Footer, Input
+from textual.worker import get_current_worker
 
 from devboard._internal.board import Column, DataTable
+from devboard._internal.daemon import _row_project
+from devboard._internal.invalidation import ProjectsChanged
 from devboard._internal.modal import Modal, ModalMixin
+from devboard._internal.notifications import BulkOperation
+from devboard._internal.workers import _register_board_module, _start_fork_server
 
 # TODO: Remove once support for Python 3.10 is dropped.
 if sys.version_info >= (3, 11):
@@ -26,7 +35,153 @@ else:
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
+    from textual.timer import Timer
+
+    from devboard._internal.daemon import DaemonClient
+    from devboard._internal.projects import Project
+
 _DEBUG = os.getenv("DEBUG", "0") == "1"
+_INVALIDATION_DELAY = 0.2
+"""Time during which invalidations are merged before updating columns, in seconds."""
+_BOARD_WATCH_INTERVAL = 1.0
+"""Interval at which the board file is checked for changes, in seconds."""
+_BOARD_MODULE = "devboard.user_board"
+"""Name of the module boards are loaded in."""
+
+
+_FETCH_WORKERS = 8
+"""Number of projects fetched concurrently, in threads: fetches never occupy workers populating columns."""
+_FETCH_TIMEOUT = 120.0
+"""Time budget of each `git fetch`, in seconds, after which it is killed."""
+
+
+def _fetch(project: Project) -> Project:
+    project.fetch(timeout=_FETCH_TIMEOUT)
+    return project
+
+
+def _default_config_file() -> Path:
+    return Path(user_config_dir(), "devboard", "config.toml")
+
+
+def _board_file(board: str | Path | None, config_file: Path) -> Path:
+    # Return the file of a board, given by name or path, or configured in the given file.
+    if board is None:
+        try:
+            with config_file.open("rb") as file:
+                config = tomllib.load(file)
+        except FileNotFoundError:
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            config_file.write_text('board = "default"')
+            board = "default"
+        else:
+            board = config["board"]
+    if isinstance(board, str):
+        board_file = config_file.parent.joinpath(f"{board}.py")
+        if not board_file.exists():
+            if board == "default":
+                board_file.write_text(Path(__file__).parent.joinpath("default_board.py").read_text())
+            else:
+                board_file = Path(board)
+    else:
+        board_file = board
+    if not board_file.exists():
+        raise ValueError(f"devboard: error: Unknown board '{board}'")
+    return board_file
+
+
+def _load_board(board: str | Path | None, config_file: Path) -> Iterable[Column | type[Column]]:
+    # Load the columns of a board, given by name or path, or configured in the given file.
+    board_file = _board_file(board, config_file)
+    spec = spec_from_file_location(_BOARD_MODULE, str(board_file))
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not get import spec from '{_BOARD_MODULE}'")
+    user_config = module_from_spec(spec)
+    sys.modules[_BOARD_MODULE] = user_config
+    spec.loader.exec_module(user_config)
+    _register_board_module(_BOARD_MODULE, str(board_file))
+    return user_config.columns
+
+
+def _definitions(source: str) -> dict[str, str]:
+    # Return the source of top-level classes and functions by name,
+    # and of other statements under the empty name, except the assignment of `columns`.
+    definitions = {"": ""}
+    for node in ast.parse(source).body:
+        segment = "\n".join(
+            ast.get_source_segment(source, part) or "" for part in [*getattr(node, "decorator_list", []), node]
+        )
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            definitions[node.name] = segment
+        elif not (
+            isinstance(node, ast.Assign)
+            and any(isinstance(target, ast.Name) and target.id == "columns" for target in node.targets)
+        ):
+            definitions[""] += segment + "\n"
+    return definitions
+
+
+def _references(source: str) -> dict[str, set[str]]:
+    # Return the names each top-level class or function refers to:
+    # bases, decorators, and any name used in its body (other classes, helper functions).
+    return {
+        node.name: {child.id for child in ast.walk(node) if isinstance(child, ast.Name)} - {node.name}
+        for node in ast.parse(source).body
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+
+def _reload_board(board_file: Path, previous_source: str) -> tuple[Iterable[Column | type[Column]], str, set[str]]:
+    # Execute a changed board file again, in the module it was loaded in.
+    # Top-level classes and functions whose source did not change, and which don't refer
+    # to changed ones (subclasses of changed columns, columns calling changed helpers),
+    # are not executed again: they keep their previous objects, preserving their identity,
+    # class-level state and caches keyed on them (memoized rows, project equality),
+    # and statements executed after them (subclasses, `columns`) use these previous objects.
+    # Return the columns, the new source, and the names of classes and functions that changed:
+    # all of them, including imported columns, if other top-level statements changed.
+    module = sys.modules[_BOARD_MODULE]
+    source = board_file.read_text()
+    statements = ast.parse(source, str(board_file)).body
+    previous, current = _definitions(previous_source), _definitions(source)
+    kept = set()
+    if previous[""] == current[""]:
+        changed = {name for name in previous.keys() | current.keys() if previous.get(name) != current.get(name)}
+        references = _references(source)
+        while dependent := {name for name, names in references.items() if name not in changed and names & changed}:
+            changed |= dependent
+        kept = {name for name in current if name and name not in changed and name in module.__dict__}
+    namespace = dict(module.__dict__)
+    try:
+        for statement in statements:
+            if isinstance(statement, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) and statement.name in kept:
+                continue
+            code = compile(ast.Module(body=[statement], type_ignores=[]), str(board_file), "exec")
+            exec(code, module.__dict__)  # noqa: S102
+    except Exception:
+        module.__dict__.clear()
+        module.__dict__.update(namespace)
+        raise
+    changed = {name for name in current if name and name not in kept}
+    if previous[""] != current[""]:
+        changed |= {(column if isinstance(column, type) else type(column)).__name__ for column in module.columns}
+    _register_board_module(_BOARD_MODULE, str(board_file))
+    return module.columns, source, changed
+
+
+class FilterInput(Input):
+    """An input filtering rows of all columns as you type."""
+
+    BINDINGS: ClassVar = [
+        Binding("escape", "clear", "Clear filter", show=False),
+    ]
+    """Key bindings for the filter input."""
+
+    def action_clear(self) -> None:
+        """Clear the filter and hide the input."""
+        self.value = ""
+        self.display = False
+        self.app.query(DataTable).first().focus()
 
 
 class Devboard(App, ModalMixin):
@@ -34,10 +189,15 @@ class Devboard(App, ModalMixin):
 
     CSS_PATH = Path(__file__).parent / "devboard.tcss"
     """Path to the CSS file."""
+    AUTO_FOCUS = "DataTable"
+    """Widgets to focus on startup (not the hidden filter input)."""
 
     BINDINGS: ClassVar = [
         Binding("F5, ctrl+r", "refresh", "Refresh"),
+        Binding("slash", "filter", "Filter"),
         Binding("question_mark", "show_help", "Help"),
+        Binding("L", "show_log", "Log"),
+        Binding("ctrl+b", "reload_board", "Reload board", show=False),
         Binding("ctrl+q, q, escape", "exit", "Exit", key_display="Q"),
     ]
     """Application key bindings."""
@@ -50,27 +210,47 @@ class Devboard(App, ModalMixin):
         *args: Any,
         board: str | Path | None = None,
         background_tasks: bool = True,
+        daemon: DaemonClient | None = None,
         **kwargs: Any,
     ) -> None:
-        """Initialize the app."""
+        """Initialize the app.
+
+        Parameters:
+            *args: Arguments passed to the parent class.
+            board: The board name or path. By default, the configured board.
+            background_tasks: Whether to fetch projects in the background.
+            daemon: A client of a daemon serving rows of the board (see `connect_daemon`).
+            **kwargs: Keyword arguments passed to the parent class.
+        """
         super().__init__(*args, **kwargs)
+        self.daemon = daemon
+        """Client of a daemon serving rows of the board."""
         self._board = board
-        self._config_file = Path(user_config_dir(), "devboard", "config.toml")
+        self._config_file = _default_config_file()
         self._background_tasks = background_tasks
+        self._invalidated: dict[Project, set[str]] = {}
+        self._invalidation_timer: Timer | None = None
+        self._board_file: Path | None = None
+        self._board_source = ""
+        self._board_mtime = 0
+        _start_fork_server()
 
     def compose(self) -> ComposeResult:
         """Compose the layout."""
-        for column in self._load_columns():
-            if isinstance(column, Column):
-                yield column
-            else:
-                yield column()
+        for column_or_class in self._load_columns():
+            column = column_or_class if isinstance(column_or_class, Column) else column_or_class()
+            column.daemon = self.daemon
+            yield column
+        yield FilterInput(placeholder="Filter rows (fuzzy)", id="filter")
         yield Footer()
 
     def on_mount(self) -> None:
-        """Run background tasks."""
+        """Subscribe to rows updated by the daemon, and run background tasks."""
+        if self.daemon is not None:
+            self.daemon.subscribe(self._on_daemon_change)
         if self._background_tasks:
             self.fetch_all()
+        self.set_interval(_BOARD_WATCH_INTERVAL, self._check_board)
 
     # --------------------------------------------------
     # Binding actions.
@@ -79,68 +259,180 @@ class Devboard(App, ModalMixin):
         """Show help."""
         lines = ["# Main keys\n\n"]
         lines.extend(self._bindings_help(Devboard))
+        lines.extend(self._bindings_help(Column))
         lines.extend(self._bindings_help(DataTable, search_up=True))
         for column in self.query(Column):
             lines.append(f"\n\n# {column.__class__.TITLE}\n\n")
             lines.extend(self._bindings_help(column.__class__))
         self.push_screen(Modal(text=Markdown("\n".join(lines))))
 
+    def action_show_log(self) -> None:
+        """Show the log of recent bulk operations, most recent first."""
+        if not BulkOperation.history:
+            self.notify("No bulk operations yet.", timeout=3)
+            return
+        self.push_screen(
+            Modal(text=Text("\n").join(operation.render_log() for operation in reversed(BulkOperation.history))),
+        )
+
     def action_refresh(self) -> None:
         """Refresh all columns."""
         for column in self.query(Column):
             column.update()
 
+    def refresh_project(self, project: Project) -> None:
+        """Refresh a single project in all columns.
+
+        Parameters:
+            project: The project to refresh.
+        """
+        for column in self.query(Column):
+            column.update_project(project)
+
+    def invalidate(self, *projects: Project, kinds: Iterable[str]) -> None:
+        """Notify columns that data of projects changed. See `Column.invalidate`.
+
+        Parameters:
+            *projects: The projects that changed.
+            kinds: The kinds of data that changed (see `ProjectsChanged`).
+        """
+        self.post_message(ProjectsChanged(projects, kinds))
+
+    async def action_reload_board(self) -> None:
+        """Reload the board file, replacing only columns whose code changed.
+
+        Other columns are kept as they are, with their rows, and caches of projects and rows.
+        The board file is also reloaded automatically when it changes.
+        """
+        if self._board_file is None:
+            return
+        with contextlib.suppress(OSError):
+            self._board_mtime = self._board_file.stat().st_mtime_ns
+        try:
+            columns, self._board_source, changed = _reload_board(self._board_file, self._board_source)
+        except Exception as error:  # noqa: BLE001
+            self.notify(f"[b red]ERROR[/]  Could not reload board: {escape(str(error))}", severity="error", timeout=10)
+            return
+        previous = list(self.query(Column))
+        widgets = []
+        for column_or_class in columns:
+            name = (column_or_class if isinstance(column_or_class, type) else type(column_or_class)).__name__
+            kept = next((column for column in previous if type(column).__name__ == name), None)
+            if kept is not None and name not in changed:
+                previous.remove(kept)
+                widgets.append(kept)
+            else:
+                # New columns compute their rows locally: a daemon runs the board as it was when started.
+                widgets.append(column_or_class if isinstance(column_or_class, Column) else column_or_class())
+        for column in previous:
+            await column.remove()
+        filter_input = self.query_one(FilterInput)
+        if new := [column for column in widgets if not column.is_mounted]:
+            await self.screen.mount_all(new, before=filter_input)
+        for column in widgets:
+            self.screen.move_child(column, before=filter_input)
+        self.notify(f"Board reloaded: {len(new)} column(s) updated", timeout=3)
+
+    def action_filter(self) -> None:
+        """Show and focus the filter input."""
+        filter_input = self.query_one(FilterInput)
+        filter_input.display = True
+        filter_input.focus()
+
     def action_exit(self) -> None:
         """Exit application."""
         self.workers.cancel_all()
+        if self.daemon is not None:
+            self.daemon.close()
         self.exit()
 
+    # --------------------------------------------------
+    # Message handlers.
+    # --------------------------------------------------
+    def on_projects_changed(self, message: ProjectsChanged) -> None:
+        """Record changed projects, and schedule the update of columns depending on the changed data."""
+        for project in message.projects:
+            self._invalidated.setdefault(project, set()).update(message.kinds)
+        if self._invalidation_timer is None:
+            self._invalidation_timer = self.set_timer(_INVALIDATION_DELAY, self._flush_invalidations)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Filter rows of all columns."""
+        if isinstance(event.input, FilterInput):
+            for table in self.query(DataTable):
+                table.filter(event.value)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Go back to the columns, keeping the filter."""
+        if isinstance(event.input, FilterInput):
+            if not event.value:
+                event.input.display = False
+            self.query(DataTable).first().focus()
+
     # --------------------------------------------------
     # Additional methods/properties.
     # --------------------------------------------------
     @work(thread=True)
     def fetch_all(self) -> None:
-        """Run `git fetch` in all projects, in background."""
+        """Run `git fetch` in all projects, in background.
+
+        Columns depending on remote branches or tags are updated for fetched projects.
+        """
+        worker = get_current_worker()
         projects = set()
         for column in self.query(Column):
             projects |= set(column.list_projects())
-        with Pool() as pool:
-            for project in projects:
-                pool.apply_async(project.fetch)
+        if not projects:
+            return
+        # Fetches wait on the network: run them in threads rather than in the shared pool,
+        # where they would delay populating columns (including updates triggered by fetches).
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+            futures = [executor.submit(_fetch, project) for project in projects]
+            for future in as_completed(futures):
+                if worker.is_cancelled:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return
+                self.invalidate(future.result(), kinds=("remotes", "tags"))
+
+    def _on_daemon_change(self, column_name: str, projects: list[Project], rows: list[tuple[Any, ...]]) -> None:
+        # Called from the client's thread when the daemon updated rows (watched projects changed).
+        with contextlib.suppress(RuntimeError):
+            self.call_from_thread(self._replace_daemon_rows, column_name, set(projects), rows)
+
+    def _replace_daemon_rows(self, column_name: str, projects: set[Project], rows: list[tuple[Any, ...]]) -> None:
+        for column in self.query(Column):
+            if type(column).__qualname__ != column_name or not column._loaded or column.table.loading:
+                continue
+            # Projects being updated will get fresh rows anyway.
+            if projects := projects - column._updating_projects:
+                column._replace_projects_rows(
+                    projects,
+                    [row for row in rows if _row_project(row) in projects],
+                    column._generation,
+                )
+
+    def _flush_invalidations(self) -> None:
+        self._invalidation_timer = None
+        invalidated, self._invalidated = self._invalidated, {}
+        for column in self.query(Column):
+            if projects := [project for project, kinds in invalidated.items() if column.depends_on(kinds)]:
+                column.update_projects(projects)
 
     def _load_columns(self) -> Iterable[Column | type[Column]]:
-        board: str | Path
-        if self._board is None:
-            try:
-                with self._config_file.open("rb") as config_file:
-                    config = tomllib.load(config_file)
-            except FileNotFoundError:
-                self._config_file.parent.mkdir(parents=True, exist_ok=True)
-                self._config_file.write_text('board = "default"')
-                board = "default"
-            else:
-                board = config["board"]
-        else:
-            board = self._board
-        if isinstance(board, str):
-            board_file = self._config_file.parent.joinpath(f"{board}.py")
-            if not board_file.exists():
-                if board == "default":
-                    board_file.write_text(Path(__file__).parent.joinpath("default_board.py").read_text())
-                else:
-                    board_file = Path(board)
-        else:
-            board_file = board
-        if not board_file.exists():
-            raise ValueError(f"devboard: error: Unknown board '{board}'")
-        module_path = "devboard.user_board"
-        spec = spec_from_file_location(module_path, str(board_file))
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not get import spec from '{module_path}'")
-        user_config = module_from_spec(spec)
-        sys.modules[module_path] = user_config
-        spec.loader.exec_module(user_config)
-        return user_config.columns
+        self._board_file = _board_file(self._board, self._config_file)
+        self._board_mtime = self._board_file.stat().st_mtime_ns
+        self._board_source = self._board_file.read_text()
+        return _load_board(self._board_file, self._config_file)
+
+    def _check_board(self) -> None:
+        if self._board_file is None:
+            return
+        try:
+            mtime = self._board_file.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._board_mtime:
+            self.run_worker(self.action_reload_board(), group="reload", exclusive=True)
 
     @staticmethod
     def _bindings_help(cls: type, *, search_up: bool = False) -> Iterator[str]:  # noqa: PLW0211
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from git import GitCommandError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_CONCURRENCY = int(os.getenv("DEVBOARD_GIT_CONCURRENCY", "32"))
+"""Maximum number of Git processes run concurrently by `run_git`."""
+_SEMAPHORES: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+"""Semaphores limiting concurrency, one per event loop."""
+_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+"""Environment for Git processes. Prompts would hang forever since there is no terminal to answer them."""
+
+
+def set_git_env(name: str, value: str | None) -> None:
+    """Set or unset an environment variable for Git processes run by `run_git`.
+
+    Parameters:
+        name: The name of the variable.
+        value: The value of the variable, or `None` to unset it.
+    """
+    if value is None:
+        _ENV.pop(name, None)
+    else:
+        _ENV[name] = value
+
+
+def _semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if (semaphore := _SEMAPHORES.get(loop)) is None:
+        semaphore = _SEMAPHORES[loop] = asyncio.Semaphore(_CONCURRENCY)
+    return semaphore
+
+
+async def _run_git_bytes(cwd: str | Path, *args: str) -> bytes:
+    async with _semaphore():
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=cwd,
+            env=_ENV,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+    if process.returncode:
+        raise GitCommandError(["git", *args], process.returncode, stderr, stdout)
+    return stdout
+
+
+async def run_git(cwd: str | Path, *args: str) -> str:
+    """Run a Git command asynchronously, in the running event loop.
+
+    At most `DEVBOARD_GIT_CONCURRENCY` (environment variable, default 32)
+    Git processes run at the same time. If the calling task is cancelled,
+    the Git process is killed.
+
+    Parameters:
+        cwd: The directory to run Git in.
+        *args: Arguments passed to Git.
+
+    Raises:
+        GitCommandError: When Git exits with a non-zero code.
+
+    Returns:
+        The standard output of the command, without its trailing newline.
+    """
+    stdout = await _run_git_bytes(cwd, *args)
+    return stdout.decode("utf8", errors="replace").removesuffix("\n")
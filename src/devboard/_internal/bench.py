@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import statistics
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from devboard._internal import discovery, objects, workers
+from devboard._internal.app import _default_config_file, _load_board
+from devboard._internal.asyncgit import set_git_env
+from devboard._internal.board import Column
+from devboard._internal.metrics import _scan_column
+from devboard._internal.projects import _FILE_CACHE
+from devboard._internal.refs import _LOOSE_CACHE, _PACKED_CACHE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from devboard._internal.memo import RowsCache
+    from devboard._internal.projects import Project
+
+_TRACE_VARIABLE = "GIT_TRACE2_EVENT"
+"""Environment variable making Git write trace events, one file per process when set to a directory."""
+_SLOWEST_PROJECTS = 5
+"""Number of slowest projects shown per column in text reports."""
+
+
+@contextmanager
+def _trace_git() -> Iterator[Path]:
+    # Make every Git process (GitPython, `run_git`, workers) write its trace events into a temporary directory.
+    previous = os.environ.get(_TRACE_VARIABLE)
+    with tempfile.TemporaryDirectory(prefix="devboard-bench-") as directory:
+        os.environ[_TRACE_VARIABLE] = directory
+        set_git_env(_TRACE_VARIABLE, directory)
+        try:
+            yield Path(directory)
+        finally:
+            if previous is None:
+                os.environ.pop(_TRACE_VARIABLE, None)
+            else:
+                os.environ[_TRACE_VARIABLE] = previous
+            set_git_env(_TRACE_VARIABLE, previous)
+
+
+def _count_git_processes(directory: Path) -> tuple[int, dict[str, int]]:
+    # Count trace files (one per Git process), and processes per work tree.
+    total = 0
+    by_worktree: dict[str, int] = {}
+    for trace_file in directory.iterdir():
+        total += 1
+        with trace_file.open(encoding="utf8", errors="replace") as file:
+            for line in file:
+                if '"def_repo"' in line:
+                    with contextlib.suppress(ValueError):
+                        worktree = json.loads(line).get("worktree")
+                        if worktree:
+                            by_worktree[worktree] = by_worktree.get(worktree, 0) + 1
+                    break
+    return total, by_worktree
+
+
+def _clear_caches(column: Column) -> None:
+    cache: RowsCache | None = getattr(column.populate_rows, "rows_cache", None)
+    if cache is not None:
+        cache.clear()
+    with discovery._INDEX_LOCK:
+        discovery._INDEX.clear()
+    _PACKED_CACHE.clear()
+    _LOOSE_CACHE.clear()
+    _FILE_CACHE.clear()
+    with objects._OBJECTS_LOCK:
+        objects._PACKS.clear()
+        objects._OBJECTS.clear()
+        objects._objects_size = 0
+    # Workers of the shared pool have their own caches: start new ones.
+    workers._stop_shared_pool()
+
+
+def _run(column: Column, directory: Path) -> dict[str, Any]:
+    # The same trace directory is used for all runs (changing the environment would restart workers).
+    for trace_file in directory.iterdir():
+        trace_file.unlink()
+    projects, rows, durations = _scan_column(column)
+    git_processes, by_worktree = _count_git_processes(directory)
+    return {
+        "projects": projects,
+        "rows": len(rows),
+        "list_seconds": durations["list"],
+        "populate_seconds": durations["populate"],
+        "git_processes": git_processes,
+        "git_processes_by_worktree": by_worktree,
+    }
+
+
+def _project_report(project: Project, column: Column, by_worktree: dict[str, int]) -> dict[str, Any]:
+    duration = Column.scan_durations.get(project, {}).get(type(column).__qualname__)
+    return {
+        "name": project.name,
+        "seconds": duration,
+        "git_processes": by_worktree.get(str(Path(project.path).resolve()), 0),
+    }
+
+
+def benchmark_columns(columns: Iterable[Column | type[Column]], *, runs: int = 3) -> dict[str, Any]:
+    """Time columns populated without the user interface, once cold and several times warm.
+
+    Before the cold run, caches of memoized columns (see `memoize_rows`),
+    of project discovery and of Git files are cleared, and workers are restarted.
+    Warm runs reuse them.
+
+    Parameters:
+        columns: The columns of the board, as instances or classes.
+        runs: The number of warm runs.
+
+    Returns:
+        A report, serializable as JSON: per-column timings, numbers of rows and Git processes,
+        per-project timings and Git processes of the cold run (keyed by project path),
+        and peak memory usage in bytes, of devboard and of its largest worker process.
+    """
+    report: dict[str, Any] = {"runs": runs, "columns": {}}
+    workers._worker_memory.clear()
+    with _trace_git() as directory:
+        for column in (column if isinstance(column, Column) else column() for column in columns):
+            _clear_caches(column)
+            cold = _run(column, directory)
+            by_worktree = cold.pop("git_processes_by_worktree")
+            projects = {
+                str(project.path): _project_report(project, column, by_worktree) for project in cold.pop("projects")
+            }
+            warm = []
+            for _ in range(runs):
+                result = _run(column, directory)
+                del result["projects"], result["git_processes_by_worktree"]
+                warm.append(result)
+            report["columns"][column.TITLE or type(column).__name__] = {
+                "cold": cold,
+                "warm": warm,
+                "projects": projects,
+            }
+    # Workers report their own peak memory usage with their results: long-lived ones never exit,
+    # so they wouldn't be accounted for in the resource usage of children.
+    if (memory := workers._memory()) is None:
+        # Not available on Windows.
+        report["peak_memory"] = None
+    else:
+        report["peak_memory"] = {
+            "self": memory[1],
+            "workers": max(workers._worker_memory.values(), default=None),
+        }
+    return report
+
+
+def format_bench_report(report: dict[str, Any]) -> str:
+    """Format a report returned by `benchmark_columns` as text.
+
+    Parameters:
+        report: The report.
+
+    Returns:
+        A human-readable report.
+    """
+    lines = []
+    header = (
+        f"{'Column':<20} {'Rows':>6} {'List':>9} {'Cold':>9} {'Warm mean':>10} {'Warm min':>9} {'Git cold/warm':>14}"
+    )
+    lines.append(header)
+    lines.append("-" * len(header))
+    for name, data in report["columns"].items():
+        cold, warm = data["cold"], data["warm"]
+        warm_times = [run["populate_seconds"] for run in warm] or [0.0]
+        warm_git = round(statistics.mean(run["git_processes"] for run in warm)) if warm else 0
+        lines.append(
+            f"{name[:20]:<20} {cold['rows']:>6} {cold['list_seconds']:>8.3f}s {cold['populate_seconds']:>8.3f}s "
+            f"{statistics.mean(warm_times):>9.3f}s {min(warm_times):>8.3f}s {cold['git_processes']:>7}/{warm_git}",
+        )
+    lines.append("")
+    lines.append(f"Slowest projects (cold run, top {_SLOWEST_PROJECTS} per column):")
+    for name, data in report["columns"].items():
+        projects = sorted(data["projects"].items(), key=lambda item: item[1]["seconds"] or 0, reverse=True)
+        for _, stats in projects[:_SLOWEST_PROJECTS]:
+            if stats["seconds"] is None:
+                continue
+            lines.append(
+                f"  {name[:20]:<20} {stats['name'][:30]:<30} {stats['seconds']:>8.3f}s {stats['git_processes']:>4} Git processes",
+            )
+    if memory := report["peak_memory"]:
+        lines.append("")
+        line = f"Peak memory: {memory['self'] / 2**20:.1f} MiB (devboard)"
+        if memory["workers"] is not None:
+            line += f", {memory['workers'] / 2**20:.1f} MiB (largest worker)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def bench_board(board: str | Path | None = None, *, runs: int = 3, as_json: bool = False) -> int:
+    """Benchmark a board and print a report. See `benchmark_columns`.
+
+    Parameters:
+        board: The board name or path. By default, the configured board.
+        runs: The number of warm runs.
+        as_json: Whether to print the report as JSON, for comparison between runs.
+
+    Returns:
+        An exit code.
+    """
+    report = benchmark_columns(_load_board(board, _default_config_file()), runs=runs)
+    print(json.dumps(report, indent=2) if as_json else format_bench_report(report))  # noqa: T201
+    return 0
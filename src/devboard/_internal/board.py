@@ -1,45 +1,194 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import multiprocessing
 import os
+import subprocess
+import time
+from contextlib import contextmanager
 from functools import partial
 from multiprocessing import Pool
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from rich.markup import escape
+from rich.text import Text
 from textual import work
+from textual.binding import Binding
 from textual.containers import Container
 from textual.widgets import Static
+from textual.widgets.data_table import CellDoesNotExist, ColumnKey, RowKey
+from textual.worker import get_current_worker
 
 from devboard._internal.datatable import SelectableRow, SelectableRowsDataTable
+from devboard._internal.details import DetailsCache
+from devboard._internal.invalidation import ProjectsChanged
 from devboard._internal.modal import ModalMixin
 from devboard._internal.notifications import NotifyMixin
 from devboard._internal.projects import Project
+from devboard._internal.workers import (
+    _GRACE_DELAY,
+    _Failure,
+    _init_worker,
+    _picklable,
+    _populate_project,
+    _populate_task,
+    _receive,
+    _shared_pool,
+    _shared_scan,
+    _worker_memory,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
+    from multiprocessing.pool import IMapIterator
 
     from textual.app import ComposeResult
+    from textual.timer import Timer
+
+    from devboard._internal.daemon import DaemonClient
+    from devboard._internal.memo import RowsCache
+    from devboard._internal.notifications import BulkOperation
 
 _DEBUG = os.getenv("DEBUG", "0") == "1"
+_PROJECT_COLUMN = ColumnKey("project")
+_POLL_INTERVAL = 0.1
+"""Interval at which cancellation is checked while waiting for workers, in seconds."""
+_PREFETCH_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_OPTIONAL_LOCKS": "0"}
+"""Environment for prefetching commands. Optional locks are disabled so that
+commands like `git status` don't refresh the index, which would change project fingerprints."""
+
+
+class ErrorCell:
+    """A cell marking a row as an error row, shown instead of the rows of a project that could not be populated."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize the cell.
+
+        Parameters:
+            message: The error message.
+        """
+        self.message = message
+        """The error message."""
+
+    def __str__(self) -> str:
+        lines = self.message.strip().splitlines() or [""]
+        return f"⚠ {lines[0]}"
+
+    def __rich__(self) -> Text:
+        return Text(str(self), style="red", end="")
 
 
 class Row(SelectableRow):
-    """A Devboard row."""
+    """A Devboard row.
+
+    Subclass it to declare typed fields (see `SelectableRow`),
+    and set your subclass as `Column.ROW`.
+    """
+
+    __slots__ = ()
 
     @property
     def project(self) -> Project:
         """Devboard project."""
-        for val in self.data:
+        cells = self.table.get_row_cells(self.key)
+        if isinstance(project := cells.get(_PROJECT_COLUMN), Project):
+            return project
+        for val in cells.values():
             if isinstance(val, Project):
                 return val
         raise ValueError("No project in row data")
 
+    @property
+    def error(self) -> str | None:
+        """Error message, if this row is an error row (see `ErrorCell`)."""
+        for val in self.table.get_row_cells(self.key).values():
+            if isinstance(val, ErrorCell):
+                return val.message
+        return None
+
+
+def default_sort_key(value: Any) -> tuple[int, Any]:
+    """Default sort key for cell values: numbers first, by value, then anything else, by string."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    return (1, str(value))
+
 
 class DataTable(SelectableRowsDataTable):
-    """A Devboard data table."""
+    """A Devboard data table.
+
+    Sort keys of each row are computed once, when rows are added or updated,
+    and shown rows are kept sorted according to `sort_columns`.
+    """
 
     ROW = Row
     """The class to instantiate rows."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the table."""
+        super().__init__(*args, **kwargs)
+        self.sort_keys: dict[str, Callable[[Any], Any]] = {}
+        """Sort key functions, by column key. Other columns use `default_sort_key`."""
+        self.sort_columns: list[tuple[str, bool]] = []
+        """Columns to sort rows by, as column keys and whether to sort in descending order."""
+        self._row_sort_keys: dict[RowKey, dict[str, Any]] = {}
+
+    # --------------------------------------------------
+    # Textual methods.
+    # --------------------------------------------------
+    def update_cell(self, row_key: RowKey | str, column_key: ColumnKey | str, value: Any, **kwargs: Any) -> None:
+        """Update a cell, and re-sort rows if needed."""
+        super().update_cell(row_key, column_key, value, **kwargs)
+        column = column_key.value if isinstance(column_key, ColumnKey) else column_key
+        if any(sort_column == column for sort_column, _ in self.sort_columns):
+            self.apply_sort()
+
+    def remove_row(self, row_key: RowKey | str) -> None:
+        """Remove a row and its sort keys. Remaining rows stay sorted."""
+        super().remove_row(row_key)
+        self._row_sort_keys.pop(row_key, None)  # type: ignore[arg-type]
+
+    def clear(self, columns: bool = True) -> DataTable:  # noqa: FBT001,FBT002
+        """Clear rows and optionally columns."""
+        super().clear(columns)
+        self._row_sort_keys.clear()
+        return self
+
+    # --------------------------------------------------
+    # Additional methods/properties.
+    # --------------------------------------------------
+    def _index_row(self, row_key: RowKey) -> None:
+        super()._index_row(row_key)
+        self._row_sort_keys[row_key] = {
+            column.value: self.sort_keys.get(column.value, default_sort_key)(value)
+            for column, value in self.get_row_cells(row_key).items()
+            if column.value and column != "checkbox"
+        }
+
+    def _rows_added(self) -> None:
+        super()._rows_added()
+        self.apply_sort()
+
+    def filter(self, query: str) -> None:
+        """Only show rows fuzzy-matching the given query, keeping them sorted."""
+        super().filter(query)
+        self.apply_sort()
+
+    def apply_sort(self) -> None:
+        """Sort rows according to `sort_columns`, using precomputed sort keys.
+
+        Rows are sorted starting from their current order,
+        so re-sorting after a few changes is close to linear.
+        """
+        if not self.sort_columns or not self.rows:
+            return
+        row_keys = self._ordered_row_keys()
+        # Stable sorts, from the least to the most significant column.
+        for column, reverse in reversed(self.sort_columns):
+            row_keys.sort(key=lambda row_key: self._row_sort_keys[row_key][column], reverse=reverse)
+        self._set_row_order(row_keys)
+
 
 class Column(Container, ModalMixin, NotifyMixin):
     """A Devboard column."""
@@ -48,35 +197,207 @@ class Column(Container, ModalMixin, NotifyMixin):
     """The title of the column."""
     HEADERS: tuple[str, ...] = ()
     """The data table headers."""
+    ROW: type[Row] = Row
+    """The class to instantiate rows, possibly declaring typed fields."""
     THREADED: bool = True
     """Whether actions of this column should run in the background."""
+    DEPENDS_ON: ClassVar[frozenset[str] | None] = None
+    """Kinds of project data (see `ProjectsChanged`) the rows of this column depend on.
+
+    When data of these kinds changes for a project, the column updates this project's rows.
+    By default (`None`), the column depends on every kind of data.
+    """
+    DEPENDS_ON_OTHER_COLUMNS: bool = False
+    """Whether rows depend on other columns of the board, for example on their scan times (see `scan_durations`).
+
+    Such a column is only loaded once other columns are done loading, even when it is visible or focused.
+    """
+    TIMEOUT: float | None = 60.0
+    """Time budget to populate rows of a single project, in seconds. `None` to disable.
+
+    When a project takes longer, or when populating its rows fails,
+    an error row is shown for it instead, and other projects are unaffected.
+    Git commands still running for this project are terminated.
+    """
+    SHARED_MEMORY_THRESHOLD: int | None = None
+    """Size in bytes above which a project's rows are sent back from workers through shared memory.
+
+    By default (`None`), rows are always sent through the pool's pipes.
+    """
+    SORT: tuple[str, ...] = ()
+    """Headers to sort rows by, by order of priority. Prefix a header with `-` to sort in descending order.
+
+    By default, rows are sorted by the first header.
+    """
+    SORT_KEYS: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+    """Sort key functions, by header. Keys are computed once per cell. Other headers use `default_sort_key`."""
+    PREFETCH: ClassVar[tuple[str, ...]] = ()
+    """Details (see `details_command`) to prefetch in the background when the cursor rests on a row.
+
+    Prefetched details are cached against the fingerprint returned by `details_fingerprint`.
+    By default, it ignores the working tree: override it to prefetch details depending on it (status, diff).
+    """
+    PREFETCH_DELAY: float = 0.3
+    """Time the cursor must rest on a row before its details are prefetched, in seconds."""
+    DETAILS_TTL: float = 10.0
+    """Maximum age of cached details, in seconds.
+
+    Cached details are also discarded as soon as their fingerprint changes (see `details_fingerprint`).
+    """
     DEFAULT_CLASSES = "box"
     """Textual CSS classes."""
 
+    details_cache: ClassVar[DetailsCache] = DetailsCache()
+    """Cache of row details, shared by all columns."""
+    scan_durations: ClassVar[dict[Project, dict[str, float]]] = {}
+    """Durations of the last scans of projects, in seconds, by project and column class name, shared by all columns.
+
+    Projects served from a cache (see `memoize_rows`) keep the duration of their last actual scan.
+    """
+    daemon: DaemonClient | None = None
+    """Client of a daemon serving rows of this board (see `BoardDaemon`), set by the application.
+
+    When set, rows are requested from the daemon instead of being computed locally.
+    """
+    _prefetch_timer: Timer | None = None
+
+    BINDINGS: ClassVar = [
+        Binding("o", "cycle_sort", "Sort by next header", show=False),
+        Binding("minus", "reverse_sort", "Reverse sort", show=False),
+        Binding("r", "refresh_column", "Refresh column", show=False),
+        Binding("R", "refresh_project", "Refresh project", show=False),
+    ]
+    """Key bindings for sorting rows and refreshing."""
+
     # --------------------------------------------------
     # Textual methods.
     # --------------------------------------------------
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the column."""
+        super().__init__(*args, **kwargs)
+        self._update_pending = False
+        self._updating_projects: set[Project] = set()
+        self._pending_projects: set[Project] = set()
+        self._listed_projects: set[Project] | None = None
+        self._generation = 0
+        self._loaded = False
+        self._deferred = False
+
     def compose(self) -> ComposeResult:
         """Compose column widgets."""
         yield Static("▶ " + self.TITLE, classes="column-title")
-        yield DataTable(id="table")
+        table = DataTable(id="table")
+        table.ROW = self.ROW
+        yield table
 
     def on_mount(self) -> None:
-        """Fill data table."""
-        self.update()
+        """Fill data table, once the layout tells which columns are visible."""
+        self.call_after_refresh(self.update)
+
+    def on_descendant_focus(self) -> None:
+        """Load the column now if it was deferred."""
+        if self._deferred:
+            self.update()
+
+    def on_resize(self) -> None:
+        """Load the column now if it was deferred and became visible."""
+        if self._deferred and self._is_visible():
+            self.update()
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Prefetch details of the highlighted row once the cursor rests on it."""
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+        if self.PREFETCH:
+            self._prefetch_timer = self.set_timer(self.PREFETCH_DELAY, partial(self._prefetch, event.row_key))
 
     # --------------------------------------------------
     # Binding actions.
     # --------------------------------------------------
     def action_apply(self, action: str = "default") -> None:
-        """Apply an action to selected rows."""
+        """Apply an action to selected rows. Error rows are skipped.
+
+        When applied to several rows, the action is reported as a bulk operation
+        (see [`start_operation`][devboard.NotifyMixin.start_operation]).
+        """
         selected_rows = list(self.table.selected_rows) or [self.table.current_row]
-        if self.THREADED:
-            for row in selected_rows:
-                self.run_worker(partial(self.apply, action=action, row=row), thread=True)  # type: ignore[arg-type]
+        operation = None
+        if len(selected_rows) > 1:
+            title = f"{'Apply' if action == 'default' else action.capitalize()} ({self.TITLE or type(self).__name__})"
+            operation = self.start_operation(title, len(selected_rows))
+        for row in selected_rows:
+            if error := row.error:  # type: ignore[attr-defined]
+                message = f"Skipped [i]{row.project}[/]: {escape(error)}"  # type: ignore[attr-defined]
+                if operation is None:
+                    self.notify_warning(message)
+                else:
+                    operation.skip(message)
+        selected_rows = [row for row in selected_rows if not row.error]  # type: ignore[attr-defined]
+        for row in selected_rows:
+            apply = partial(self._apply, operation, action, row)  # type: ignore[arg-type]
+            if self.THREADED:
+                self.run_worker(apply, thread=True)
+            else:
+                apply()
+
+    def _apply(self, operation: BulkOperation | None, action: str, row: Row) -> None:
+        if operation is None:
+            self.apply(action=action, row=row)
+            return
+        with operation.item():
+            self.apply(action=action, row=row)
+
+    def action_details(self, action: str) -> None:
+        """Show details of the current row in a pager, instantly if they were prefetched."""
+        row: Row = self.table.current_row  # type: ignore[assignment]
+        if error := row.error:
+            self.notify_warning(f"[i]{row.project}[/]: {escape(error)}")
+            return
+        if (command := self.details_command(action, row)) is None:
+            raise ValueError(f"Unknown details '{action}'")
+        project = row.project
+        title = f"{project} {action}"
+        cached = self.details_cache.get(self._details_key(action, row), self.details_fingerprint(row), self.DETAILS_TTL)
+        if cached is not None:
+            self.pager(output=cached, title=title)
         else:
-            for row in selected_rows:
-                self.apply(action=action, row=row)  # type: ignore[arg-type]
+            self.pager(command, cwd=project.path, title=title)
+
+    def action_refresh_column(self) -> None:
+        """Refresh this column."""
+        self.update()
+
+    def action_refresh_project(self) -> None:
+        """Refresh the project of the current row, in all columns."""
+        try:
+            row: Row = self.table.current_row  # type: ignore[assignment]
+        except CellDoesNotExist:
+            return
+        self.app.refresh_project(row.project)  # type: ignore[attr-defined]
+
+    def action_sort(self, *headers: str) -> None:
+        """Sort rows by the given headers, by order of priority. Prefix a header with `-` to sort in descending order."""
+        self.table.sort_columns = [(header.lstrip("-").lower(), header.startswith("-")) for header in headers]
+        self.table.apply_sort()
+
+    def action_cycle_sort(self) -> None:
+        """Sort rows by the next header, keeping previous sort columns as secondary ones."""
+        columns = [header.lower() for header in self.HEADERS]
+        if not columns:
+            return
+        sort_columns = self.table.sort_columns
+        current = columns.index(sort_columns[0][0]) if sort_columns and sort_columns[0][0] in columns else -1
+        column = columns[(current + 1) % len(columns)]
+        self.table.sort_columns = [(column, False), *(item for item in sort_columns if item[0] != column)]
+        self.table.apply_sort()
+
+    def action_reverse_sort(self) -> None:
+        """Reverse the sort order of the main sort column."""
+        if sort_columns := self.table.sort_columns:
+            column, reverse = sort_columns[0]
+            self.table.sort_columns = [(column, not reverse), *sort_columns[1:]]
+            self.table.apply_sort()
 
     # --------------------------------------------------
     # Additional methods/properties.
@@ -87,41 +408,426 @@ class Column(Container, ModalMixin, NotifyMixin):
         return self.query_one("#table")  # type: ignore[return-value]
 
     def update(self) -> None:
-        """Update the column (recompute data)."""
-        table = self.query_one(DataTable)
+        """Update the column (recompute data).
+
+        If the column is still loading, the update is coalesced with other requests
+        and runs once the current one is finished.
+
+        Visible and focused columns are updated immediately. Other columns
+        (off-screen, or collapsed because they had no rows) are deferred until
+        they get the focus, become visible, or other columns are done loading:
+        they are then updated one after the other, in the background.
+        Columns depending on other columns (see `DEPENDS_ON_OTHER_COLUMNS`)
+        are always deferred until other columns are done loading.
+        """
+        table = self.table
         if table.loading:
+            self._update_pending = True
             return
+        shown = self.has_focus_within or self._is_visible()
+        if (self.DEPENDS_ON_OTHER_COLUMNS or not shown) and self._columns_loading():
+            self._deferred = True
+            return
+        self._deferred = False
+        self._update_pending = False
+        # Rows of projects being updated are computed again anyway: drop them.
+        self.workers.cancel_group(self, "populate_projects")
+        self._generation += 1
+        self._updating_projects.clear()
+        self._pending_projects.clear()
         table.loading = True
         table.clear(columns=True)
         table.cursor_type = "row"
-        self._load_data(table)
+        if inspect.iscoroutinefunction(self.populate_rows):
+            self._load_data_async(table)
+        else:
+            self._load_data(table)
+
+    def update_project(self, project: Project) -> None:
+        """Update the rows of a single project.
+
+        See `update_projects`.
+
+        Parameters:
+            project: The project to update.
+        """
+        self.update_projects([project])
+
+    def update_projects(self, projects: Iterable[Project]) -> None:
+        """Update the rows of some projects, all at once.
+
+        The projects' rows are removed, and new ones are computed and added
+        for projects listed by `list_projects` during the last full update. Requests are coalesced:
+        if the column or a project is still loading, its update runs once it's finished.
+        A full update (see `update`) drops ongoing updates of projects.
+
+        Parameters:
+            projects: The projects to update.
+        """
+        if self._deferred:
+            # The whole column will be loaded anyway.
+            return
+        to_update = set()
+        for project in projects:
+            if self.table.loading or project in self._updating_projects:
+                self._pending_projects.add(project)
+            else:
+                to_update.add(project)
+        if not to_update:
+            return
+        self._updating_projects |= to_update
+        if inspect.iscoroutinefunction(self.populate_rows):
+            self._load_projects_async(to_update, self._generation)
+        else:
+            self._load_projects(to_update, self._generation)
+
+    def depends_on(self, kinds: Iterable[str]) -> bool:
+        """Tell whether rows of this column depend on any of the given kinds of data.
+
+        Parameters:
+            kinds: Kinds of project data (see `ProjectsChanged`).
+
+        Returns:
+            Whether the column depends on these kinds.
+        """
+        return self.DEPENDS_ON is None or not self.DEPENDS_ON.isdisjoint(kinds)
+
+    def invalidate(self, *projects: Project, kinds: Iterable[str]) -> None:
+        """Notify all columns that data of projects changed, for example after an action.
+
+        Columns depending on these kinds of data then update the projects' rows.
+        This method can be called from any thread.
 
-    @work(thread=True)
+        Parameters:
+            *projects: The projects that changed.
+            kinds: The kinds of data that changed (see `ProjectsChanged`).
+        """
+        self.app.post_message(ProjectsChanged(projects, kinds))
+
+    def cancel(self) -> None:
+        """Cancel ongoing work populating rows, terminating worker processes and Git commands."""
+        self.workers.cancel_group(self, "populate")
+        self.workers.cancel_group(self, "populate_projects")
+        self._generation += 1
+        self._update_pending = False
+        self._deferred = False
+        self._updating_projects.clear()
+        self._pending_projects.clear()
+        self.table.loading = False
+
+    @work(thread=True, group="populate")
     def _load_data(self, table: DataTable) -> None:
-        if rows := self._populate():
-            # TODO: Reset styles.
+        worker = get_current_worker()
+        rows = self._populate(lambda: worker.is_cancelled)
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._fill_table, table, rows)
+
+    @work(group="populate")
+    async def _load_data_async(self, table: DataTable) -> None:
+        self._fill_table(table, await self._populate_async())
+
+    @work(thread=True, group="populate_projects")
+    def _load_projects(self, projects: set[Project], generation: int) -> None:
+        worker = get_current_worker()
+        listed = self._listed(projects)
+        rows = self._populate(lambda: worker.is_cancelled, listed) if listed else []
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._replace_projects_rows, projects, rows, generation)
+
+    @work(group="populate_projects")
+    async def _load_projects_async(self, projects: set[Project], generation: int) -> None:
+        listed = await asyncio.to_thread(self._listed, projects)
+        self._replace_projects_rows(projects, await self._populate_async(listed) if listed else [], generation)
+
+    def _listed(self, projects: set[Project]) -> list[Project]:
+        # Projects listed by the last full update, so that updating a few projects doesn't list
+        # all of them again. Projects which are not listed anymore are removed by the next full update.
+        if self._listed_projects is None:
+            return [project for project in self.list_projects() if project in projects]
+        return [project for project in projects if project in self._listed_projects]
+
+    def _fill_table(self, table: DataTable, rows: list[tuple[Any, ...]]) -> None:
+        self._loaded = True
+        if rows:
+            self._add_rows(table, rows)
+        else:
+            self._collapse(collapsed=True)
+        table.loading = False
+        if self._update_pending:
+            self.update()
+            return
+        pending, self._pending_projects = self._pending_projects, set()
+        if pending:
+            self.update_projects(pending)
+        self._update_deferred_column()
+
+    def _is_visible(self) -> bool:
+        # Collapsed columns are not considered visible: they had no rows last time.
+        return self.table.display and self.screen.region.overlaps(self.region)
+
+    def _columns_loading(self) -> bool:
+        # Columns depending on other columns also wait for those which were not loaded yet,
+        # since they might not have started loading (mounted after this one) or be deferred.
+        for column in self.screen.query(Column):
+            if column is self:
+                continue
+            if column.table.loading:
+                return True
+            if self.DEPENDS_ON_OTHER_COLUMNS and not (column.DEPENDS_ON_OTHER_COLUMNS or column._loaded):
+                return True
+        return False
+
+    def _update_deferred_column(self) -> None:
+        # Update the next deferred column, if other columns are done loading.
+        # Columns depending on other columns come last.
+        if self._columns_loading():
+            return
+        deferred = [column for column in self.screen.query(Column) if column._deferred]
+        if deferred:
+            min(deferred, key=lambda column: column.DEPENDS_ON_OTHER_COLUMNS).update()
+
+    def _replace_projects_rows(self, projects: set[Project], rows: list[tuple[Any, ...]], generation: int) -> None:
+        if generation != self._generation:
+            # Computed before a full update or a cancellation: rows are stale.
+            return
+        table = self.table
+        for row_key in [
+            key
+            for key in table.all_row_keys
+            if any(isinstance(value, Project) and value in projects for value in table.get_row_cells(key).values())
+        ]:
+            table.batch_remove_row(row_key)
+        if rows:
+            self._add_rows(table, rows)
+        else:
+            table.flush_batch()
+            if not table.all_row_keys:
+                self._collapse(collapsed=True)
+        self._updating_projects -= projects
+        if pending := self._pending_projects & projects:
+            self._pending_projects -= pending
+            self.update_projects(pending)
+
+    def _add_rows(self, table: DataTable, rows: list[tuple[Any, ...]]) -> None:
+        self._collapse(collapsed=False)
+        if len(table.columns) == 1:
             for column in self.HEADERS:
                 table.add_column(column, key=column.lower())
-            table.add_rows(rows)
-            table.sort(self.HEADERS[0].lower())
-            table.refresh(layout=True)
-        else:
-            title: Static = self.query_one(".column-title")  # type: ignore[assignment]
+            table.sort_keys = {header.lower(): key for header, key in self.SORT_KEYS.items()}
+            if not table.sort_columns:
+                sort = self.SORT or self.HEADERS[:1]
+                table.sort_columns = [(header.lstrip("-").lower(), header.startswith("-")) for header in sort]
+        # Removals, updates and additions are applied together, with a single sort and filter pass.
+        table.batch_add_rows(rows)
+        table.flush_batch()
+
+    def _collapse(self, *, collapsed: bool) -> None:
+        # Columns without rows are collapsed to save space.
+        title: Static = self.query_one(".column-title")  # type: ignore[assignment]
+        if collapsed:
             self.styles.width = 3
             title.styles.text_style = "bold"
-            title.renderable = "▼ " + self.TITLE  # type: ignore[attr-defined]
+            title.update("▼ " + self.TITLE)
             self.table.styles.display = "none"
-        table.loading = False
+        else:
+            self.styles.width = None
+            title.styles.text_style = None
+            title.update("▶ " + self.TITLE)
+            self.table.styles.display = "block"
 
-    def _populate(self) -> list[tuple[Any, ...]]:
-        rows = []
+    def _error_row(self, project: Project, message: str) -> tuple[Any, ...]:
+        cells = [project, ErrorCell(message), *([""] * (len(self.HEADERS) - 2))]
+        return tuple(cells[: max(len(self.HEADERS), 1)])
+
+    def _populate(
+        self,
+        is_cancelled: Callable[[], bool] | None = None,
+        projects: list[Project] | None = None,
+    ) -> list[tuple[Any, ...]]:
+        if (rows := self._populate_from_daemon(projects, is_cancelled)) is not None:
+            return rows
+        if projects is None:
+            projects = list(self.list_projects())
+            self._listed_projects = set(projects)
         if _DEBUG:
-            for project in self.list_projects():
-                rows.extend(self.populate_rows(project))
-        else:
-            with Pool() as pool:
-                for result in pool.map(self.populate_rows, self.list_projects()):
-                    rows.extend(result)
+            rows = []
+            for project in projects:
+                start = time.perf_counter()
+                try:
+                    rows.extend(self.populate_rows(project))
+                except Exception as error:  # noqa: BLE001
+                    rows.append(self._error_row(project, str(error)))
+                self._record_scan(project, time.perf_counter() - start)
+            return rows
+        populate_rows = self.populate_rows
+        results: list[list[tuple[Any, ...]] | None] = [None] * len(projects)
+        cache: RowsCache | None = getattr(populate_rows, "rows_cache", None)
+        if cache is not None:
+            # Only send projects that changed to workers, running the undecorated function.
+            fingerprints = [cache.fingerprint(project) for project in projects]
+            results = [cache.get(project, fingerprint) for project, fingerprint in zip(projects, fingerprints)]
+        if missing := [index for index, result in enumerate(results) if result is None]:
+            with self._worker_results(populate_rows, projects, missing) as iterator:
+                last_result = time.monotonic()
+                while True:
+                    if is_cancelled is not None and is_cancelled():
+                        return []
+                    try:
+                        index, payload, duration, memory = iterator.next(timeout=_POLL_INTERVAL)
+                    except StopIteration:
+                        break
+                    except multiprocessing.TimeoutError:
+                        # Workers enforce time budgets themselves, and exit when they are stuck
+                        # (the pool replaces them): stop waiting for results that will never come.
+                        if self.TIMEOUT is not None and time.monotonic() - last_result > self.TIMEOUT + _GRACE_DELAY:
+                            break
+                        continue
+                    last_result = time.monotonic()
+                    if memory is not None:
+                        _worker_memory[memory[0]] = memory[1]
+                    self._record_scan(projects[index], duration)
+                    if isinstance(payload, _Failure):
+                        results[index] = [self._error_row(projects[index], payload.message)]
+                        continue
+                    results[index] = _receive(payload, projects[index])
+                    if cache is not None:
+                        cache.set(projects[index], fingerprints[index], results[index])
+            for index, result in enumerate(results):
+                if result is None:
+                    self._record_scan(projects[index], self.TIMEOUT or 0.0)
+                    results[index] = [self._error_row(projects[index], f"timed out after {self.TIMEOUT:g}s")]
+        return [row for result in results for row in result]  # type: ignore[union-attr]
+
+    @contextmanager
+    def _worker_results(
+        self,
+        populate_rows: Callable[[Project], list[tuple[Any, ...]]],
+        projects: list[Project],
+        indices: list[int],
+    ) -> Iterator[IMapIterator]:
+        # Yield an iterator on results of workers populating the projects at the given indices.
+        if _picklable(populate_rows):
+            # Long-lived workers, shared by columns and refreshes. Cancelled tasks run to completion
+            # (within their time budget), and stuck workers are replaced without affecting other scans.
+            scan = _shared_scan(projects, populate_rows, self.SHARED_MEMORY_THRESHOLD, self.TIMEOUT)
+            with scan as (name, size), _shared_pool() as pool:
+                yield pool.imap_unordered(_populate_task, [(name, size, index) for index in indices])
+            return
+        # Functions that can't be pickled (closures, bound methods) are inherited by workers forked for this scan.
+        if hasattr(populate_rows, "rows_cache"):
+            populate_rows = populate_rows.__wrapped__  # type: ignore[attr-defined]
+        initargs = (populate_rows, projects, self.SHARED_MEMORY_THRESHOLD, self.TIMEOUT)
+        # Leaving the context terminates workers, along with their Git subprocesses.
+        processes = min(len(indices), os.cpu_count() or 1)
+        with Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+            yield pool.imap_unordered(_populate_project, indices)
+
+    def _record_scan(self, project: Project, duration: float) -> None:
+        self.scan_durations.setdefault(project, {})[type(self).__qualname__] = duration
+
+    def _details_key(self, action: str, row: Row) -> tuple[Any, ...]:
+        return (type(self).__qualname__, action, *map(str, row.data))
+
+    def _prefetch(self, row_key: RowKey) -> None:
+        self._prefetch_timer = None
+        table = self.table
+        if row_key not in table.rows:
+            return
+        row: Row = table.get_selectable_row(row_key)  # type: ignore[assignment]
+        if row.error:
+            return
+        jobs = [
+            (self._details_key(action, row), command)
+            for action in self.PREFETCH
+            if (command := self.details_command(action, row)) is not None
+        ]
+        if jobs:
+            self._prefetch_details(row, jobs)
+
+    @work(thread=True, exclusive=True, group="prefetch", exit_on_error=False)
+    def _prefetch_details(self, row: Row, jobs: list[tuple[tuple[Any, ...], list[str]]]) -> None:
+        worker = get_current_worker()
+        project = row.project
+        # The fingerprint is computed before running commands:
+        # if the project changes meanwhile, cached details are simply never used.
+        fingerprint = self.details_fingerprint(row)
+        for key, command in jobs:
+            if worker.is_cancelled:
+                return
+            if self.details_cache.get(key, fingerprint, self.DETAILS_TTL) is not None:
+                continue
+            try:
+                process = subprocess.run(  # noqa: S603
+                    command,
+                    cwd=project.path,
+                    env=_PREFETCH_ENV,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    check=False,
+                    timeout=self.TIMEOUT,
+                )
+            except subprocess.TimeoutExpired:
+                # Details are computed again when shown.
+                continue
+            self.details_cache.set(key, fingerprint, process.stdout)
+
+    def _populate_from_daemon(
+        self,
+        projects: list[Project] | None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> list[tuple[Any, ...]] | None:
+        # Rows the daemon keeps in memory are served on first load;
+        # later updates (refreshes, invalidations) ask the daemon to recompute them.
+        if self.daemon is None:
+            return None
+        deadline = None if self.TIMEOUT is None else time.monotonic() + self.TIMEOUT + _GRACE_DELAY
+        try:
+            future = self.daemon._request_rows(type(self).__qualname__, projects, refresh=self._loaded)
+            while True:
+                if is_cancelled is not None and is_cancelled():
+                    return []
+                try:
+                    return self.daemon._result(future, _POLL_INTERVAL)
+                except TimeoutError:
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise
+        except TimeoutError:
+            # The daemon is busy or stuck: compute rows locally this time.
+            return None
+        except ConnectionError:
+            # The daemon stopped: compute rows locally from now on.
+            self.daemon = None
+        except RuntimeError:
+            pass
+        return None
+
+    async def _populate_async(self, projects: list[Project] | None = None) -> list[tuple[Any, ...]]:
+        if self.daemon is not None:
+            rows = await asyncio.to_thread(self._populate_from_daemon, projects)
+            if rows is not None:
+                return rows
+        if projects is None:
+            # Listing projects may hit the file-system a lot: don't block the event loop.
+            projects = await asyncio.to_thread(list, self.list_projects())
+            self._listed_projects = set(projects)
+        populate_rows: Callable[[Project], Awaitable[list[tuple[Any, ...]]]] = self.populate_rows  # type: ignore[assignment]
+
+        async def populate(project: Project) -> list[tuple[Any, ...]]:
+            # Timeouts cancel the coroutine, and `run_git` kills its Git process on cancellation.
+            start = time.perf_counter()
+            try:
+                return await asyncio.wait_for(populate_rows(project), self.TIMEOUT)
+            except asyncio.TimeoutError:
+                return [self._error_row(project, f"timed out after {self.TIMEOUT:g}s")]
+            except Exception as error:  # noqa: BLE001
+                return [self._error_row(project, str(error))]
+            finally:
+                self._record_scan(project, time.perf_counter() - start)
+
+        rows = []
+        for result in await asyncio.gather(*(populate(project) for project in projects)):
+            rows.extend(result)
         return rows
 
     # --------------------------------------------------
@@ -133,9 +839,43 @@ class Column(Container, ModalMixin, NotifyMixin):
 
     @staticmethod
     def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # noqa: ARG004
-        """Populate rows for this column."""
+        """Populate rows for this column.
+
+        When running in a pool of processes, occurrences of the given project
+        in the returned rows are sent back to the main process as a lightweight
+        reference, and other values are pickled. Prefer simple values
+        like strings and integers over objects such as GitPython's.
+
+        Decorate it with `memoize_rows` to compute rows again
+        only for projects whose Git state changed.
+
+        This method can also be implemented as a coroutine function
+        (`async def`), in which case it runs concurrently for all projects
+        in Textual's event loop instead of in a pool of processes.
+        Use the asynchronous methods of `Project` (like `Project.unpushed_async`)
+        or `run_git` to avoid blocking the event loop.
+        """
         return []
 
     def apply(self, action: str, row: Row) -> None:  # noqa: ARG002
         """Apply action on given row."""
         return
+
+    def details_fingerprint(self, row: Row) -> Any:
+        """Return a fingerprint of the state details of a row depend on. Cached details are only shown while it matches.
+
+        By default, it is the project fingerprint (see `Project.fingerprint`), computed without spawning Git,
+        which ignores the working tree. Columns showing uncommitted changes can return `Project.dirty_fingerprint`.
+        It is also computed in the UI thread when showing details: it must be cheaper than the details.
+        """
+        return row.project.fingerprint
+
+    def details_command(self, action: str, row: Row) -> list[str] | None:  # noqa: ARG002
+        """Return the command showing the given details of a row, or `None` if unknown.
+
+        Details are shown in a pager by binding keys to `details('<action>')`.
+        Details listed in `PREFETCH` are computed in the background
+        when the cursor rests on a row, so that showing them is instant.
+        Commands run in the row's project directory.
+        """
+        return None
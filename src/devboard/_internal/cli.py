@@ -19,6 +19,9 @@ from appdirs import user_config_dir
 
 from devboard._internal import debug
 from devboard._internal.app import Devboard
+from devboard._internal.bench import bench_board
+from devboard._internal.daemon import connect_daemon, serve_board
+from devboard._internal.metrics import export_metrics
 
 
 class _DebugInfo(argparse.Action):
@@ -40,6 +43,43 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--show-config-dir", action="store_true", help="Show Devboard's configuration directory.")
     parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {debug._get_version()}")
     parser.add_argument("--debug-info", action=_DebugInfo, help="Print debug information.")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a daemon keeping the board's rows up-to-date, served to devboard instances.",
+    )
+    parser.add_argument("--no-daemon", action="store_true", help="Compute rows locally even if a daemon is running.")
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="Export board metrics in the OpenMetrics format on http://localhost:PORT/metrics.",
+    )
+    parser.add_argument(
+        "--metrics-textfile",
+        metavar="FILE",
+        help="Export board metrics in the OpenMetrics format to FILE, for textfile collectors.",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="Interval between scans when exporting metrics. Default: 60.",
+    )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Time the board's columns without the interface, cold then warm, and print a report.",
+    )
+    parser.add_argument(
+        "--bench-runs",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Number of warm runs when benchmarking. Default: 3.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the benchmark report as JSON.")
     parser.add_argument("board", nargs="?", default=None, help="Board name or path.")
     return parser
 
@@ -60,6 +100,20 @@ def main(args: list[str] | None = None) -> int:
     if opts.show_config_dir:
         print(user_config_dir(appname="devboard"))
         return 0
-    app = Devboard(board=opts.board)
+    if opts.serve:
+        return serve_board(opts.board)
+    if opts.bench:
+        return bench_board(opts.board, runs=opts.bench_runs, as_json=opts.json)
+    if opts.metrics_port is not None or opts.metrics_textfile is not None:
+        return export_metrics(
+            opts.board,
+            port=opts.metrics_port,
+            textfile=opts.metrics_textfile,
+            interval=opts.metrics_interval,
+        )
+    daemon = None if opts.no_daemon else connect_daemon(opts.board)
+    app = Devboard(board=opts.board, daemon=daemon)
     app.run()
+    if daemon is not None:
+        daemon.close()
     return 0
@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import socket
+import struct
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from itertools import count
+from pathlib import Path
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from appdirs import user_cache_dir
+
+from devboard._internal.board import Column
+from devboard._internal.projects import Project
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    _Rows = list[tuple[Any, ...]]
+
+_HEADER = struct.Struct("!I")
+"""Header of messages: the size of the pickled message that follows."""
+_logger = logging.getLogger(__name__)
+
+
+def _socket_path(board: str | Path | None) -> Path:
+    # One daemon per board file: the configured board (`None`), its name and its path resolve to the same one.
+    # Hash the board file path to get a short, safe file name (socket paths are limited to about a hundred characters).
+    # Imported here since the application module imports this one.
+    from devboard._internal.app import _board_file, _default_config_file  # noqa: PLC0415
+
+    # Unknown boards are kept as is: no daemon can serve them.
+    with contextlib.suppress(ValueError):
+        board = _board_file(board, _default_config_file()).resolve()
+    digest = hashlib.sha256(str(board or "").encode()).hexdigest()[:16]
+    return Path(user_cache_dir("devboard"), f"daemon-{digest}.sock")
+
+
+def _pack(message: dict[str, Any]) -> bytes:
+    data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(data)) + data
+
+
+async def _read_message(reader: asyncio.StreamReader) -> dict[str, Any]:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return pickle.loads(await reader.readexactly(size))  # noqa: S301
+
+
+def _read_message_sync(file: BinaryIO) -> dict[str, Any] | None:
+    header = file.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (size,) = _HEADER.unpack(header)
+    data = file.read(size)
+    if len(data) < size:
+        return None
+    return pickle.loads(data)  # noqa: S301
+
+
+def _row_project(row: tuple[Any, ...]) -> Project | None:
+    for value in row:
+        if isinstance(value, Project):
+            return value
+    return None
+
+
+def _fingerprint(project: Project) -> Any:
+    try:
+        return project.fingerprint
+    except (OSError, ValueError):
+        # Not a repository (anymore).
+        return None
+
+
+class BoardDaemon:
+    """A daemon populating the columns of a board, serving rows to clients over a Unix socket.
+
+    Rows are computed once, kept in memory along with the caches of columns
+    (see `memoize_rows`), and served instantly to any number of clients,
+    typically several `devboard` interfaces (see `DaemonClient`).
+
+    The daemon watches projects: every `poll_interval` seconds, projects whose
+    fingerprint changed (see `Project.fingerprint`) are updated in all columns,
+    and every `full_refresh_interval` seconds, all projects are updated,
+    to account for changes in working trees. Updated rows are pushed to clients.
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[Column | type[Column]],
+        *,
+        poll_interval: float = 2.0,
+        full_refresh_interval: float = 60.0,
+    ) -> None:
+        """Initialize the daemon.
+
+        Parameters:
+            columns: The columns of the board, as instances or classes.
+            poll_interval: Interval between checks of project fingerprints, in seconds.
+            full_refresh_interval: Interval between updates of all projects, in seconds.
+        """
+        instances = [column if isinstance(column, Column) else column() for column in columns]
+        self.columns: dict[str, Column] = {type(column).__qualname__: column for column in instances}
+        """The columns of the board, by class name."""
+        self.poll_interval = poll_interval
+        """Interval between checks of project fingerprints, in seconds."""
+        self.full_refresh_interval = full_refresh_interval
+        """Interval between updates of all projects, in seconds."""
+        self._rows: dict[str, dict[Project | None, _Rows]] = {name: {} for name in self.columns}
+        self._fingerprints: dict[Project, Any] = {}
+        self._subscribers: set[asyncio.StreamWriter] = set()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def serve(self, path: str | Path) -> None:
+        """Populate all columns, then serve rows on a Unix socket until cancelled.
+
+        Parameters:
+            path: The path of the socket.
+        """
+        self._locks = {name: asyncio.Lock() for name in self.columns}
+        self._fingerprints = await asyncio.to_thread(self._compute_fingerprints)
+        await asyncio.gather(*(self._update(name, None) for name in self.columns))
+        path = Path(path)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+        # Requests are unpickled: only the current user must be able to connect, from the moment the socket exists.
+        umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(self._handle_client, path=str(path))
+        finally:
+            os.umask(umask)
+        try:
+            async with server:
+                await asyncio.gather(server.serve_forever(), self._watch())
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+
+    def _compute_fingerprints(self) -> dict[Project, Any]:
+        projects: set[Project] = set()
+        for column in self.columns.values():
+            projects.update(column.list_projects())
+        return {project: _fingerprint(project) for project in projects}
+
+    async def _populate(self, name: str, projects: list[Project] | None) -> _Rows:
+        column = self.columns[name]
+        if inspect.iscoroutinefunction(column.populate_rows):
+            return await column._populate_async(projects)
+        return await asyncio.to_thread(column._populate, None, projects)
+
+    async def _update(self, name: str, projects: set[Project] | None) -> set[Project | None]:
+        # Recompute rows of the given projects (all if none), returning projects whose rows changed.
+        async with self._locks[name]:
+            rows = await self._populate(name, None if projects is None else sorted(projects))
+            grouped: dict[Project | None, _Rows] = {}
+            for row in rows:
+                grouped.setdefault(_row_project(row), []).append(row)
+            cached = self._rows[name]
+            if projects is None:
+                changed = {project for project in {*cached, *grouped} if cached.get(project) != grouped.get(project)}
+                self._rows[name] = grouped
+            else:
+                changed = {project for project in projects if cached.get(project) != grouped.get(project)}
+                for project in projects:
+                    cached.pop(project, None)
+                cached.update(grouped)
+            return changed
+
+    def _column_rows(self, name: str, projects: Iterable[Project | None] | None = None) -> _Rows:
+        cached = self._rows[name]
+        keys = cached if projects is None else projects
+        return [row for project in keys for row in cached.get(project, [])]
+
+    def _broadcast(self, name: str, projects: set[Project | None], source: asyncio.StreamWriter | None = None) -> None:
+        if not projects:
+            return
+        message = _pack(
+            {
+                "op": "changed",
+                "column": name,
+                "projects": [project for project in projects if project is not None],
+                "rows": self._column_rows(name, projects),
+            },
+        )
+        for writer in self._subscribers:
+            if writer is not source:
+                writer.write(message)
+
+    async def _watch(self) -> None:
+        last_full_refresh = time.monotonic()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                last_full_refresh = await self._watch_once(last_full_refresh)
+            except Exception:
+                # Listing projects, fingerprinting them or populating rows failed: try again at the next iteration.
+                _logger.exception("Failed to update rows")
+
+    async def _watch_once(self, last_full_refresh: float) -> float:
+        # Update rows of changed projects (or all of them, periodically), returning the time of the last full refresh.
+        fingerprints = await asyncio.to_thread(self._compute_fingerprints)
+        if time.monotonic() - last_full_refresh > self.full_refresh_interval:
+            last_full_refresh = time.monotonic()
+            projects = set(fingerprints) | set(self._fingerprints)
+        else:
+            projects = {
+                project
+                for project in set(fingerprints) | set(self._fingerprints)
+                if fingerprints.get(project) != self._fingerprints.get(project)
+            }
+        self._fingerprints = fingerprints
+        if projects:
+            for name in self.columns:
+                self._broadcast(name, await self._update(name, projects))
+        return last_full_refresh
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = set()
+        try:
+            while True:
+                request = await _read_message(reader)
+                if request["op"] == "subscribe":
+                    self._subscribers.add(writer)
+                elif request["op"] == "rows":
+                    # Answer concurrently: clients may load several columns at once.
+                    task = asyncio.create_task(self._answer_rows(writer, request))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._subscribers.discard(writer)
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _answer_rows(self, writer: asyncio.StreamWriter, request: dict[str, Any]) -> None:
+        name = request["column"]
+        projects = request["projects"]
+        try:
+            if name not in self.columns:
+                raise KeyError(f"Unknown column '{name}'")  # noqa: TRY301
+            if request["refresh"]:
+                changed = await self._update(name, None if projects is None else set(projects))
+                self._broadcast(name, changed, source=writer)
+            response = {"id": request["id"], "rows": self._column_rows(name, projects)}
+        except Exception as error:  # noqa: BLE001
+            response = {"id": request["id"], "error": f"{error.__class__.__name__}: {error}"}
+        writer.write(_pack(response))
+        await writer.drain()
+
+
+class DaemonClient:
+    """A client of a `BoardDaemon`, usable from any thread."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Connect to a daemon.
+
+        Parameters:
+            path: The path of the daemon's socket.
+
+        Raises:
+            OSError: When the daemon is not running.
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(str(path))
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile("rb")
+        self._send_lock = Lock()
+        self._ids = count()
+        self._pending: dict[int, Future] = {}
+        self._on_change: Callable[[str, list[Project], _Rows], None] | None = None
+        self._reader = Thread(target=self._read, name="devboard-daemon-client", daemon=True)
+        self._reader.start()
+
+    def rows(
+        self,
+        column: str,
+        projects: list[Project] | None = None,
+        *,
+        refresh: bool = False,
+        timeout: float | None = None,
+    ) -> _Rows:
+        """Get rows of a column.
+
+        Parameters:
+            column: The class name of the column.
+            projects: Only get rows of these projects.
+            refresh: Whether the daemon should recompute rows first,
+                instead of returning the rows it has in memory.
+            timeout: How long to wait for the daemon to answer, in seconds.
+
+        Raises:
+            ConnectionError: When the connection to the daemon is lost.
+            RuntimeError: When the daemon failed to get rows.
+            TimeoutError: When the daemon didn't answer in time.
+
+        Returns:
+            The rows.
+        """
+        return self._result(self._request_rows(column, projects, refresh=refresh), timeout)
+
+    def _request_rows(self, column: str, projects: list[Project] | None, *, refresh: bool) -> Future:
+        request_id = next(self._ids)
+        future: Future = Future()
+        self._pending[request_id] = future
+        message = {"op": "rows", "id": request_id, "column": column, "projects": projects, "refresh": refresh}
+        self._send(message)
+        return future
+
+    @staticmethod
+    def _result(future: Future, timeout: float | None) -> _Rows:
+        try:
+            response = future.result(timeout)
+        except FutureTimeoutError as error:
+            raise TimeoutError("The devboard daemon did not answer in time") from error
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["rows"]
+
+    def subscribe(self, callback: Callable[[str, list[Project], _Rows], None]) -> None:
+        """Receive rows updated by the daemon.
+
+        Parameters:
+            callback: A function called from a background thread
+                with the class name of a column, the updated projects,
+                and the new rows of these projects.
+        """
+        self._on_change = callback
+        self._send({"op": "subscribe"})
+
+    def close(self) -> None:
+        """Close the connection."""
+        with contextlib.suppress(OSError):
+            self._socket.shutdown(socket.SHUT_RDWR)
+        self._socket.close()
+
+    def _send(self, message: dict[str, Any]) -> None:
+        try:
+            with self._send_lock:
+                self._socket.sendall(_pack(message))
+        except OSError as error:
+            raise ConnectionError("Lost connection to the devboard daemon") from error
+
+    def _read(self) -> None:
+        try:
+            while (message := _read_message_sync(self._file)) is not None:
+                if "id" in message:
+                    if (future := self._pending.pop(message["id"], None)) is not None:
+                        future.set_result(message)
+                elif message["op"] == "changed" and self._on_change is not None:
+                    self._on_change(message["column"], message["projects"], message["rows"])
+        except (OSError, ValueError):
+            pass
+        for future in self._pending.values():
+            future.set_exception(ConnectionError("Lost connection to the devboard daemon"))
+        self._pending.clear()
+
+
+def connect_daemon(board: str | Path | None = None) -> DaemonClient | None:
+    """Connect to the daemon serving a board, if it's running.
+
+    Parameters:
+        board: The board name or path, as given to `devboard --serve`.
+
+    Returns:
+        A client, or `None` if no daemon serves this board.
+    """
+    try:
+        return DaemonClient(_socket_path(board))
+    except OSError:
+        return None
+
+
+def serve_board(
+    board: str | Path | None = None,
+    *,
+    poll_interval: float = 2.0,
+    full_refresh_interval: float = 60.0,
+) -> int:
+    """Run a daemon serving a board, until interrupted.
+
+    Parameters:
+        board: The board name or path. By default, the configured board.
+        poll_interval: Interval between checks of project fingerprints, in seconds.
+        full_refresh_interval: Interval between updates of all projects, in seconds.
+
+    Returns:
+        An exit code.
+    """
+    # Imported here since the application module imports this one.
+    from devboard._internal.app import _default_config_file, _load_board  # noqa: PLC0415
+
+    daemon = BoardDaemon(
+        _load_board(board, _default_config_file()),
+        poll_interval=poll_interval,
+        full_refresh_interval=full_refresh_interval,
+    )
+    path = _socket_path(board)
+    print(f"Serving board on {path}")  # noqa: T201
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(daemon.serve(path))
+    return 0
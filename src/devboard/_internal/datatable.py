@@ -1,18 +1,35 @@
 from __future__ import annotations
 
+import contextlib
+import inspect
+import re
+import threading
+import time
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, ClassVar
+from itertools import count
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from textual.binding import Binding
 from textual.coordinate import Coordinate
+from textual.message import Message
 from textual.widgets import DataTable
-from textual.widgets.data_table import CellDoesNotExist, RowKey
+from textual.widgets.data_table import CellDoesNotExist, CellKey, ColumnKey, Row, RowKey
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
     from textual.app import App
 
+_CHECKBOX = ColumnKey("checkbox")
+_FRAME_INTERVAL = 1 / 60
+"""Minimum interval between two flushes of batched table updates, in seconds."""
+
+
+class _FlushBatch(Message, bubble=False):
+    # Posted to a table, from any thread, when its batch of updates needs flushing.
+    pass
+
 
 @dataclass
 class Checkbox:
@@ -41,28 +58,53 @@ class Checkbox:
         return self.checked
 
 
+def _field(position: int, name: str) -> property:
+    def getter(row: SelectableRow) -> Any:
+        return row.table._cells(row.key)[row.table._field_keys[position]]
+
+    return property(getter, doc=f"The `{name}` field of the row.")
+
+
 @dataclass
 class SelectableRow:
-    """A selectable row."""
+    """A selectable row.
+
+    Subclasses can declare a typed schema: annotated attributes
+    are fields of the row, in the order of its data (without checkbox).
+    For example, given `project: Project` and `branch: str`,
+    `row.project` and `row.branch` return the first and second values
+    of the row data, in constant time.
+    """
+
+    __slots__ = ("key", "table")
 
     table: SelectableRowsDataTable
     """The data table containing this row."""
     key: RowKey
     """The row key."""
 
+    _FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = list(cls._FIELDS)
+        for name, annotation in inspect.get_annotations(cls).items():
+            if name.startswith("_") or str(annotation).startswith(("ClassVar", "typing.ClassVar")):
+                continue
+            fields.append(name)
+            setattr(cls, name, _field(len(fields) - 1, name))
+        cls._FIELDS = tuple(fields)
+
     @property
     def app(self) -> App:
         """Textual application."""
         return self.table.app
 
-    @property
-    def _data(self) -> list:
-        return self.table.get_row(self.key)
-
     @property
     def data(self) -> list:
         """Row data (without checkbox)."""
-        return self._data[1:]
+        cells = self.table._cells(self.key)
+        return [cells[column_key] for column_key in self.table._field_keys]
 
     @property
     def index(self) -> int:
@@ -72,7 +114,7 @@ class SelectableRow:
     @property
     def checkbox(self) -> Checkbox:
         """Row checkbox."""
-        return self._data[0]
+        return self.table._cells(self.key)[_CHECKBOX]
 
     def select(self) -> None:
         """Select this row."""
@@ -92,22 +134,44 @@ class SelectableRow:
         return self.checkbox.checked
 
     def remove(self) -> None:
-        """Remove row from the table."""
-        self.table.remove_row(self.key)
+        """Remove row from the table.
+
+        From other threads than the application's, removal is batched (see `SelectableRowsDataTable.batch_remove_row`).
+        """
+        if self.table._on_ui_thread():
+            self.table.remove_row(self.key)
+        else:
+            self.table.batch_remove_row(self.key)
+
+    def update(self, column: str, value: Any) -> None:
+        """Update a cell of this row.
+
+        From other threads than the application's, updates are batched (see `SelectableRowsDataTable.batch_update_cell`).
+        Rows hidden by the current filter can be updated too.
+
+        Parameters:
+            column: The column key.
+            value: The new value.
+        """
+        if self.table._on_ui_thread():
+            if self.table._update_batched_cell(self.key, column, value):
+                self.table._rows_added()
+        else:
+            self.table.batch_update_cell(self.key, column, value)
 
     @property
     def previous(self) -> SelectableRow:
         """Previous row (up)."""
         new_coord = Coordinate(self.index - 1, 0)
         key = self.table.coordinate_to_cell_key(new_coord).row_key
-        return self.__class__(table=self.table, key=key)
+        return self.table.get_selectable_row(key)
 
     @property
     def next(self) -> SelectableRow:
         """Next row (down)."""
         new_coord = Coordinate(self.index + 1, 0)
         key = self.table.coordinate_to_cell_key(new_coord).row_key
-        return self.__class__(table=self.table, key=key)
+        return self.table.get_selectable_row(key)
 
 
 class SelectableRowsDataTable(DataTable):
@@ -125,15 +189,104 @@ class SelectableRowsDataTable(DataTable):
     ]
     """Key bindings for selecting rows."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the table."""
+        super().__init__(*args, **kwargs)
+        self.filter_query = ""
+        """Current filter: only rows fuzzy-matching it are shown."""
+        self._row_ids = count()
+        self._adding_rows = False
+        self._search_texts: dict[RowKey, str] = {}
+        self._search_index: tuple[str, list[int], list[RowKey]] | None = None
+        self._hidden_rows: dict[RowKey, tuple[Row, dict[ColumnKey, Any]]] = {}
+        # Keys of data columns, without the checkbox column, maintained as columns are added and removed.
+        self._field_keys: list[ColumnKey] = []
+        self._selectable_rows: dict[RowKey, SelectableRow] = {}
+        self._batch_lock = threading.Lock()
+        self._batch_adds: dict[str, tuple[Any, ...]] = {}
+        self._batch_removes: set[str] = set()
+        self._batch_updates: dict[tuple[str, str], Any] = {}
+        self._flush_pending = False
+        self._last_flush = 0.0
+
     # --------------------------------------------------
     # Textual methods.
     # --------------------------------------------------
+    def add_row(self, *cells: Any, key: str | None = None, **kwargs: Any) -> RowKey:
+        """Add a row.
+
+        Rows get a unique string key when none is given,
+        so that they can be hidden and shown again when filtering.
+        """
+        if key is None:
+            key = f"row-{next(self._row_ids)}"
+        row_key = super().add_row(*cells, key=key, **kwargs)
+        self._index_row(row_key)
+        if not self._adding_rows:
+            self._rows_added()
+        return row_key
+
     def add_rows(self, rows: Iterable[Iterable]) -> list[RowKey]:
         """Add rows.
 
         Automatically insert a column with checkboxes in position 0.
         """
-        return super().add_rows((Checkbox(), *row) for row in rows)
+        self._adding_rows = True
+        try:
+            row_keys = super().add_rows((Checkbox(), *row) for row in rows)
+        finally:
+            self._adding_rows = False
+        self._rows_added()
+        return row_keys
+
+    def add_column(self, label: Any, *, key: str | None = None, **kwargs: Any) -> ColumnKey:
+        """Add a column, keeping track of data columns (see `SelectableRow`)."""
+        column_key = super().add_column(label, key=key, **kwargs)
+        if column_key != _CHECKBOX:
+            self._field_keys.append(column_key)
+        return column_key
+
+    def remove_column(self, column_key: ColumnKey | str) -> None:
+        """Remove a column, from shown rows and from rows hidden by the current filter."""
+        super().remove_column(column_key)
+        self._field_keys.remove(column_key)  # type: ignore[arg-type]
+        for _, cells in self._hidden_rows.values():
+            cells.pop(column_key, None)  # type: ignore[arg-type]
+
+    def update_cell(self, row_key: RowKey | str, column_key: ColumnKey | str, value: Any, **kwargs: Any) -> None:
+        """Update a cell, shown or hidden by the current filter, and its search text."""
+        if self._update_hidden_cell(row_key, column_key, value):
+            # The row may match the filter now.
+            self._rows_added()
+            return
+        super().update_cell(row_key, column_key, value, **kwargs)
+        self._index_row(self.rows[row_key].key)  # type: ignore[index]
+
+    def get_row(self, row_key: RowKey | str) -> list[Any]:
+        """Get the values of a row, shown or hidden by the current filter."""
+        if row_key in self._hidden_rows:
+            cells = self._hidden_rows[row_key][1]  # type: ignore[index]
+            return [cells[column.key] for column in self.ordered_columns]
+        return super().get_row(row_key)
+
+    def get_cell(self, row_key: RowKey | str, column_key: ColumnKey | str) -> Any:
+        """Get the value of a cell, shown or hidden by the current filter."""
+        if row_key in self._hidden_rows:
+            try:
+                return self._hidden_rows[row_key][1][column_key]  # type: ignore[index]
+            except KeyError as error:
+                raise CellDoesNotExist(f"No cell exists for row_key={row_key!r}, column_key={column_key!r}.") from error
+        return super().get_cell(row_key, column_key)
+
+    def remove_row(self, row_key: RowKey | str) -> None:
+        """Remove a row, shown or hidden by the current filter."""
+        if row_key in self._hidden_rows:
+            del self._hidden_rows[row_key]  # type: ignore[arg-type]
+        else:
+            super().remove_row(row_key)
+        self._search_texts.pop(row_key, None)  # type: ignore[arg-type]
+        self._selectable_rows.pop(row_key, None)  # type: ignore[arg-type]
+        self._search_index = None
 
     def clear(self, columns: bool = True) -> SelectableRowsDataTable:  # noqa: FBT001,FBT002
         """Clear rows and optionally columns.
@@ -141,7 +294,16 @@ class SelectableRowsDataTable(DataTable):
         When clearing columns, automatically re-add a column for checkboxes.
         """
         super().clear(columns)
+        with self._batch_lock:
+            self._batch_adds.clear()
+            self._batch_removes.clear()
+            self._batch_updates.clear()
+        self._search_texts.clear()
+        self._search_index = None
+        self._hidden_rows.clear()
+        self._selectable_rows.clear()
         if columns:
+            self._field_keys.clear()
             self.add_column("", key="checkbox")
         return self
 
@@ -201,24 +363,219 @@ class SelectableRowsDataTable(DataTable):
     # --------------------------------------------------
     # Additional methods/properties.
     # --------------------------------------------------
+    def _index_row(self, row_key: RowKey) -> None:
+        # Called when a row is added or updated, to precompute data about it.
+        cells = self._cells(row_key).values()
+        self._search_texts[row_key] = " ".join(str(cell) for cell in cells if not isinstance(cell, Checkbox)).lower()
+        self._search_index = None
+
+    def _rows_added(self) -> None:
+        # Called once after adding one or several rows.
+        if self.filter_query:
+            self._apply_filter()
+
+    def _schedule_flush(self) -> None:
+        with self._batch_lock:
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+        self.post_message(_FlushBatch())
+
+    def on__flush_batch(self) -> None:
+        """Flush batched updates, at most once per frame."""
+        if (delay := _FRAME_INTERVAL - (time.monotonic() - self._last_flush)) > 0:
+            self.set_timer(delay, self.flush_batch)
+        else:
+            self.call_later(self.flush_batch)
+
+    def _update_batched_cell(self, key: RowKey | str, column: str, value: Any) -> bool:
+        # Returns whether the row is hidden by the filter, and must be filtered again.
+        if self._update_hidden_cell(key, column, value):
+            return True
+        self.update_cell(key, column, value)
+        return False
+
+    def _update_hidden_cell(self, row_key: RowKey | str, column_key: ColumnKey | str, value: Any) -> bool:
+        # Returns whether the row is hidden by the filter (and was updated).
+        if row_key not in self._hidden_rows:
+            return False
+        row, cells = self._hidden_rows[row_key]  # type: ignore[index]
+        cells[ColumnKey(column_key) if isinstance(column_key, str) else column_key] = value
+        self._index_row(row.key)
+        return True
+
+    def _matching_rows(self) -> set[RowKey]:
+        if self._search_index is None:
+            # All search texts are joined into a single string,
+            # so that matching is done by a single regular expression scan.
+            keys = list(self._search_texts)
+            offsets = []
+            offset = 0
+            for key in keys:
+                offsets.append(offset)
+                offset += len(self._search_texts[key]) + 1
+            self._search_index = ("\n".join(self._search_texts[key] for key in keys), offsets, keys)
+        text, offsets, keys = self._search_index
+        # Fuzzy matching: query characters must appear in order. Each `[^c\n]*c`
+        # jumps to the next occurrence of `c`, which never requires backtracking.
+        pattern = re.compile(
+            "(?m)^" + "".join(f"[^{re.escape(char)}\n]*{re.escape(char)}" for char in self.filter_query.lower()),
+        )
+        return {keys[bisect_right(offsets, match.start()) - 1] for match in pattern.finditer(text)}
+
+    def _apply_filter(self) -> None:
+        matching = self._matching_rows() if self.filter_query else set(self._search_texts)
+        to_hide = [key for key in self.rows if key not in matching]
+        to_show = [key for key in self._hidden_rows if key in matching]
+        if to_hide or to_show:
+            self._hide_and_show_rows(to_hide, to_show)
+
+    def filter(self, query: str) -> None:
+        """Only show rows fuzzy-matching the given query (case-insensitive).
+
+        Each row's text is indexed once, when it's added or updated,
+        and all rows are matched in a single pass. Selection actions
+        only apply to shown rows. An empty query shows all rows.
+
+        Parameters:
+            query: The characters to search, in order, in the text of each row.
+        """
+        self.filter_query = query
+        self._apply_filter()
+
+    def batch_add_rows(self, rows: Iterable[Iterable]) -> list[RowKey]:
+        """Add rows at the next flush of batched updates. Can be called from any thread.
+
+        Batched updates are coalesced and applied at most once per frame,
+        with a single sort and filter pass, so that many rows streaming in
+        from workers don't make the interface unresponsive.
+
+        Parameters:
+            rows: The rows to add.
+
+        Returns:
+            The keys the rows will have.
+        """
+        keys = []
+        with self._batch_lock:
+            for row in rows:
+                key = f"row-{next(self._row_ids)}"
+                self._batch_adds[key] = tuple(row)
+                keys.append(RowKey(key))
+        self._schedule_flush()
+        return keys
+
+    def batch_remove_row(self, row_key: RowKey | str) -> None:
+        """Remove a row at the next flush of batched updates. Can be called from any thread.
+
+        Parameters:
+            row_key: The row key.
+        """
+        key = row_key.value if isinstance(row_key, RowKey) else row_key
+        with self._batch_lock:
+            # Rows added and removed within a batch are never shown.
+            if self._batch_adds.pop(key, None) is None:  # type: ignore[arg-type]
+                self._batch_removes.add(key)  # type: ignore[arg-type]
+            for cell in [cell for cell in self._batch_updates if cell[0] == key]:
+                del self._batch_updates[cell]
+        self._schedule_flush()
+
+    def batch_update_cell(self, row_key: RowKey | str, column_key: ColumnKey | str, value: Any) -> None:
+        """Update a cell at the next flush of batched updates. Can be called from any thread.
+
+        Only the last value of a cell is applied.
+
+        Parameters:
+            row_key: The row key.
+            column_key: The column key.
+            value: The new value.
+        """
+        key = row_key.value if isinstance(row_key, RowKey) else row_key
+        column = column_key.value if isinstance(column_key, ColumnKey) else column_key
+        with self._batch_lock:
+            if key in self._batch_removes:
+                return
+            if (row := self._batch_adds.get(key)) is not None:  # type: ignore[arg-type]
+                # The row is not added yet: update its queued data directly.
+                fields = [field.value for field in self._field_keys]
+                if column in fields:
+                    index = fields.index(column)
+                    self._batch_adds[key] = (*row[:index], value, *row[index + 1 :])  # type: ignore[index]
+                    return
+            self._batch_updates[key, column] = value  # type: ignore[index]
+        self._schedule_flush()
+
+    def flush_batch(self) -> None:
+        """Apply batched updates now: removals, then cell updates, then additions."""
+        with self._batch_lock:
+            adds, self._batch_adds = self._batch_adds, {}
+            removes, self._batch_removes = self._batch_removes, set()
+            updates, self._batch_updates = self._batch_updates, {}
+            self._flush_pending = False
+        self._last_flush = time.monotonic()
+        for key in removes:
+            if key in self.rows or key in self._hidden_rows:
+                self.remove_row(key)
+        refilter = False
+        for (key, column), value in updates.items():
+            with contextlib.suppress(CellDoesNotExist, KeyError):
+                refilter |= self._update_batched_cell(key, column, value)
+        if refilter and not adds:
+            self._rows_added()
+        if adds:
+            self._adding_rows = True
+            try:
+                for key, row in adds.items():
+                    self.add_row(Checkbox(), *row, key=key)
+            finally:
+                self._adding_rows = False
+            self._rows_added()
+            self.refresh(layout=True)
+
     def force_refresh(self) -> None:
         """Force refresh table."""
-        # HACK: Without such increment, the table is refreshed
-        # only when focus changes to another column.
-        self._update_count += 1
+        self._invalidate_render_cache()
         self.refresh()
 
+    def get_row_cells(self, row_key: RowKey | str) -> dict[ColumnKey, Any]:
+        """Get the cells of a row, shown or hidden by the current filter, by column key (checkbox included).
+
+        Parameters:
+            row_key: The row key.
+
+        Returns:
+            The cells of the row. Don't modify them: use `update_cell` instead.
+        """
+        return self._cells(row_key)  # type: ignore[arg-type]
+
+    @property
+    def all_row_keys(self) -> list[RowKey]:
+        """Keys of all rows, shown or hidden by the current filter."""
+        return [*self.rows, *self._hidden_rows]
+
+    def get_selectable_row(self, row_key: RowKey) -> SelectableRow:
+        """Get a row, as a selectable one. Row objects are cached by key.
+
+        Parameters:
+            row_key: The row key.
+
+        Returns:
+            A selectable row, instance of `ROW`.
+        """
+        if (row := self._selectable_rows.get(row_key)) is None:
+            row = self._selectable_rows[row_key] = self.ROW(table=self, key=row_key)
+        return row
+
     @property
     def current_row(self) -> SelectableRow:
         """Currently selected row."""
-        key = self.coordinate_to_cell_key(self.cursor_coordinate).row_key
-        return self.ROW(table=self, key=key)
+        return self.get_selectable_row(self.coordinate_to_cell_key(self.cursor_coordinate).row_key)
 
     @property
     def selectable_rows(self) -> Iterator[SelectableRow]:
         """Rows, as selectable ones."""
         for key in self.rows:
-            yield self.ROW(table=self, key=key)
+            yield self.get_selectable_row(key)
 
     @property
     def selected_rows(self) -> Iterator[SelectableRow]:
@@ -226,3 +583,50 @@ class SelectableRowsDataTable(DataTable):
         for row in self.selectable_rows:
             if row.selected:
                 yield row
+
+    # --------------------------------------------------
+    # Textual private API.
+    # --------------------------------------------------
+    # Filtering and sorting rows in place, and refreshing or updating the table from other threads,
+    # requires using private attributes of Textual's data table. They are only used in this section,
+    # to check when changing the version range of Textual in `pyproject.toml`.
+    def _cells(self, row_key: RowKey) -> dict[ColumnKey, Any]:
+        # Cells of a row, by column key, whether it's shown or hidden.
+        try:
+            return self._data[row_key]
+        except KeyError:
+            return self._hidden_rows[row_key][1]
+
+    def _on_ui_thread(self) -> bool:
+        return self._thread_id == threading.get_ident()
+
+    def _invalidate_render_cache(self) -> None:
+        # Without such increment, the table is refreshed only when focus changes to another column.
+        self._update_count += 1
+
+    def _ordered_row_keys(self) -> list[RowKey]:
+        # Keys of shown rows, in display order.
+        locations = self._row_locations
+        return sorted(locations, key=locations.get)  # type: ignore[arg-type]
+
+    def _set_row_order(self, row_keys: list[RowKey]) -> None:
+        # Display shown rows in the given order.
+        from textual._two_way_dict import TwoWayDict  # noqa: PLC0415
+
+        self._row_locations = TwoWayDict({row_key: index for index, row_key in enumerate(row_keys)})
+        self.force_refresh()
+
+    def _hide_and_show_rows(self, to_hide: list[RowKey], to_show: list[RowKey]) -> None:
+        # Hidden rows are moved out of the table, and shown ones are moved back in, at the end.
+        for key in to_hide:
+            self._hidden_rows[key] = (self.rows.pop(key), self._data.pop(key))
+            for column_key in self.columns:
+                self._updated_cells.discard(CellKey(key, column_key))
+        for key in to_show:
+            self.rows[key], self._data[key] = self._hidden_rows.pop(key)
+            self._new_rows.add(key)
+        hidden = set(to_hide)
+        self._set_row_order([*(key for key in self._ordered_row_keys() if key not in hidden), *to_show])
+        self._require_update_dimensions = True
+        self.cursor_coordinate = self.cursor_coordinate
+        self.refresh(layout=True)
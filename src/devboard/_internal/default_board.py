@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
+from threading import BoundedSemaphore
 from typing import Any, ClassVar
 
 from git import TYPE_CHECKING, GitCommandError
 
-from devboard import Column, Project, Row
+from devboard import Column, Project, Row, discover_projects, memoize_rows
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -17,6 +19,12 @@ BASE_DIR = Path(os.getenv("DEVBOARD_PROJECTS", Path.home() / "dev")).expanduser(
 This variable is only used to list projects in `Project.list_projects`
 and has no special meaning for Devboard.
 """
+MAX_DEPTH = int(os.getenv("DEVBOARD_PROJECTS_DEPTH", "1"))
+"""How deep to search for Git projects in the base directory.
+
+Use 1 when projects are direct children of the base directory,
+2 for a layout such as `<base>/<organization>/<project>`, etc.
+"""
 
 
 class MyProject(Project):
@@ -33,9 +41,19 @@ class MyProject(Project):
     @classmethod
     def list_projects(cls) -> Iterator[MyProject]:
         """List all Git projects in a base directory."""
-        for filedir in BASE_DIR.iterdir():
-            if filedir.is_dir() and filedir.joinpath(".git").is_dir():
-                yield cls(filedir)
+        for path in discover_projects(BASE_DIR, max_depth=MAX_DEPTH):
+            yield cls(path)
+
+
+class BranchRow(Row):
+    """A row showing a number of commits for a project branch."""
+
+    project: MyProject
+    """The project."""
+    branch: str
+    """The branch name."""
+    commits: int
+    """The number of commits."""
 
 
 class ToCommit(Column):
@@ -44,10 +62,12 @@ class ToCommit(Column):
     TITLE = "To Commit"
     HEADERS = ("Project", "Details")
     THREADED = False
+    DEPENDS_ON = frozenset({"worktree"})
     BINDINGS: ClassVar = [
-        ("s", "apply('status')", "Show status"),
-        ("d", "apply('diff')", "Show diff"),
+        ("s", "details('status')", "Show status"),
+        ("d", "details('diff')", "Show diff"),
     ]
+    PREFETCH = ("status", "diff")
 
     def list_projects(self) -> Iterator[MyProject]:
         """List projects for this column."""
@@ -61,19 +81,23 @@ class ToCommit(Column):
         """
         return [(project, project.status_line)] if project.is_dirty else []
 
-    def apply(self, action: str, row: Row) -> None:
-        """Process actions.
+    def details_fingerprint(self, row: Row) -> Any:
+        """Return a fingerprint of the project including uncommitted changes, since details show them."""
+        return row.project.dirty_fingerprint
 
-        It handles two actions: `status` and `diff`.
+    def details_command(self, action: str, row: Row) -> list[str] | None:  # noqa: ARG002
+        """Return commands showing details.
 
-        - `status`: Show the Git status of the selected project in a modal window
-        - `diff`: Show the Git diff of the selected project in a modal window.
+        It handles two details: `status` and `diff`.
+
+        - `status`: Show the Git status of the selected project in a pager
+        - `diff`: Show the Git diff of the selected project in a pager.
         """
         if action == "status":
-            self.modal(text=row.project.repo.git(c="color.status=always").status())
+            return ["git", "-c", "color.status=always", "status"]
         if action == "diff":
-            self.modal(text=row.project.repo.git(c="color.ui=always").diff())
-        raise ValueError(f"Unknown action '{action}'")
+            return ["git", "-c", "color.ui=always", "diff"]
+        return None
 
 
 class ToPull(Column):
@@ -81,16 +105,21 @@ class ToPull(Column):
 
     TITLE = "To Pull"
     HEADERS = ("Project", "Branch", "Commits")
+    ROW = BranchRow
+    DEPENDS_ON = frozenset({"refs", "remotes"})
     BINDINGS: ClassVar = [
         ("p", "apply('pull')", "Pull"),
+        ("l", "details('log')", "Show commits"),
         ("d", "apply('delete')", "Delete branch"),
     ]
+    PREFETCH = ("log",)
 
     def list_projects(self) -> Iterator[MyProject]:
         """List projects for this column."""
         yield from MyProject.list_projects()
 
     @staticmethod
+    @memoize_rows()
     def populate_rows(project: MyProject) -> list[tuple[Any, ...]]:  # type: ignore[override]
         """Scan a project, feeding rows to the table.
 
@@ -98,13 +127,23 @@ class ToPull(Column):
         """
         return [(project, branch, commits) for branch, commits in project.unpulled().items() if commits]
 
-    def apply(self, action: str, row: Row) -> None:  # noqa: ARG002
+    def details_command(self, action: str, row: BranchRow) -> list[str] | None:  # type: ignore[override]
+        """Return commands showing details.
+
+        It handles a single detail, `log`: the commits to pull.
+        """
+        if action == "log":
+            branch = row.branch
+            return ["git", "-c", "color.ui=always", "log", "--oneline", f"{branch}..origin/{branch}"]
+        return None
+
+    def apply(self, action: str, row: BranchRow) -> None:  # type: ignore[override]  # noqa: ARG002
         """Process actions.
 
         It handles a single default action: running `git pull` for the selected row
         (project and branch).
         """
-        project, branch, _ = row.data
+        project, branch = row.project, row.branch
         message = f"Pulling branch [i]{branch}[/] in [i]{project}[/]"
         if not project.lock():
             self.notify_warning(f"Prevented: {message}: An operation is ongoing")
@@ -118,6 +157,7 @@ class ToPull(Column):
             else:
                 self.notify_success(f"Finished: {message}")
                 row.remove()
+                self.invalidate(project, kinds=("worktree", "refs", "remotes"))
         else:
             self.notify_warning(f"Prevented: {message}: project is dirty")
         project.unlock()
@@ -128,15 +168,20 @@ class ToPush(Column):
 
     TITLE = "To Push"
     HEADERS = ("Project", "Branch", "Commits")
+    ROW = BranchRow
+    DEPENDS_ON = frozenset({"refs", "remotes"})
     BINDINGS: ClassVar = [
         ("p", "apply('push')", "Push"),
+        ("l", "details('log')", "Show commits"),
     ]
+    PREFETCH = ("log",)
 
     def list_projects(self) -> Iterator[MyProject]:
         """List projects for this column."""
         yield from MyProject.list_projects()
 
     @staticmethod
+    @memoize_rows()
     def populate_rows(project: MyProject) -> list[tuple[Any, ...]]:  # type: ignore[override]
         """Scan a project, feeding rows to the table.
 
@@ -144,13 +189,23 @@ class ToPush(Column):
         """
         return [(project, branch, commits) for branch, commits in project.unpushed().items() if commits]
 
-    def apply(self, action: str, row: Row) -> None:  # noqa: ARG002
+    def details_command(self, action: str, row: BranchRow) -> list[str] | None:  # type: ignore[override]
+        """Return commands showing details.
+
+        It handles a single detail, `log`: the commits to push.
+        """
+        if action == "log":
+            branch = row.branch
+            return ["git", "-c", "color.ui=always", "log", "--oneline", f"origin/{branch}..{branch}"]
+        return None
+
+    def apply(self, action: str, row: BranchRow) -> None:  # type: ignore[override]  # noqa: ARG002
         """Process actions.
 
         It handles a single default action: running `git push` for the selected row
         (project and branch).
         """
-        project, branch, _ = row.data
+        project, branch = row.project, row.branch
         message = f"Pushing branch [i]{branch}[/] in [i]{project}[/]"
         if not project.lock():
             self.notify_warning(f"Prevented: {message}: An operation is ongoing")
@@ -163,6 +218,7 @@ class ToPush(Column):
         else:
             self.notify_success(f"Finished: {message}")
             row.remove()
+            self.invalidate(project, kinds=("remotes",))
         project.unlock()
 
 
@@ -171,12 +227,18 @@ class ToRelease(Column):
 
     TITLE = "To Release"
     HEADERS = ("Project", "Details")
+    DEPENDS_ON = frozenset({"refs", "tags"})
+    BINDINGS: ClassVar = [
+        ("l", "details('log')", "Show commits"),
+    ]
+    PREFETCH = ("log",)
 
     def list_projects(self) -> Iterator[MyProject]:
         """List projects for this column."""
         yield from MyProject.list_projects()
 
     @staticmethod
+    @memoize_rows()
     def populate_rows(project: MyProject) -> list[tuple[Any, ...]]:  # type: ignore[override]
         """Scan a project, feeding rows to the table.
 
@@ -184,24 +246,136 @@ class ToRelease(Column):
         """
         commit_types = {"feat": "F", "fix": "X", "refactor": "R", "build": "B", "deps": "D"}
         by_type = dict.fromkeys(commit_types, 0)
-        for commit in project.unreleased():
+        for _, subject in project.unreleased_subjects():
             for commit_type in commit_types:
-                summary = (
-                    commit.summary
-                    if isinstance(commit.summary, str)
-                    else bytes(commit.summary).decode("utf-8", errors="ignore")
-                )
-                if summary.startswith(f"{commit_type}:"):
+                if subject.startswith(f"{commit_type}:"):
                     by_type[commit_type] += 1
         parts = [f"{by_type[ct]}{commit_types[ct]}" for ct in commit_types if by_type[ct]]
         if parts:
             return [(project, " ".join(parts))]
         return []
 
+    def details_command(self, action: str, row: Row) -> list[str] | None:
+        """Return commands showing details.
+
+        It handles a single detail, `log`: the commits of the default branch that are not tagged yet.
+        """
+        if action == "log":
+            try:
+                branch = row.project.default_branch
+            except ValueError:
+                branch = "HEAD"
+            return ["git", "-c", "color.ui=always", "log", "--oneline", branch, "--not", "--tags"]
+        return None
+
+
+class Maintenance(Column):
+    """A column showing projects that slow down other columns, because of their object database or size."""
+
+    TITLE = "Maintenance"
+    HEADERS = ("Project", "Loose objects", "Packs", "Commit-graph", "MIDX", "Scan time", "Missing settings")
+    SORT = ("-Scan time",)
+    DEPENDS_ON = frozenset({"objects", "refs", "remotes"})
+    DEPENDS_ON_OTHER_COLUMNS = True
+    BINDINGS: ClassVar = [
+        ("m", "apply('maintenance')", "Run maintenance"),
+        ("c", "apply('commit-graph')", "Write commit-graph"),
+        ("p", "apply('repack')", "Repack"),
+        ("t", "apply('tune')", "Configure large repository"),
+    ]
+    LOOSE_OBJECTS_THRESHOLD = 1000
+    """Number of loose objects from which a project is shown."""
+    PACKS_THRESHOLD = 20
+    """Number of packs from which a project is shown."""
+    COMMIT_GRAPH_THRESHOLD = 10_000
+    """Number of objects from which a project without commit-graph is shown."""
+    SLOW_SCAN_THRESHOLD = 1.0
+    """Total scan time in other columns, in seconds, from which a project is shown.
+
+    Scan times are measured by other columns of the board: this column is updated once they are done loading.
+    When rows are served by a daemon, scan times are the ones the daemon measured during its previous
+    scans, so they are only taken into account from its first full refresh on.
+    """
+    JOBS: ClassVar[BoundedSemaphore] = BoundedSemaphore(2)
+    """Limits the number of maintenance jobs running at once, since they are CPU and IO intensive."""
+
+    def list_projects(self) -> Iterator[MyProject]:
+        """List projects for this column."""
+        yield from MyProject.list_projects()
+
+    async def populate_rows(self, project: MyProject) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        """Scan a project, feeding rows to the table.
+
+        It returns a single row with statistics of the object database,
+        the time other columns took to scan the project during their last refresh,
+        and the settings a large project misses (see `Project.is_large`),
+        if any of them exceeds its threshold or settings are missing.
+        """
+        counts = await project.object_counts_async()
+        loose, packs = counts.get("count", 0), counts.get("packs", 0)
+        commit_graph, midx = project.has_commit_graph, project.has_multi_pack_index
+        durations = Column.scan_durations.get(project, {})
+        scan_time = round(sum(duration for name, duration in durations.items() if name != type(self).__qualname__), 2)
+        missing = await asyncio.to_thread(lambda: project.missing_large_repo_settings)
+        if (
+            loose >= self.LOOSE_OBJECTS_THRESHOLD
+            or packs >= self.PACKS_THRESHOLD
+            or (not commit_graph and loose + counts.get("in-pack", 0) >= self.COMMIT_GRAPH_THRESHOLD)
+            or scan_time >= self.SLOW_SCAN_THRESHOLD
+            or missing
+        ):
+            graph, midx_cell = "yes" if commit_graph else "no", "yes" if midx else "no"
+            return [(project, loose, packs, graph, midx_cell, scan_time, " ".join(missing))]
+        return []
+
+    def apply(self, action: str, row: Row) -> None:
+        """Process actions.
+
+        It handles four actions, running in the background, a few at a time (see `JOBS`):
+
+        - `maintenance`: Run `git maintenance` tasks (see `Project.maintain`).
+        - `commit-graph`: Write a commit-graph (see `Project.write_commit_graph`).
+        - `repack`: Repack all objects (see `Project.repack`).
+        - `tune`: Configure settings for large repositories (see `Project.enable_large_repo_settings`).
+        """
+        project: MyProject = row.project  # type: ignore[assignment]
+        operations = {
+            "maintenance": ("Running maintenance", project.maintain),
+            "commit-graph": ("Writing commit-graph", project.write_commit_graph),
+            "repack": ("Repacking", project.repack),
+            "tune": ("Configuring large repository", project.enable_large_repo_settings),
+        }
+        if action not in operations:
+            return
+        label, operation = operations[action]
+        message = f"{label} in [i]{project}[/]"
+        # Wait for a job slot before locking the project, so that queued jobs
+        # don't prevent other operations on their project while waiting.
+        if not self.JOBS.acquire(blocking=False):
+            self.notify_info(f"Queued: {message}")
+            self.JOBS.acquire()
+        try:
+            if not project.lock():
+                self.notify_warning(f"Prevented: {message}: An operation is ongoing")
+                return
+            self.notify_info(f"Started: {message}")
+            try:
+                operation()
+            except GitCommandError as error:
+                self.notify_error(f"{message}: {error}", timeout=10)
+            else:
+                self.notify_success(f"Finished: {message}")
+                self.invalidate(project, kinds=("objects",))
+            finally:
+                project.unlock()
+        finally:
+            self.JOBS.release()
+
 
 columns = [
     ToCommit,
     ToPull,
     ToPush,
     ToRelease,
+    Maintenance,
 ]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+
+class DetailsCache:
+    """A thread-safe LRU cache of row details, such as diffs or lists of commits.
+
+    Entries are stored along with a fingerprint of the project they were computed for
+    (see `Project.fingerprint`), and are only returned if the fingerprint still matches
+    and they are not older than the time-to-live.
+    """
+
+    def __init__(self, *, max_size: int = 64 * 1024 * 1024, max_entry_size: int = 4 * 1024 * 1024) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            max_size: Maximum total size of cached details, in bytes.
+            max_entry_size: Details larger than this are not cached, in bytes.
+        """
+        self.max_size = max_size
+        """Maximum total size of cached details, in bytes."""
+        self.max_entry_size = max_entry_size
+        """Details larger than this are not cached, in bytes."""
+        self._entries: OrderedDict[tuple[Any, ...], tuple[Any, float, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get(self, key: tuple[Any, ...], fingerprint: Any, ttl: float) -> bytes | None:
+        """Get cached details.
+
+        Parameters:
+            key: The details key.
+            fingerprint: The current fingerprint of the project.
+            ttl: Maximum age of the details, in seconds.
+
+        Returns:
+            The details, or `None` if they are not cached, stale or expired.
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            cached_fingerprint, timestamp, data = entry
+            if cached_fingerprint != fingerprint or time.monotonic() - timestamp > ttl:
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def set(self, key: tuple[Any, ...], fingerprint: Any, data: bytes) -> None:
+        """Cache details, evicting least recently used ones if needed.
+
+        Parameters:
+            key: The details key.
+            fingerprint: The fingerprint of the project when details were computed.
+            data: The details.
+        """
+        if len(data) > self.max_entry_size:
+            return
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._size -= len(previous[2])
+            self._entries[key] = (fingerprint, time.monotonic(), data)
+            self._size += len(data)
+            while self._size > self.max_size:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
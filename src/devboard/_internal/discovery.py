@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_RACY_DELAY_NS = 2_000_000_000
+"""Directories modified more recently than this (in nanoseconds) are never cached."""
+
+_INDEX: dict[str, tuple[int, str, list[str], list[str]]] = {}
+"""Scanned directories, keyed by path.
+
+Values are the modification time, the kind (`repo`, `bare` or empty),
+the sub-directories and the sub-directories that are symbolic links.
+"""
+_INDEX_LOCK = Lock()
+_index_changes = 0
+"""Number of updates made to the index, used to avoid rewriting unchanged index files."""
+_INDEX_FILES: dict[str, int] = {}
+"""Index files loaded or saved, with the number of index updates when it happened."""
+
+
+def _scan_dir(path: str) -> tuple[str, list[str], list[str]]:
+    global _index_changes  # noqa: PLW0603
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return "", [], []
+    # Adding or removing entries (such as `.git` or sub-directories)
+    # updates the directory's modification time: we can cache on it.
+    if (cached := _INDEX.get(path)) and cached[0] == mtime_ns:
+        return cached[1], cached[2], cached[3]
+    names = set()
+    subdirs = []
+    links = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                names.add(entry.name)
+                try:
+                    if entry.is_dir():
+                        subdirs.append(entry.name)
+                        if entry.is_symlink():
+                            links.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        return "", [], []
+    if ".git" in names:
+        kind = "repo"
+    elif {"HEAD", "objects", "refs"} <= names and "objects" in subdirs:
+        kind = "bare"
+    else:
+        kind = ""
+    if time.time_ns() - mtime_ns >= _RACY_DELAY_NS:
+        with _INDEX_LOCK:
+            _INDEX[path] = (mtime_ns, kind, subdirs, links)
+            _index_changes += 1
+    return kind, subdirs, links
+
+
+def _load_index(index_file: Path) -> None:
+    key = str(index_file)
+    if key in _INDEX_FILES:
+        return
+    _INDEX_FILES[key] = _index_changes
+    try:
+        data = json.loads(index_file.read_text(encoding="utf8"))
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    with _INDEX_LOCK:
+        for path, (mtime_ns, kind, subdirs, links) in data.items():
+            _INDEX.setdefault(path, (mtime_ns, kind, subdirs, links))
+
+
+def _save_index(index_file: Path) -> None:
+    key = str(index_file)
+    if _INDEX_FILES.get(key) == _index_changes:
+        return
+    _INDEX_FILES[key] = _index_changes
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    with _INDEX_LOCK:
+        data = json.dumps(_INDEX)
+    tmp_file.write_text(data, encoding="utf8")
+    tmp_file.replace(index_file)
+
+
+def discover_projects(
+    *roots: str | Path,
+    max_depth: int | None = None,
+    ignore: Iterable[str] = (),
+    nested: bool = False,
+    bare: bool = False,
+    workers: int = 16,
+    index_file: str | Path | None = None,
+) -> list[Path]:
+    """Find Git repositories under the given root directories.
+
+    Directories are scanned with `os.scandir`, level by level,
+    in a pool of threads. Each scanned directory is cached
+    along with its modification time, so that unchanged directories
+    are never listed again: re-discovering projects in an unchanged tree
+    only costs one `stat` call per directory.
+
+    Parameters:
+        *roots: Directories to search in. A root can itself be a repository.
+        max_depth: How deep to search, a depth of 1 meaning direct children of roots. No limit by default.
+        ignore: Glob patterns of directories to skip, matched against
+            directory names and paths relative to their root.
+        nested: Whether to search for repositories inside other repositories.
+        bare: Whether to include bare repositories.
+        workers: Number of threads scanning directories.
+        index_file: A JSON file in which to persist the cache of scanned directories across runs.
+
+    Returns:
+        The paths of found repositories, sorted.
+    """
+    patterns = tuple(ignore)
+    if index_file is not None:
+        index_file = Path(index_file)
+        _load_index(index_file)
+    found = []
+    seen = set()
+    frontier = []
+    for root in roots:
+        root_path = os.path.abspath(os.path.expanduser(root))
+        frontier.append((root_path, root_path, 0))
+        seen.add(os.path.realpath(root_path))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while frontier:
+            results = executor.map(_scan_dir, [path for path, _, _ in frontier])
+            next_frontier = []
+            for (path, root, depth), (kind, subdirs, links) in zip(frontier, results):
+                if kind == "repo" or (kind == "bare" and bare):
+                    found.append(Path(path))
+                if kind == "bare" or (kind == "repo" and not nested):
+                    continue
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                for name in subdirs:
+                    if name == ".git":
+                        continue
+                    subdir = os.path.join(path, name)
+                    relative = os.path.relpath(subdir, root).replace(os.sep, "/")
+                    if any(fnmatch(name, pattern) or fnmatch(relative, pattern) for pattern in patterns):
+                        continue
+                    if name in links:
+                        # Guard against symbolic links creating cycles.
+                        if (real := os.path.realpath(subdir)) in seen:
+                            continue
+                        seen.add(real)
+                    next_frontier.append((subdir, root, depth + 1))
+            frontier = next_frontier
+    if index_file is not None:
+        _save_index(index_file)
+    return sorted(found)
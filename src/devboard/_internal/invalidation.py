@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from textual.message import Message
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from devboard._internal.projects import Project
+
+
+class ProjectsChanged(Message):
+    """Posted to the application when data of projects changed.
+
+    Columns depending on the changed kinds of data (see `Column.DEPENDS_ON`)
+    then update the rows of these projects only. Messages posted in a short
+    time window are merged, so that each column updates all projects at once.
+
+    Kinds of data are free-form strings. Built-in ones are:
+
+    - `worktree`: files in the working tree or index changed (pulls, commits, checkouts)
+    - `refs`: local branches or HEAD changed (pulls, commits, branch deletions)
+    - `remotes`: remote-tracking branches changed (fetches, pushes, pulls)
+    - `tags`: tags changed (fetches, releases)
+    - `objects`: the object database changed (repacks, commit-graph writes, maintenance)
+    """
+
+    def __init__(self, projects: Iterable[Project], kinds: Iterable[str]) -> None:
+        """Initialize the message.
+
+        Parameters:
+            projects: The projects that changed.
+            kinds: The kinds of data that changed.
+        """
+        super().__init__()
+        self.projects = frozenset(projects)
+        """The projects that changed."""
+        self.kinds = frozenset(kinds)
+        """The kinds of data that changed."""
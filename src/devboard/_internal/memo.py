@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from devboard._internal.projects import Project
+
+_F = TypeVar("_F", bound="Callable[..., Any]")
+
+
+class RowsCache:
+    """A thread-safe LRU cache of rows, by project.
+
+    Entries are stored along with a fingerprint of the project they were computed for
+    (see `Project.fingerprint`), and are only returned if the fingerprint still matches
+    and they are not older than the time-to-live.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = None,
+        max_entries: int = 4096,
+        extra_fingerprint: Callable[[Project], Any] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            ttl: Maximum age of cached rows, in seconds. No limit by default.
+            max_entries: Maximum number of cached projects.
+            extra_fingerprint: A function returning additional data to include in project fingerprints.
+        """
+        self.ttl = ttl
+        """Maximum age of cached rows, in seconds."""
+        self.max_entries = max_entries
+        """Maximum number of cached projects."""
+        self.extra_fingerprint = extra_fingerprint
+        """A function returning additional data to include in project fingerprints."""
+        self._entries: OrderedDict[Project, tuple[Any, float, list[tuple[Any, ...]]]] = OrderedDict()
+        self._lock = Lock()
+
+    def fingerprint(self, project: Project) -> Any:
+        """Compute the fingerprint of a project.
+
+        Parameters:
+            project: The project.
+
+        Returns:
+            The fingerprint, or `None` if it could not be computed (for example because the project
+            was deleted, or is not a Git repository), in which case rows must not be cached.
+        """
+        try:
+            fingerprint = project.fingerprint
+        except (OSError, ValueError):
+            return None
+        if self.extra_fingerprint is not None:
+            return (fingerprint, self.extra_fingerprint(project))
+        return fingerprint
+
+    def get(self, project: Project, fingerprint: Any) -> list[tuple[Any, ...]] | None:
+        """Get cached rows.
+
+        Parameters:
+            project: The project.
+            fingerprint: The current fingerprint of the project.
+
+        Returns:
+            A copy of the rows, or `None` if they are not cached, stale or expired.
+        """
+        if fingerprint is None:
+            return None
+        with self._lock:
+            if (entry := self._entries.get(project)) is None:
+                return None
+            cached_fingerprint, timestamp, rows = entry
+            if cached_fingerprint != fingerprint or (self.ttl is not None and time.monotonic() - timestamp > self.ttl):
+                return None
+            self._entries.move_to_end(project)
+            return list(rows)
+
+    def set(self, project: Project, fingerprint: Any, rows: list[tuple[Any, ...]]) -> None:
+        """Cache rows, evicting least recently used ones if needed.
+
+        Parameters:
+            project: The project.
+            fingerprint: The fingerprint of the project when rows were computed.
+            rows: The rows.
+        """
+        if fingerprint is None:
+            return
+        with self._lock:
+            self._entries.pop(project, None)
+            self._entries[project] = (fingerprint, time.monotonic(), list(rows))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+def memoize_rows(
+    *,
+    ttl: float | None = None,
+    max_entries: int = 4096,
+    extra_fingerprint: Callable[[Project], Any] | None = None,
+) -> Callable[[_F], _F]:
+    """Memoize a `Column.populate_rows` function, by project fingerprint.
+
+    Rows are computed again only when the project's HEAD, references or index changed
+    (see `Project.fingerprint`), when the optional extra fingerprint data changed,
+    or when cached rows expired. Changes in the working tree are not detected:
+    only memoize functions which don't depend on them, or use a short time-to-live.
+
+    The cache lives in the main process. When rows are populated in a pool of processes,
+    cached rows are used directly and only projects that changed are sent to workers.
+    It is available as the `rows_cache` attribute of the decorated function.
+
+    Both regular and coroutine functions can be decorated.
+    Apply this decorator below `@staticmethod`.
+
+    Parameters:
+        ttl: Maximum age of cached rows, in seconds. No limit by default.
+        max_entries: Maximum number of cached projects.
+        extra_fingerprint: A function returning additional data to include in project fingerprints,
+            for example the modification time of a file the rows depend on.
+
+    Returns:
+        A decorator.
+    """
+
+    def decorator(func: _F) -> _F:
+        cache = RowsCache(ttl=ttl, max_entries=max_entries, extra_fingerprint=extra_fingerprint)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(project: Project) -> list[tuple[Any, ...]]:
+                fingerprint = cache.fingerprint(project)
+                if (rows := cache.get(project, fingerprint)) is None:
+                    rows = await func(project)
+                    cache.set(project, fingerprint, rows)
+                return rows
+
+            wrapper: Any = async_wrapper
+        else:
+
+            @functools.wraps(func)
+            def wrapper(project: Project) -> list[tuple[Any, ...]]:
+                fingerprint = cache.fingerprint(project)
+                if (rows := cache.get(project, fingerprint)) is None:
+                    rows = func(project)
+                    cache.set(project, fingerprint, rows)
+                return rows
+
+        wrapper.rows_cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any
+
+from devboard._internal.app import _default_config_file, _load_board
+from devboard._internal.board import Column, ErrorCell
+from devboard._internal.daemon import _row_project
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from devboard._internal.projects import Project
+
+_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+"""Content type of OpenMetrics responses."""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _scan_column(column: Column) -> tuple[list[Project], list[tuple[Any, ...]], dict[str, float]]:
+    # Populate a column without the user interface, returning its projects, rows, and durations of each phase.
+    start = time.perf_counter()
+    projects = list(column.list_projects())
+    listed = time.perf_counter()
+    if inspect.iscoroutinefunction(column.populate_rows):
+        rows = asyncio.run(column._populate_async(projects))
+    else:
+        rows = column._populate(None, projects)
+    return projects, rows, {"list": listed - start, "populate": time.perf_counter() - listed}
+
+
+class _ColumnScan:
+    # Results of the last scan of a column.
+    def __init__(self) -> None:
+        self.rows: dict[Project | None, int] = {}
+        self.errors = 0
+        self.values: dict[tuple[Project, str], float] = {}
+        self.durations: dict[str, float] = {}
+
+
+class MetricsExporter:
+    """An exporter of board metrics in the OpenMetrics format, for Prometheus or other monitoring systems.
+
+    Columns are instantiated and populated without the user interface.
+    Memoized columns (see `memoize_rows`) reuse their cached rows across scans,
+    and metrics are computed once per scan, not once per scrape.
+
+    Exported metrics:
+
+    - `devboard_column_rows`: number of rows per column;
+    - `devboard_column_errors`: number of projects that failed per column;
+    - `devboard_project_rows`: number of rows per column and project;
+    - `devboard_project_value`: sum of numeric cells (such as numbers of commits)
+      per column, project and header;
+    - `devboard_scan_duration_seconds`: duration of scan phases
+      (`list` for `list_projects`, `populate` for `populate_rows`) per column;
+    - `devboard_last_scan_timestamp_seconds`: when the last scan finished.
+    """
+
+    def __init__(self, columns: Iterable[Column | type[Column]], *, interval: float = 60.0) -> None:
+        """Initialize the exporter.
+
+        Parameters:
+            columns: The columns of the board, as instances or classes.
+            interval: Interval between scans, in seconds.
+        """
+        self.columns: list[Column] = [column if isinstance(column, Column) else column() for column in columns]
+        """The columns of the board."""
+        self.interval = interval
+        """Interval between scans, in seconds."""
+        self._scans: dict[str, _ColumnScan] = {}
+        self._last_scan: float | None = None
+        self._lock = Lock()
+
+    def scan(self) -> None:
+        """Populate all columns, one after the other, and record their metrics."""
+        scans = {}
+        for column in self.columns:
+            scan = _ColumnScan()
+            projects, rows, scan.durations = _scan_column(column)
+            scan.rows = dict.fromkeys(projects, 0)
+            for row in rows:
+                project = _row_project(row)
+                if any(isinstance(value, ErrorCell) for value in row):
+                    scan.errors += 1
+                    continue
+                scan.rows[project] = scan.rows.get(project, 0) + 1
+                if project is None:
+                    continue
+                for header, value in zip(column.HEADERS, row):
+                    if _is_number(value):
+                        scan.values[project, header] = scan.values.get((project, header), 0) + value
+            scans[column.TITLE or type(column).__name__] = scan
+        with self._lock:
+            self._scans = scans
+            self._last_scan = time.time()
+
+    def render(self) -> str:
+        """Render metrics of the last scan.
+
+        Returns:
+            Metrics in the OpenMetrics text format.
+        """
+        with self._lock:
+            scans, last_scan = self._scans, self._last_scan
+        lines = [
+            "# TYPE devboard_column_rows gauge",
+            "# HELP devboard_column_rows Number of rows per column.",
+        ]
+        lines.extend(
+            f"devboard_column_rows{{{_labels(column=name)}}} {sum(scan.rows.values())}" for name, scan in scans.items()
+        )
+        lines.append("# TYPE devboard_column_errors gauge")
+        lines.append("# HELP devboard_column_errors Number of projects that failed per column.")
+        lines.extend(f"devboard_column_errors{{{_labels(column=name)}}} {scan.errors}" for name, scan in scans.items())
+        lines.append("# TYPE devboard_project_rows gauge")
+        lines.append("# HELP devboard_project_rows Number of rows per column and project.")
+        for name, scan in scans.items():
+            for project, count in scan.rows.items():
+                if project is not None:
+                    labels = _labels(column=name, project=project.name, path=str(project.path))
+                    lines.append(f"devboard_project_rows{{{labels}}} {count}")
+        lines.append("# TYPE devboard_project_value gauge")
+        lines.append("# HELP devboard_project_value Sum of numeric cells per column, project and header.")
+        for name, scan in scans.items():
+            for (project, header), value in scan.values.items():
+                labels = _labels(column=name, project=project.name, path=str(project.path), header=header)
+                lines.append(f"devboard_project_value{{{labels}}} {value}")
+        lines.append("# TYPE devboard_scan_duration_seconds gauge")
+        lines.append("# UNIT devboard_scan_duration_seconds seconds")
+        lines.append("# HELP devboard_scan_duration_seconds Duration of scan phases per column.")
+        for name, scan in scans.items():
+            for phase, duration in scan.durations.items():
+                lines.append(f"devboard_scan_duration_seconds{{{_labels(column=name, phase=phase)}}} {duration:.6f}")
+        if last_scan is not None:
+            lines.append("# TYPE devboard_last_scan_timestamp_seconds gauge")
+            lines.append("# UNIT devboard_last_scan_timestamp_seconds seconds")
+            lines.append("# HELP devboard_last_scan_timestamp_seconds When the last scan finished.")
+            lines.append(f"devboard_last_scan_timestamp_seconds {last_scan:.3f}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | Path) -> None:
+        """Write metrics of the last scan to a file, atomically, for example for node_exporter's textfile collector.
+
+        Parameters:
+            path: The file path.
+        """
+        path = Path(path)
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(self.render(), encoding="utf8")
+        tmp_file.replace(path)
+
+    def run(self, *, port: int | None = None, host: str = "127.0.0.1", textfile: str | Path | None = None) -> None:
+        """Scan columns periodically, serving metrics over HTTP and/or writing them to a file, until interrupted.
+
+        Parameters:
+            port: The port on which to serve metrics over HTTP.
+            host: The address on which to serve metrics over HTTP. Only localhost by default.
+            textfile: A file to write metrics to after each scan.
+        """
+        server = None
+        if port is not None:
+            server = ThreadingHTTPServer((host, port), self._handler())
+            Thread(target=server.serve_forever, name="devboard-metrics", daemon=True).start()
+        try:
+            while True:
+                start = time.monotonic()
+                self.scan()
+                if textfile is not None:
+                    self.write_textfile(textfile)
+                time.sleep(max(0, self.interval - (time.monotonic() - start)))
+        finally:
+            if server is not None:
+                server.shutdown()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in {"/", "/metrics"}:
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", _CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
+
+
+def export_metrics(
+    board: str | Path | None = None,
+    *,
+    port: int | None = None,
+    textfile: str | Path | None = None,
+    interval: float = 60.0,
+) -> int:
+    """Export metrics of a board until interrupted. See `MetricsExporter`.
+
+    Parameters:
+        board: The board name or path. By default, the configured board.
+        port: The port on which to serve metrics over HTTP, on localhost.
+        textfile: A file to write metrics to after each scan.
+        interval: Interval between scans, in seconds.
+
+    Returns:
+        An exit code.
+    """
+    exporter = MetricsExporter(_load_board(board, _default_config_file()), interval=interval)
+    with contextlib.suppress(KeyboardInterrupt):
+        exporter.run(port=port, textfile=textfile)
+    return 0
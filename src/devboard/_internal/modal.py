@@ -7,7 +7,12 @@ from textual.containers import VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import Static
 
+from devboard._internal.pager import Pager
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
     from textual.app import App, ComposeResult
     from textual.events import Key
 
@@ -35,7 +40,7 @@ class Modal(ModalScreen):
 
 
 class ModalMixin:
-    """Mixin class to add a modal method."""
+    """Mixin class to add modal methods."""
 
     app: App
     """Textual application."""
@@ -43,3 +48,18 @@ class ModalMixin:
     def modal(self, text: str) -> None:
         """Push a modal."""
         self.app.push_screen(Modal(text=text))
+
+    def pager(
+        self,
+        command: Sequence[str] | None = None,
+        *,
+        output: bytes | None = None,
+        cwd: str | Path | None = None,
+        title: str = "",
+    ) -> None:
+        """Push a pager showing the output of a command, read and rendered lazily.
+
+        Prefer it over `modal` for potentially large outputs, like diffs.
+        Already computed output can be passed instead of a command.
+        """
+        self.app.push_screen(Pager(command, output=output, cwd=cwd, title=title))
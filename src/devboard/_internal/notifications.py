@@ -1,24 +1,247 @@
-from textual.app import App
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import TYPE_CHECKING, ClassVar
+
+from rich.errors import MarkupError
+from rich.text import Text
+from textual.containers import Horizontal
+from textual.widgets import Label, ProgressBar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from textual.app import App
+    from textual.timer import Timer
+
+_current = local()
+"""Bulk operation of the current thread, set by `BulkOperation.item`."""
+
+
+class BulkOperation:
+    """An action applied to many rows, reported by a progress bar, then by a single notification.
+
+    Notifications of individual actions, sent from `NotifyMixin` methods while the operation
+    is running, are logged instead of shown. Errors are still shown, at most once per `ERROR_INTERVAL`.
+    Logs of recent operations are kept in `history`.
+    """
+
+    PROGRESS_INTERVAL: ClassVar[float] = 0.5
+    """Interval between updates of the progress bar, in seconds."""
+    ERROR_INTERVAL: ClassVar[float] = 2.0
+    """Minimum interval between error notifications, in seconds."""
+    history: ClassVar[deque[BulkOperation]] = deque(maxlen=20)
+    """Recent operations, most recent last."""
+
+    def __init__(self, title: str, total: int) -> None:
+        """Initialize the operation.
+
+        Parameters:
+            title: The title of the operation, shown in notifications.
+            total: The number of items (rows) to process.
+        """
+        self.title = title
+        """The title of the operation."""
+        self.total = total
+        """The number of items to process."""
+        self.done = 0
+        """The number of items processed successfully."""
+        self.failed = 0
+        """The number of items that failed or were skipped."""
+        self.log: list[tuple[float, str, str]] = []
+        """Time, severity and message of each notification sent during the operation."""
+        self.started = time.monotonic()
+        """When the operation started (monotonic clock)."""
+        self.ended: float | None = None
+        """When the last item was processed (monotonic clock)."""
+        self._lock = Lock()
+        self._last_error = float("-inf")
+        self._label: Label | None = None
+        self._bar: ProgressBar | None = None
+        self._panel: Horizontal | None = None
+        self._timer: Timer | None = None
+        self._app: App | None = None
+
+    @property
+    def remaining(self) -> int:
+        """The number of items not processed yet."""
+        return self.total - self.done - self.failed
+
+    @property
+    def finished(self) -> bool:
+        """Whether all items were processed."""
+        return self.remaining <= 0
+
+    @property
+    def throughput(self) -> float:
+        """The number of items processed per second."""
+        elapsed = (self.ended or time.monotonic()) - self.started
+        return (self.done + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """Return a summary of the progress of the operation."""
+        return f"{self.done} done, {self.failed} failed, {self.remaining} remaining ({self.throughput:.1f}/s)"
+
+    def record(self, severity: str, message: str) -> bool:
+        """Record a notification in the log.
+
+        Parameters:
+            severity: The severity of the notification (`info`, `success`, `warning` or `error`).
+            message: The message.
+
+        Returns:
+            Whether the notification should be shown anyway (rate-limited errors).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.log.append((time.time(), severity, message))
+            if severity in {"warning", "error"}:
+                _current.failed = True
+            if severity == "error" and now - self._last_error >= self.ERROR_INTERVAL:
+                self._last_error = now
+                return True
+        return False
+
+    @contextmanager
+    def item(self) -> Iterator[None]:
+        """Process an item: notifications sent in the current thread are recorded by this operation.
+
+        The item counts as failed if a warning or error was notified, or if an exception was raised.
+        """
+        _current.operation, _current.failed = self, False
+        try:
+            yield
+        except Exception as error:
+            self.record("error", str(error) or error.__class__.__name__)
+            raise
+        finally:
+            self._count(failed=_current.failed)
+            _current.operation = None
+
+    def skip(self, message: str) -> None:
+        """Count an item as failed without processing it.
+
+        Parameters:
+            message: The reason why the item is skipped, recorded as a warning.
+        """
+        with self._lock:
+            self.log.append((time.time(), "warning", message))
+        self._count(failed=True)
+
+    def _count(self, *, failed: bool) -> None:
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.done += 1
+            if self.finished:
+                self.ended = time.monotonic()
+
+    def start(self, app: App) -> None:
+        """Show a progress bar at the bottom of the screen, updated periodically until the operation finishes.
+
+        Parameters:
+            app: The Textual application.
+        """
+        self._app = app
+        self.history.append(self)
+        if not self.finished:
+            self._label = Label()
+            self._bar = ProgressBar(total=self.total, show_eta=False)
+            self._panel = Horizontal(self._label, self._bar)
+            self._panel.styles.dock = "bottom"
+            self._panel.styles.height = 1
+            app.screen.mount(self._panel)
+            self._timer = app.set_interval(self.PROGRESS_INTERVAL, self.refresh)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Update the progress bar, or replace it with a final notification. Must be called from the UI thread."""
+        if self._app is None:
+            return
+        if not self.finished:
+            if self._label is not None and self._bar is not None:
+                self._label.update(f"[b blue]PROGRESS[/]  {self.title}: {self.summary()}  ")
+                self._bar.update(progress=self.done + self.failed)
+            return
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._panel is not None:
+            self._panel.remove()
+            self._panel = None
+        if self.failed:
+            message = f"[b red]FAILED[/]  {self.title}: {self.summary()}. Press [b]L[/] to show the log."
+            self._app.notify(message, severity="error", timeout=10)
+        else:
+            self._app.notify(f"[b green]SUCCESS[/]  {self.title}: {self.summary()}", timeout=3)
+        # Reported: further refreshes are no-ops.
+        self._app = None
+
+    def render_log(self) -> Text:
+        """Render the log of the operation.
+
+        Returns:
+            A title line followed by a line per notification.
+        """
+        text = Text.from_markup(f"[b]{self.title}[/]: {self.summary()}\n")
+        styles = {"info": "blue", "success": "green", "warning": "yellow", "error": "red"}
+        for timestamp, severity, message in self.log:
+            text.append(time.strftime("%H:%M:%S", time.localtime(timestamp)), style="dim")
+            text.append(f"  {severity.upper():<8}", style=f"b {styles[severity]}")
+            try:
+                text.append_text(Text.from_markup(message))
+            except MarkupError:
+                text.append(message)
+            text.append("\n")
+        return text
 
 
 class NotifyMixin:
-    """Mixin class to add notify methods."""
+    """Mixin class to add notify methods.
+
+    When called from an item of a running `BulkOperation`, notifications are recorded by the operation.
+    """
 
     app: App
     """Textual application."""
 
+    def _notify(self, severity: str, message: str, label: str, timeout: float) -> None:
+        operation: BulkOperation | None = getattr(_current, "operation", None)
+        if operation is not None and not operation.record(severity, message):
+            return
+        level = {"info": "information", "success": "information"}.get(severity, severity)
+        self.app.notify(f"{label}  {message}", severity=level, timeout=timeout)  # type: ignore[arg-type]
+
     def notify_info(self, message: str, timeout: float = 3.0) -> None:
         """Notify information."""
-        self.app.notify(f"[b blue]INFO[/]  {message}", severity="information", timeout=timeout)
+        self._notify("info", message, "[b blue]INFO[/]", timeout)
 
     def notify_success(self, message: str, timeout: float = 3.0) -> None:
         """Notify success."""
-        self.app.notify(f"[b green]SUCCESS[/]  {message}", severity="information", timeout=timeout)
+        self._notify("success", message, "[b green]SUCCESS[/]", timeout)
 
     def notify_warning(self, message: str, timeout: float = 3.0) -> None:
         """Notify warning."""
-        self.app.notify(f"[b yellow]WARNING[/]  {message}", severity="warning", timeout=timeout)
+        self._notify("warning", message, "[b yellow]WARNING[/]", timeout)
 
     def notify_error(self, message: str, timeout: float = 3.0) -> None:
         """Notify error."""
-        self.app.notify(f"[b red]ERROR[/]  {message}", severity="error", timeout=timeout)
+        self._notify("error", message, "[b red]ERROR[/]", timeout)
+
+    def start_operation(self, title: str, total: int) -> BulkOperation:
+        """Start a bulk operation, showing its progress in a progress bar. Must be called from the UI thread.
+
+        Parameters:
+            title: The title of the operation.
+            total: The number of items to process.
+
+        Returns:
+            The operation. Process each item within its `item` context.
+        """
+        operation = BulkOperation(title, total)
+        operation.start(self.app)
+        return operation
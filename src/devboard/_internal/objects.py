@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import zlib
+from collections import OrderedDict
+from heapq import heappop, heappush
+from itertools import count
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from devboard._internal.refs import _git_dirs, _is_racy
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+"""Types of non-delta objects in packs."""
+_OFS_DELTA = 6
+_REF_DELTA = 7
+_INDEX_HEADER = b"\377tOc\0\0\0\2"
+"""Header of version 2 pack indexes."""
+_CHUNK_SIZE = 4096
+"""Size of compressed data fed to zlib at once, in bytes."""
+_CACHE_BYTES = 32 * 1024 * 1024
+"""Maximum size of decompressed objects kept in memory, across repositories, in bytes."""
+
+_PACKS: dict[str, tuple[int, list[_Pack]]] = {}
+"""Memory-mapped packs, keyed by pack directory: modification time and packs."""
+_OBJECTS: OrderedDict[tuple[str, int], tuple[str, bytes]] = OrderedDict()
+"""Decompressed packed objects, keyed by pack path and offset, least recently used first."""
+_objects_size = 0
+"""Total size of decompressed objects in `_OBJECTS`."""
+_OBJECTS_LOCK = Lock()
+
+
+def _inflate(data: mmap.mmap | bytes, offset: int, size: int) -> bytes:
+    # Decompress a zlib stream starting at the given offset, whose length is unknown.
+    decompressor = zlib.decompressobj()
+    chunks = []
+    chunk_size = max(_CHUNK_SIZE, size)
+    while not decompressor.eof:
+        chunk = data[offset : offset + chunk_size]
+        if not chunk:
+            raise ValueError("Truncated object")
+        chunks.append(decompressor.decompress(chunk))
+        offset += chunk_size
+    result = b"".join(chunks)
+    if len(result) != size:
+        raise ValueError("Corrupt object: unexpected size")
+    return result
+
+
+def _varint(data: bytes, position: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    base_size, position = _varint(delta, 0)
+    if base_size != len(base):
+        raise ValueError("Corrupt delta: unexpected base size")
+    size, position = _varint(delta, position)
+    result = bytearray()
+    while position < len(delta):
+        instruction = delta[position]
+        position += 1
+        if instruction & 0x80:
+            # Copy from the base: bits 0-3 tell which offset bytes follow, bits 4-6 which size bytes.
+            offset = length = 0
+            for bit in range(4):
+                if instruction & (1 << bit):
+                    offset |= delta[position] << (8 * bit)
+                    position += 1
+            for bit in range(3):
+                if instruction & (0x10 << bit):
+                    length |= delta[position] << (8 * bit)
+                    position += 1
+            result += base[offset : offset + (length or 0x10000)]
+        elif instruction:
+            # Insert the next bytes.
+            result += delta[position : position + instruction]
+            position += instruction
+        else:
+            raise ValueError("Corrupt delta: invalid instruction")
+    if len(result) != size:
+        raise ValueError("Corrupt delta: unexpected size")
+    return bytes(result)
+
+
+def _parse_commit(data: bytes) -> tuple[list[str], int, str]:
+    # Return parents, committer timestamp and subject (first line of the message) of a commit.
+    headers, _, message = data.partition(b"\n\n")
+    parents = []
+    timestamp = 0
+    for line in headers.split(b"\n"):
+        # Continuation lines of multi-line headers (like signatures) start with a space.
+        if line.startswith(b"parent "):
+            parents.append(line[7:].decode())
+        elif line.startswith(b"committer "):
+            timestamp = int(line.rsplit(b" ", 2)[1])
+    return parents, timestamp, message.split(b"\n", 1)[0].decode("utf8", errors="replace")
+
+
+class _Pack:
+    # A memory-mapped pack and its (version 2) index.
+    def __init__(self, index_path: str) -> None:
+        self.path = index_path[: -len(".idx")] + ".pack"
+        with open(index_path, "rb") as file:
+            self.index = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.index[:8] != _INDEX_HEADER:
+            raise ValueError(f"Unsupported pack index: {index_path}")
+        with open(self.path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count = self._fanout(255)
+        self._shas = 8 + 256 * 4
+        self._offsets = self._shas + self.count * 24  # SHAs, then CRC32s.
+        self._large_offsets = self._offsets + self.count * 4
+
+    def _fanout(self, byte: int) -> int:
+        # Number of objects whose first SHA byte is lower than or equal to the given one.
+        start = 8 + byte * 4
+        return int.from_bytes(self.index[start : start + 4], "big")
+
+    def find(self, sha: bytes) -> int | None:
+        # Return the offset of an object in the pack, by binary search in the index.
+        low = self._fanout(sha[0] - 1) if sha[0] else 0
+        high = self._fanout(sha[0])
+        while low < high:
+            middle = (low + high) // 2
+            start = self._shas + middle * 20
+            current = self.index[start : start + 20]
+            if current < sha:
+                low = middle + 1
+            elif current > sha:
+                high = middle
+            else:
+                start = self._offsets + middle * 4
+                offset = int.from_bytes(self.index[start : start + 4], "big")
+                if offset & 0x80000000:
+                    start = self._large_offsets + (offset & 0x7FFFFFFF) * 8
+                    offset = int.from_bytes(self.index[start : start + 8], "big")
+                return offset
+        return None
+
+
+def _scan_packs(pack_dir: str) -> list[_Pack]:
+    # Git adds and removes packs by renaming and deleting files,
+    # which updates the directory's modification time: we can cache on it.
+    try:
+        mtime_ns = os.stat(pack_dir).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if (cached := _PACKS.get(pack_dir)) and cached[0] == mtime_ns:
+        return cached[1]
+    with os.scandir(pack_dir) as entries:
+        index_files = sorted(entry.path for entry in entries if entry.name.endswith(".idx"))
+    packs = [_Pack(index_file) for index_file in index_files]
+    if not _is_racy(mtime_ns):
+        _PACKS[pack_dir] = (mtime_ns, packs)
+    return packs
+
+
+def _cache_object(key: tuple[str, int], obj: tuple[str, bytes]) -> None:
+    global _objects_size  # noqa: PLW0603
+    with _OBJECTS_LOCK:
+        if key not in _OBJECTS:
+            _OBJECTS[key] = obj
+            _objects_size += len(obj[1])
+        while _objects_size > _CACHE_BYTES and _OBJECTS:
+            _, (_, data) = _OBJECTS.popitem(last=False)
+            _objects_size -= len(data)
+
+
+class ObjectReader:
+    """Git objects of a repository, read directly from the file-system.
+
+    Packs and their indexes are memory-mapped, and objects (loose or packed, deltified or not)
+    are inflated with zlib, without spawning Git or instantiating GitPython objects.
+    Packs are cached by modification time of their directory, and decompressed objects
+    in a least-recently-used cache shared by all readers.
+
+    Only SHA-1 repositories and version 2 pack indexes (the default since Git 1.5.2) are supported.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the reader.
+
+        Parameters:
+            path: Path to the repository (working tree or bare repository).
+
+        Raises:
+            ValueError: When the repository uses SHA-256 object names.
+        """
+        self.git_dir, self.common_dir = _git_dirs(Path(path))
+        config = self.common_dir / "config"
+        if config.is_file() and re.search(r"objectformat\s*=\s*sha256", config.read_text(encoding="utf8"), re.I):
+            raise ValueError(f"SHA-256 repositories are not supported: {path}")
+        self.object_dirs = [self.common_dir / "objects"]
+        """Object directories: the repository's, and its alternates."""
+        alternates = self.common_dir / "objects" / "info" / "alternates"
+        if alternates.is_file():
+            for line in alternates.read_text(encoding="utf8").splitlines():
+                if line and not line.startswith("#"):
+                    self.object_dirs.append(self.object_dirs[0] / line.strip())
+        shallow = self.common_dir / "shallow"
+        self.shallow = set(shallow.read_text(encoding="utf8").split()) if shallow.is_file() else set()
+        """Commits of a shallow clone whose parents are missing."""
+
+    def read(self, sha: str) -> tuple[str, bytes]:
+        """Read an object.
+
+        Parameters:
+            sha: The object SHA.
+
+        Raises:
+            KeyError: When the object does not exist.
+
+        Returns:
+            The object type (`commit`, `tree`, `blob` or `tag`) and its content.
+        """
+        binary = bytes.fromhex(sha)
+        for object_dir in self.object_dirs:
+            for pack in _scan_packs(str(object_dir / "pack")):
+                if (offset := pack.find(binary)) is not None:
+                    return self._read_packed(pack, offset)
+        for object_dir in self.object_dirs:
+            try:
+                with open(object_dir / sha[:2] / sha[2:], "rb") as file:
+                    data = zlib.decompress(file.read())
+            except FileNotFoundError:
+                continue
+            header, _, content = data.partition(b"\0")
+            return header.split(b" ", 1)[0].decode(), content
+        raise KeyError(sha)
+
+    def _read_packed(self, pack: _Pack, offset: int) -> tuple[str, bytes]:
+        key = (pack.path, offset)
+        with _OBJECTS_LOCK:
+            if (cached := _OBJECTS.get(key)) is not None:
+                _OBJECTS.move_to_end(key)
+                return cached
+        data = pack.data
+        # Header: type in bits 4-6 of the first byte, size in variable-length little-endian groups.
+        byte = data[offset]
+        position = offset + 1
+        kind, size, shift = (byte >> 4) & 7, byte & 0x0F, 4
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            size |= (byte & 0x7F) << shift
+            shift += 7
+        if kind == _OFS_DELTA:
+            # Base offset, relative to this object, in variable-length big-endian groups.
+            byte = data[position]
+            position += 1
+            relative = byte & 0x7F
+            while byte & 0x80:
+                byte = data[position]
+                position += 1
+                relative = ((relative + 1) << 7) | (byte & 0x7F)
+            base_type, base = self._read_packed(pack, offset - relative)
+            obj = base_type, _apply_delta(base, _inflate(data, position, size))
+        elif kind == _REF_DELTA:
+            base_type, base = self.read(data[position : position + 20].hex())
+            obj = base_type, _apply_delta(base, _inflate(data, position + 20, size))
+        elif kind in _OBJECT_TYPES:
+            obj = _OBJECT_TYPES[kind], _inflate(data, position, size)
+        else:
+            raise ValueError(f"Invalid object type {kind} in {pack.path}")
+        _cache_object(key, obj)
+        return obj
+
+    def peel(self, sha: str) -> str:
+        """Return the SHA of the object pointed at by a tag, following nested tags.
+
+        Parameters:
+            sha: The SHA of a tag object, or of any other object (returned as is).
+
+        Returns:
+            The SHA of the first non-tag object.
+        """
+        kind, content = self.read(sha)
+        while kind == "tag":
+            sha = content[7:47].decode()  # First header: `object <sha>`.
+            kind, content = self.read(sha)
+        return sha
+
+    def commit(self, sha: str) -> tuple[list[str], int, str]:
+        """Read a commit.
+
+        Parameters:
+            sha: The commit SHA.
+
+        Raises:
+            ValueError: When the object is not a commit.
+
+        Returns:
+            The parents SHAs, the committer timestamp, and the subject (first line of the message).
+        """
+        kind, content = self.read(sha)
+        if kind != "commit":
+            raise ValueError(f"Not a commit: {sha}")
+        parents, timestamp, subject = _parse_commit(content)
+        return ([] if sha in self.shallow else parents), timestamp, subject
+
+    def walk(self, start: str, *, until: str | None = None, first_parent: bool = False) -> Iterator[tuple[str, str]]:
+        """Walk the history of a commit, most recent commits first (by committer date), like `git log`.
+
+        Parameters:
+            start: The SHA of the commit to start from.
+            until: The SHA of a commit at which to stop (excluded), like when iterating on `git log` and breaking.
+            first_parent: Whether to follow only the first parent of merge commits.
+
+        Yields:
+            The SHA and subject of each commit.
+        """
+        order = count()
+        parents, timestamp, subject = self.commit(start)
+        queue = [(-timestamp, next(order), start, parents, subject)]
+        seen = {start}
+        while queue:
+            _, _, sha, parents, subject = heappop(queue)
+            if sha == until:
+                return
+            yield sha, subject
+            for parent in parents[:1] if first_parent else parents:
+                if parent not in seen:
+                    seen.add(parent)
+                    parent_parents, timestamp, parent_subject = self.commit(parent)
+                    heappush(queue, (-timestamp, next(order), parent, parent_parents, parent_subject))
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import io
+import os
+import re
+import subprocess
+import tempfile
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import partial
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from rich.text import Text
+from textual import work
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.screen import ModalScreen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from textual.app import ComposeResult
+
+_ANSI = re.compile(rb"\x1b\[[0-9;]*m")
+_FILE_HEADER = b"diff --git "
+_CACHED_LINES = 512
+"""Number of parsed lines to keep in memory."""
+_REFRESH_INTERVAL = 0.1
+"""Minimum interval between two display updates while output is being read, in seconds."""
+
+
+class PagerView(ScrollView):
+    """A scrollable view of a command output, read and parsed lazily.
+
+    The command output is spooled to a temporary file while it is read,
+    and only the offsets of lines are kept in memory. ANSI sequences
+    are parsed only for the lines being displayed, so that huge outputs
+    can be shown instantly.
+    """
+
+    BINDINGS: ClassVar = [
+        Binding("space", "page_down", "Page down", show=False),
+        Binding("b", "page_up", "Page up", show=False),
+        Binding("g", "scroll_home", "Top", show=False),
+        Binding("G", "scroll_end", "Bottom", show=False),
+        Binding("n, right_square_bracket", "next_file", "Next file"),
+        Binding("N, left_square_bracket", "previous_file", "Previous file"),
+    ]
+    """Key bindings for paging."""
+
+    def __init__(
+        self,
+        command: Sequence[str] | None = None,
+        *,
+        output: bytes | None = None,
+        cwd: str | Path | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the view.
+
+        Parameters:
+            command: The command to run.
+            output: Output to show instead of running a command, for example when it was prefetched.
+            cwd: The directory to run the command in.
+            **kwargs: Additional arguments passed to the parent class.
+        """
+        super().__init__(**kwargs)
+        self.command = list(command or ())
+        """The command to run."""
+        self.output = output
+        """Output to show instead of running a command."""
+        self.cwd = cwd
+        """The directory to run the command in."""
+        self.complete = False
+        """Whether the command output was entirely read."""
+        self._file = tempfile.TemporaryFile()  # noqa: SIM115
+        self._lock = Lock()
+        self._line_offsets = array("Q", [0])
+        self._file_starts: list[int] = []
+        self._max_width = 0
+        self._strips: OrderedDict[int, Strip] = OrderedDict()
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines read so far."""
+        return len(self._line_offsets) - 1
+
+    def on_mount(self) -> None:
+        """Start reading the command output."""
+        self._read_output()
+
+    def on_unmount(self) -> None:
+        """Delete the temporary file, stopping the command if it's still running."""
+        with self._lock:
+            self._file.close()
+
+    @work(thread=True, exit_on_error=False)
+    def _read_output(self) -> None:
+        process = None
+        read: Callable[[int], bytes]
+        if self.output is not None:
+            read = io.BytesIO(self.output).read
+        else:
+            process = subprocess.Popen(  # noqa: S603
+                self.command,
+                cwd=self.cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+            assert process.stdout is not None  # noqa: S101
+            read = partial(os.read, process.stdout.fileno())
+        position = 0
+        pending = b""
+        last_refresh = 0.0
+        try:
+            while chunk := read(65536):
+                with self._lock:
+                    if self._file.closed:
+                        if process is not None:
+                            process.kill()
+                        return
+                    self._file.seek(0, os.SEEK_END)
+                    self._file.write(chunk)
+                position += len(chunk)
+                *lines, pending = (pending + chunk).split(b"\n")
+                self._index_lines(lines, position - len(pending))
+                if (now := time.monotonic()) - last_refresh > _REFRESH_INTERVAL:
+                    last_refresh = now
+                    self.app.call_from_thread(self._update_size)
+        finally:
+            if process is not None:
+                process.wait()
+        if pending:
+            with self._lock:
+                if self._file.closed:
+                    return
+                self._file.seek(0, os.SEEK_END)
+                self._file.write(b"\n")
+            self._index_lines([pending], position + 1)
+        self.complete = True
+        self.app.call_from_thread(self._update_size)
+
+    def _index_lines(self, lines: list[bytes], end: int) -> None:
+        # Record offsets of complete lines, given the offset of the end of the last one.
+        offset = end - sum(len(line) + 1 for line in lines)
+        for line in lines:
+            if _FILE_HEADER in line[:32] and _ANSI.sub(b"", line).startswith(_FILE_HEADER):
+                self._file_starts.append(self.line_count)
+            offset += len(line) + 1
+            self._line_offsets.append(offset)
+            width = len(_ANSI.sub(b"", line)) if b"\x1b" in line else len(line)
+            self._max_width = max(self._max_width, width)
+
+    def _update_size(self) -> None:
+        self.virtual_size = Size(self._max_width, self.line_count)
+        self.refresh()
+        status = "" if self.complete else " (loading...)"
+        self.border_subtitle = f"{self.line_count} lines{status} - SPACE/B: page down/up, N/SHIFT-N: next/previous file"
+
+    def _line(self, index: int) -> bytes:
+        start, end = self._line_offsets[index], self._line_offsets[index + 1]
+        with self._lock:
+            self._file.seek(start)
+            return self._file.read(end - start - 1)
+
+    def render_line(self, y: int) -> Strip:
+        """Render a line, parsing its ANSI sequences if not already cached."""
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.scrollable_content_region.width
+        if index >= self.line_count or self._file.closed:
+            return Strip.blank(width, self.rich_style)
+        if (strip := self._strips.get(index)) is None:
+            text = Text.from_ansi(self._line(index).decode("utf8", errors="replace"), no_wrap=True, end="")
+            text.expand_tabs()
+            strip = Strip(text.render(self.app.console), text.cell_len)
+            self._strips[index] = strip
+            if len(self._strips) > _CACHED_LINES:
+                self._strips.popitem(last=False)
+        else:
+            self._strips.move_to_end(index)
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style)
+
+    def action_next_file(self) -> None:
+        """Scroll to the next file of a diff."""
+        position = bisect_right(self._file_starts, self.scroll_offset.y)
+        if position < len(self._file_starts):
+            self.scroll_to(y=self._file_starts[position], animate=False)
+
+    def action_previous_file(self) -> None:
+        """Scroll to the previous file of a diff."""
+        position = bisect_left(self._file_starts, self.scroll_offset.y)
+        if position > 0:
+            self.scroll_to(y=self._file_starts[position - 1], animate=False)
+
+
+class Pager(ModalScreen):
+    """A modal screen showing the output of a command in a `PagerView`."""
+
+    BINDINGS: ClassVar = [
+        Binding("escape, q", "dismiss", "Close"),
+    ]
+    """Key bindings for the pager."""
+
+    def __init__(
+        self,
+        command: Sequence[str] | None = None,
+        *,
+        output: bytes | None = None,
+        cwd: str | Path | None = None,
+        title: str = "",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the screen.
+
+        Parameters:
+            command: The command to run.
+            output: Output to show instead of running a command.
+            cwd: The directory to run the command in.
+            title: A title for the pager.
+            **kwargs: Additional arguments passed to the parent class.
+        """
+        super().__init__(**kwargs)
+        self.view = PagerView(command, output=output, cwd=cwd, id="modal-contents")
+        """The pager view."""
+        self.view.border_title = title
+
+    def compose(self) -> ComposeResult:
+        """Screen composition."""
+        yield self.view
+
+    def on_mount(self) -> None:
+        """Focus the view."""
+        self.view.focus()
@@ -1,36 +1,231 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import os
 import re
+import subprocess
+import zlib
 from collections import defaultdict
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from threading import Lock
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from git import Commit, GitCommandError, Head, Repo, TagReference
 
+from devboard._internal.asyncgit import _run_git_bytes, run_git
+from devboard._internal.objects import ObjectReader
+from devboard._internal.refs import Refs
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator
+
+
+_STATUS_KINDS = ("added", "deleted", "modified", "renamed", "typechanged", "untracked")
+_STATUS_CODES = {ord("A"): 0, ord("D"): 1, ord("M"): 2, ord("R"): 3, ord("T"): 4}
+"""Indices of kinds in `_STATUS_KINDS`, by porcelain status code."""
+_UNTRACKED = _STATUS_KINDS.index("untracked")
 
 
-@dataclass
 class Status:
-    """Git status data."""
-
-    added: list[Path]
-    """Added files."""
-    deleted: list[Path]
-    """Deleted files."""
-    modified: list[Path]
-    """Modified files."""
-    renamed: list[Path]
-    """Renamed files."""
-    typechanged: list[Path]
-    """Type-changed files."""
-    untracked: list[Path]
-    """Untracked files."""
+    """Git status data.
+
+    Paths are stored compactly, as raw bytes, and `Path` objects
+    are only created when accessing the lists of files.
+    """
+
+    __slots__ = ("_paths",)
+
+    def __init__(  # noqa: PLR0917
+        self,
+        added: Iterable[str | Path] = (),
+        deleted: Iterable[str | Path] = (),
+        modified: Iterable[str | Path] = (),
+        renamed: Iterable[str | Path] = (),
+        typechanged: Iterable[str | Path] = (),
+        untracked: Iterable[str | Path] = (),
+    ) -> None:
+        """Initialize the status.
+
+        Parameters:
+            added: Added files.
+            deleted: Deleted files.
+            modified: Modified files.
+            renamed: Renamed files.
+            typechanged: Type-changed files.
+            untracked: Untracked files.
+        """
+        kinds = (added, deleted, modified, renamed, typechanged, untracked)
+        self._paths: tuple[list[bytes], ...] = tuple([os.fsencode(path) for path in paths] for paths in kinds)
+
+    @classmethod
+    def _from_raw(cls, paths: tuple[list[bytes], ...]) -> Status:
+        status = cls.__new__(cls)
+        status._paths = paths
+        return status
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{kind}={count}" for kind, count in self.counts.items())
+        return f"{self.__class__.__name__}({counts})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Status):
+            return NotImplemented
+        return self._paths == other._paths
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _materialize(self, index: int) -> list[Path]:
+        return [Path(os.fsdecode(path)) for path in self._paths[index]]
+
+    @property
+    def added(self) -> list[Path]:
+        """Added files."""
+        return self._materialize(0)
+
+    @property
+    def deleted(self) -> list[Path]:
+        """Deleted files."""
+        return self._materialize(1)
+
+    @property
+    def modified(self) -> list[Path]:
+        """Modified files."""
+        return self._materialize(2)
+
+    @property
+    def renamed(self) -> list[Path]:
+        """Renamed files."""
+        return self._materialize(3)
+
+    @property
+    def typechanged(self) -> list[Path]:
+        """Type-changed files."""
+        return self._materialize(4)
+
+    @property
+    def untracked(self) -> list[Path]:
+        """Untracked files."""
+        return self._materialize(_UNTRACKED)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of files, by kind of change (`added`, `deleted`, etc.)."""
+        return {kind: len(paths) for kind, paths in zip(_STATUS_KINDS, self._paths)}
+
+
+def _status_line(counts: dict[str, int]) -> str:
+    letters = {"added": "A", "deleted": "D", "modified": "M", "renamed": "R", "typechanged": "T", "untracked": "U"}
+    return " ".join(f"{count}{letters[kind]}" for kind, count in counts.items() if count)
+
+
+def _scan_porcelain_status(output: bytes, paths: tuple[list[bytes], ...] | None = None) -> list[int]:
+    # Count entries of `git status --porcelain -z` output by kind, collecting their paths if lists are given.
+    # Only consider changes between the index and the working tree (second column).
+    counts = [0] * len(_STATUS_KINDS)
+    entries = iter(output.split(b"\0"))
+    for entry in entries:
+        if len(entry) < 4:  # noqa: PLR2004
+            continue
+        index_code, tree_code = entry[0], entry[1]
+        if index_code in b"RC" or tree_code in b"RC":
+            # Renames and copies are followed by the original path.
+            next(entries, None)
+        if index_code == tree_code == ord("?"):
+            kind = _UNTRACKED
+        elif (code_kind := _STATUS_CODES.get(tree_code)) is not None:
+            kind = code_kind
+        else:
+            continue
+        counts[kind] += 1
+        if paths is not None:
+            paths[kind].append(entry[3:])
+    return counts
+
+
+def _parse_porcelain_status(output: bytes) -> Status:
+    paths: tuple[list[bytes], ...] = tuple([] for _ in _STATUS_KINDS)
+    _scan_porcelain_status(output, paths)
+    return Status._from_raw(paths)
+
+
+def _count_porcelain_status(output: bytes) -> dict[str, int]:
+    return dict(zip(_STATUS_KINDS, _scan_porcelain_status(output)))
+
+
+_STATUS_ARGS = ("status", "--porcelain", "-z", "--untracked-files=all")
+"""Arguments of the Git command listing changes."""
+
+
+_LARGE_REPO_SETTINGS = {"core.untrackedCache": "true", "index.threads": "true"}
+"""Settings speeding up status in large repositories, whatever the platform."""
+_FSMONITOR = ("core.fsmonitor", "true")
+"""Setting enabling Git's builtin file-system monitor daemon, where supported.
+
+It starts a persistent daemon per repository, so it is only ever configured
+on demand (see `Project.enable_large_repo_settings`), never for a single command.
+"""
+_FILE_CACHE: dict[tuple[str, Path], tuple[tuple[int, int], Any]] = {}
+"""Values computed from files (index header, configuration), with the modification time and size of the file."""
+
+
+def _cached_on_file(kind: str, path: Path, compute: Callable[[], Any]) -> Any:
+    # Recompute the value only when the file it is computed from changes.
+    try:
+        stat = path.stat()
+    except OSError:
+        return compute()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILE_CACHE.get((kind, path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    value = compute()
+    _FILE_CACHE[kind, path] = (key, value)
+    return value
+
+
+@cache
+def _fsmonitor_daemon_supported() -> bool:
+    try:
+        output = subprocess.run(
+            ["git", "version", "--build-options"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return "feature: fsmonitor--daemon" in output
+
+
+def _index_entries(git_dir: Path) -> int:
+    # Read the number of entries from the index header (signature, version, count),
+    # or from the newest shared index when the index is split.
+    indices = [git_dir / "index"]
+    with suppress(OSError):
+        indices.extend(sorted(git_dir.glob("sharedindex.*"), key=lambda path: path.stat().st_mtime_ns, reverse=True))
+    entries = 0
+    for index in indices[:2]:
+        try:
+            with index.open("rb") as file:
+                header = file.read(12)
+        except OSError:
+            continue
+        if len(header) == 12 and header.startswith(b"DIRC"):  # noqa: PLR2004
+            entries = max(entries, int.from_bytes(header[8:12], "big"))
+    return entries
+
+
+def _parse_object_counts(output: str) -> dict[str, int]:
+    counts = {}
+    for line in output.splitlines():
+        key, _, value = line.partition(":")
+        with contextlib.suppress(ValueError):
+            counts[key.strip()] = int(value)
+    return counts
 
 
 @dataclass(eq=True, order=True, frozen=True)
@@ -45,6 +240,16 @@ class Project:
     """Locks for projects, to avoid concurrent operations."""
     DEFAULT_BRANCHES: ClassVar[tuple[str, ...]] = ("main", "master")
     """Name of common default branches. Mainly useful to compute unreleased commits."""
+    MAINTENANCE_TASKS: ClassVar[tuple[str, ...]] = ("commit-graph", "loose-objects", "incremental-repack")
+    """Tasks run by `maintain` by default. They are cheap enough to run on large repositories."""
+    LARGE_REPO_THRESHOLD: ClassVar[int] = 10_000
+    """Number of files in the index from which a project is considered large.
+
+    Git commands walking the working tree (status, dirtiness) then run with settings
+    speeding them up (see `large_repo_options`).
+    """
+    OBJECT_READER: ClassVar[bool] = True
+    """Whether to read commits from the file-system (see `objects`) when possible, instead of spawning Git."""
     path: Path
     """Path of the project on the file-system."""
 
@@ -56,6 +261,133 @@ class Project:
         """GitPython's `Repo` object."""
         return Repo(self.path)
 
+    @property
+    def refs(self) -> Refs:
+        """Git references, read from the file-system without spawning Git."""
+        return Refs(self.path)
+
+    @property
+    def objects(self) -> ObjectReader:
+        """Git objects, read from the file-system without spawning Git."""
+        return ObjectReader(self.path)
+
+    @property
+    def fingerprint(self) -> tuple[Any, ...]:
+        """A cheap fingerprint of the repository state, computed without spawning Git.
+
+        It changes when the HEAD, references or index change.
+        Modifications of files in the working tree are not detected.
+        """
+        refs = self.refs
+        try:
+            index = os.stat(refs.git_dir / "index")
+        except FileNotFoundError:
+            index_stat = None
+        else:
+            index_stat = (index.st_mtime_ns, index.st_size)
+        head = refs.git_dir.joinpath("HEAD").read_text(encoding="utf8").strip()
+        return (head, tuple(sorted(refs.all.items())), index_stat)
+
+    @property
+    def dirty_fingerprint(self) -> tuple[Any, ...]:
+        """A fingerprint of the repository state including uncommitted changes, computed with a single `git status`.
+
+        It extends `fingerprint` with the modification time and size of files changed in the working tree,
+        so that further modifications of changed files are detected too. The index is not refreshed.
+        """
+        output = self.repo.git.execute(
+            ["git", "--no-optional-locks", *self.large_repo_options, *_STATUS_ARGS],
+            strip_newline_in_stdout=False,
+            stdout_as_string=False,
+        )
+        changed: list[tuple[bytes, tuple[int, int] | None]] = []
+        for path in sorted({path for paths in _parse_porcelain_status(output)._paths for path in paths}):
+            try:
+                stat = os.stat(self.path / os.fsdecode(path))
+            except OSError:
+                changed.append((path, None))
+            else:
+                changed.append((path, (stat.st_mtime_ns, stat.st_size)))
+        return (*self.fingerprint, tuple(changed))
+
+    @property
+    def index_entries(self) -> int:
+        """Number of files in the index, read from its header without spawning Git.
+
+        The header is only read again when the index changes.
+        """
+        git_dir = self.refs.git_dir
+        return _cached_on_file("index", git_dir / "index", lambda: _index_entries(git_dir))
+
+    @property
+    def is_large(self) -> bool:
+        """Whether the project has more files than `LARGE_REPO_THRESHOLD`."""
+        return self.index_entries >= self.LARGE_REPO_THRESHOLD
+
+    @property
+    def large_repo_settings(self) -> dict[str, str]:
+        """Settings speeding up Git in large repositories, safe to pass to any single command.
+
+        They include the untracked cache and multi-threaded index reading.
+        """
+        return dict(_LARGE_REPO_SETTINGS)
+
+    @property
+    def _tuned_settings(self) -> dict[str, str]:
+        # Settings configured by `enable_large_repo_settings`: the split index and the
+        # file-system monitor have persistent effects, so they are never passed with `-c`.
+        settings = {**self.large_repo_settings, "core.splitIndex": "true"}
+        if _fsmonitor_daemon_supported():
+            settings[_FSMONITOR[0]] = _FSMONITOR[1]
+        return settings
+
+    def _configured_settings(self) -> frozenset[str]:
+        # Names of tuned settings configured for the repository, parsed again only when its config changes.
+        def configured() -> frozenset[str]:
+            reader = self.repo.config_reader()
+            return frozenset(name for name in self._tuned_settings if reader.has_option(*name.split(".")))
+
+        return _cached_on_file("config", self.refs.git_dir / "config", configured)
+
+    @property
+    def large_repo_options(self) -> list[str]:
+        """Git options (`-c name=value`) speeding up commands walking the working tree.
+
+        Empty for projects that are not large. Settings configured in the repository are respected.
+        """
+        if not self.is_large:
+            return []
+        configured = self._configured_settings()
+        options: list[str] = []
+        for name, value in self.large_repo_settings.items():
+            if name not in configured:
+                options.extend(("-c", f"{name}={value}"))
+        return options
+
+    @property
+    def missing_large_repo_settings(self) -> list[str]:
+        """Large-repository settings not configured in the project (see `enable_large_repo_settings`).
+
+        Empty for projects that are not large, or already tuned.
+        """
+        if not self.is_large:
+            return []
+        configured = self._configured_settings()
+        return [name for name in self._tuned_settings if name not in configured]
+
+    def enable_large_repo_settings(self) -> None:
+        """Configure the project with large-repository settings, a split index, and a file-system monitor.
+
+        A split index makes index writes cheaper, but changes its on-disk layout,
+        and Git's builtin file-system monitor (when available) starts a daemon per repository:
+        they are only enabled here, on demand, never for a single command.
+        """
+        with self.repo.config_writer() as writer:
+            for name, value in self._tuned_settings.items():
+                section, option = name.split(".")
+                writer.set_value(section, option, value)
+        self.repo.git.update_index("--split-index")
+
     @property
     def name(self) -> str:
         """Name of the project."""
@@ -64,55 +396,58 @@ class Project:
     @property
     def is_dirty(self) -> bool:
         """Whether the project is in a "dirty" state (uncommitted modifications)."""
+        if options := self.large_repo_options:
+            # A single status, benefiting from the untracked cache and file-system monitor.
+            return bool(self._porcelain_status(options))
         return self.repo.is_dirty(untracked_files=True)
 
+    def _porcelain_status(self, options: list[str] | None = None) -> bytes:
+        if options is None:
+            options = self.large_repo_options
+        return self.repo.git.execute(
+            ["git", *options, *_STATUS_ARGS],
+            strip_newline_in_stdout=False,
+            stdout_as_string=False,
+        )
+
     @property
     def status(self) -> Status:
         """Status of the project."""
-        diff = self.repo.index.diff(None)
-        return Status(
-            added=[Path(added.b_path) for added in diff.iter_change_type("A") if added.b_path],
-            deleted=[Path(deleted.a_path) for deleted in diff.iter_change_type("D") if deleted.a_path],
-            modified=[Path(modified.a_path) for modified in diff.iter_change_type("M") if modified.a_path],
-            renamed=[Path(renamed.b_path) for renamed in diff.iter_change_type("R") if renamed.b_path],
-            typechanged=[Path(typechanged.a_path) for typechanged in diff.iter_change_type("T") if typechanged.a_path],
-            untracked=[Path(untracked) for untracked in self.repo.untracked_files],
-        )
+        return _parse_porcelain_status(self._porcelain_status())
+
+    @property
+    def status_counts(self) -> dict[str, int]:
+        """Number of changed files in the project, by kind of change (`added`, `deleted`, etc.).
+
+        Cheaper than `status` since paths of changed files are not kept.
+        """
+        return _count_porcelain_status(self._porcelain_status())
 
     @property
     def status_line(self) -> str:
         """Status of the project, as a string."""
-        st = self.status
-        parts = []
-        if added := len(st.added):
-            parts.append(f"{added}A")
-        if deleted := len(st.deleted):
-            parts.append(f"{deleted}D")
-        if modified := len(st.modified):
-            parts.append(f"{modified}M")
-        if renamed := len(st.renamed):
-            parts.append(f"{renamed}R")
-        if typechanged := len(st.typechanged):
-            parts.append(f"{typechanged}T")
-        if untracked := len(st.untracked):
-            parts.append(f"{untracked}U")
-        return " ".join(parts)
+        return _status_line(self.status_counts)
+
+    def _diverged_counts(self, remote: str, template: str) -> dict[str, int]:
+        # Only diverged branches need commits to be counted (see `Refs.diverged`).
+        refs = self.refs
+        result = dict.fromkeys(refs.tracked(remote), 0)
+        if diverged := refs.diverged(remote):
+            repo = self.repo
+            for branch in diverged:
+                try:
+                    result[branch] = len(list(repo.iter_commits(template.format(remote=remote, branch=branch))))
+                except GitCommandError:
+                    del result[branch]
+        return result
 
     def unpushed(self, remote: str = "origin") -> dict[str, int]:
         """Number of unpushed commits, per branch."""
-        result = {}
-        for branch in self.repo.branches:
-            with contextlib.suppress(GitCommandError):
-                result[branch.name] = len(list(self.repo.iter_commits(f"{remote}/{branch.name}..{branch.name}")))
-        return result
+        return self._diverged_counts(remote, "{remote}/{branch}..{branch}")
 
     def unpulled(self, remote: str = "origin") -> dict[str, int]:
         """Number of unpulled commits, per branch."""
-        result = {}
-        for branch in self.repo.branches:
-            with contextlib.suppress(GitCommandError):
-                result[branch.name] = len(list(self.repo.iter_commits(f"{branch.name}..{remote}/{branch.name}")))
-        return result
+        return self._diverged_counts(remote, "{branch}..{remote}/{branch}")
 
     @property
     def branch(self) -> Head:
@@ -122,8 +457,9 @@ class Project:
     @property
     def default_branch(self) -> str:
         """Default branch (or main branch), as checked out when cloning."""
+        refs = self.refs
         for branch in self.DEFAULT_BRANCHES:
-            if branch in self.repo.references:
+            if branch in refs.heads or branch in refs.tags:
                 return branch
         try:
             origin = self.repo.git.remote("show", "origin")
@@ -182,18 +518,90 @@ class Project:
             commits.append(commit)
         return commits
 
-    def fetch(self) -> None:
-        """Fetch."""
+    def unreleased_subjects(self, branch: str | None = None) -> list[tuple[str, str]]:
+        """List SHAs and subjects of unreleased commits, like `unreleased`.
+
+        When `OBJECT_READER` is true, commits are read from the file-system (see `objects`),
+        falling back to Git for repositories the reader doesn't support.
+        """
+        if branch is None:
+            try:
+                branch = self.default_branch
+            except ValueError:
+                return []
+        if self.OBJECT_READER:
+            with suppress(ValueError, KeyError, OSError, zlib.error):
+                return self._read_unreleased(branch)
+        return [
+            (
+                commit.hexsha,
+                commit.summary if isinstance(commit.summary, str) else bytes(commit.summary).decode(errors="ignore"),
+            )
+            for commit in self.unreleased(branch)
+        ]
+
+    def _read_unreleased(self, branch: str) -> list[tuple[str, str]]:
+        objects, refs = self.objects, self.refs
+        start = refs.heads.get(branch) or refs.tags.get(branch)
+        if start is None:
+            raise KeyError(branch)
+        # Like `latest_tag`: the tagged commit with the latest committer date.
+        tagged = {objects.peel(sha) for sha in refs.peeled_tags.values()}
+        latest = max(sorted(tagged), key=lambda sha: objects.commit(sha)[1], default=None)
+        return list(objects.walk(objects.peel(start), until=latest))
+
+    def fetch(self, timeout: float | None = None) -> None:
+        """Fetch.
+
+        Parameters:
+            timeout: Time budget of each `git fetch`, in seconds, after which it is killed.
+        """
         with suppress(AttributeError, GitCommandError):
-            self.repo.remotes.origin.fetch()
+            self.repo.remotes.origin.fetch(kill_after_timeout=timeout)
         with suppress(AttributeError, GitCommandError):
-            self.repo.remotes.upstream.fetch()
+            self.repo.remotes.upstream.fetch(kill_after_timeout=timeout)
 
     @property
     def latest_tag(self) -> TagReference:
         """Latest tag."""
         return sorted(self.repo.tags, key=lambda t: t.commit.committed_datetime)[-1]
 
+    @property
+    def object_counts(self) -> dict[str, int]:
+        """Statistics of the object database, as reported by `git count-objects -v`.
+
+        Keys are `count` (loose objects), `size`, `in-pack`, `packs`, `size-pack`,
+        `prune-packable`, `garbage` and `size-garbage`. Sizes are in KiB.
+        """
+        return _parse_object_counts(self.repo.git.count_objects("-v"))
+
+    @property
+    def has_commit_graph(self) -> bool:
+        """Whether the repository has a commit-graph, speeding up history walks."""
+        info = self.refs.common_dir / "objects" / "info"
+        return info.joinpath("commit-graph").exists() or info.joinpath("commit-graphs", "commit-graph-chain").exists()
+
+    @property
+    def has_multi_pack_index(self) -> bool:
+        """Whether the repository has a multi-pack-index, speeding up object lookups across packs."""
+        return self.refs.common_dir.joinpath("objects", "pack", "multi-pack-index").exists()
+
+    def maintain(self, *tasks: str) -> None:
+        """Run maintenance tasks with `git maintenance run`.
+
+        Parameters:
+            *tasks: The tasks to run. By default, `MAINTENANCE_TASKS`.
+        """
+        self.repo.git.maintenance("run", *(f"--task={task}" for task in tasks or self.MAINTENANCE_TASKS))
+
+    def write_commit_graph(self) -> None:
+        """Write a commit-graph of all reachable commits, with changed-paths Bloom filters."""
+        self.repo.git.commit_graph("write", "--reachable", "--changed-paths")
+
+    def repack(self) -> None:
+        """Repack all objects into a single pack, with a multi-pack-index."""
+        self.repo.git.repack("-a", "-d", "--write-midx")
+
     def lock(self) -> bool:
         """Lock project."""
         return self.LOCKS[self].acquire(blocking=False)
@@ -201,3 +609,55 @@ class Project:
     def unlock(self) -> None:
         """Unlock project."""
         self.LOCKS[self].release()
+
+    # --------------------------------------------------
+    # Asynchronous variants, running Git with `run_git`.
+    # --------------------------------------------------
+    async def is_dirty_async(self) -> bool:
+        """Whether the project is in a "dirty" state (uncommitted modifications)."""
+        options = self.large_repo_options
+        return bool(await run_git(self.path, *options, "status", "--porcelain", "--untracked-files=normal"))
+
+    async def status_async(self) -> Status:
+        """Status of the project."""
+        return _parse_porcelain_status(await _run_git_bytes(self.path, *self.large_repo_options, *_STATUS_ARGS))
+
+    async def status_counts_async(self) -> dict[str, int]:
+        """Number of changed files in the project, by kind of change (`added`, `deleted`, etc.)."""
+        return _count_porcelain_status(await _run_git_bytes(self.path, *self.large_repo_options, *_STATUS_ARGS))
+
+    async def status_line_async(self) -> str:
+        """Status of the project, as a string."""
+        return _status_line(await self.status_counts_async())
+
+    async def object_counts_async(self) -> dict[str, int]:
+        """Statistics of the object database, as reported by `git count-objects -v`."""
+        return _parse_object_counts(await run_git(self.path, "count-objects", "-v"))
+
+    async def _count_commits(self, revision_range: str) -> int | None:
+        try:
+            return int(await run_git(self.path, "rev-list", "--count", revision_range))
+        except GitCommandError:
+            return None
+
+    async def _diverged_counts_async(self, remote: str, template: str) -> dict[str, int]:
+        refs = self.refs
+        diverged = refs.diverged(remote)
+        counts = await asyncio.gather(
+            *(self._count_commits(template.format(remote=remote, branch=branch)) for branch in diverged),
+        )
+        result = dict.fromkeys(refs.tracked(remote), 0)
+        for branch, count in zip(diverged, counts):
+            if count is None:
+                del result[branch]
+            else:
+                result[branch] = count
+        return result
+
+    async def unpushed_async(self, remote: str = "origin") -> dict[str, int]:
+        """Number of unpushed commits, per branch."""
+        return await self._diverged_counts_async(remote, "{remote}/{branch}..{branch}")
+
+    async def unpulled_async(self, remote: str = "origin") -> dict[str, int]:
+        """Number of unpulled commits, per branch."""
+        return await self._diverged_counts_async(remote, "{branch}..{remote}/{branch}")
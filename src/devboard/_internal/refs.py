@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import mmap
+import os
+import time
+from functools import cached_property
+from pathlib import Path
+
+_RACY_DELAY_NS = 2_000_000_000
+"""Entries modified more recently than this (in nanoseconds) are never cached.
+
+File-systems with coarse timestamps could otherwise hide an update
+happening in the same tick as a previous read.
+"""
+
+_PACKED_CACHE: dict[str, tuple[int, dict[str, str], dict[str, str]]] = {}
+"""Parsed `packed-refs` files, keyed by path: modification time, refs and peeled tags."""
+_LOOSE_CACHE: dict[str, tuple[int, dict[str, str], list[str]]] = {}
+"""Scanned loose refs directories, keyed by path: modification time, refs and sub-directories."""
+
+
+def _is_racy(mtime_ns: int) -> bool:
+    return time.time_ns() - mtime_ns < _RACY_DELAY_NS
+
+
+def _git_dirs(path: Path) -> tuple[Path, Path]:
+    dot_git = path / ".git"
+    if dot_git.is_dir():
+        git_dir = dot_git
+    elif dot_git.is_file():
+        # Worktrees and submodules: `.git` is a file pointing to the actual Git directory.
+        content = dot_git.read_text(encoding="utf8").strip()
+        if not content.startswith("gitdir:"):
+            raise ValueError(f"Invalid .git file in {path}")
+        git_dir = path / content[len("gitdir:") :].strip()
+    elif path.joinpath("HEAD").is_file() and path.joinpath("objects").is_dir():
+        git_dir = path
+    else:
+        raise ValueError(f"Not a Git repository: {path}")
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        return git_dir, git_dir / commondir.read_text(encoding="utf8").strip()
+    return git_dir, git_dir
+
+
+def _read_packed_refs(path: Path) -> tuple[dict[str, str], dict[str, str]]:
+    key = str(path)
+    try:
+        stat = os.stat(key)
+    except FileNotFoundError:
+        return {}, {}
+    if (cached := _PACKED_CACHE.get(key)) and cached[0] == stat.st_mtime_ns:
+        return cached[1], cached[2]
+    refs: dict[str, str] = {}
+    peeled: dict[str, str] = {}
+    if stat.st_size:
+        with open(key, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            last_ref = ""
+            for line in iter(data.readline, b""):
+                if line.startswith(b"#"):
+                    continue
+                if line.startswith(b"^"):
+                    # Peeled line: commit pointed at by the annotated tag on the previous line.
+                    peeled[last_ref] = line[1:].strip().decode()
+                    continue
+                sha, _, name = line.strip().partition(b" ")
+                last_ref = name.decode()
+                refs[last_ref] = sha.decode()
+    if not _is_racy(stat.st_mtime_ns):
+        _PACKED_CACHE[key] = (stat.st_mtime_ns, refs, peeled)
+    return refs, peeled
+
+
+def _scan_loose_dir(path: str) -> tuple[dict[str, str], list[str]]:
+    # Git updates refs by renaming lock files, which updates
+    # the parent directory's modification time: we can cache on it.
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}, []
+    if (cached := _LOOSE_CACHE.get(path)) and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+    refs: dict[str, str] = {}
+    subdirs: list[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.name)
+            elif not entry.name.endswith(".lock"):
+                with open(entry.path, encoding="utf8") as file:
+                    refs[entry.name] = file.read().strip()
+    if not _is_racy(mtime_ns):
+        _LOOSE_CACHE[path] = (mtime_ns, refs, subdirs)
+    return refs, subdirs
+
+
+def _read_loose_refs(path: Path, prefix: str) -> dict[str, str]:
+    refs = {}
+    stack = [prefix]
+    while stack:
+        current = stack.pop()
+        files, subdirs = _scan_loose_dir(os.path.join(path, current))
+        for name, value in files.items():
+            refs[f"{current}/{name}"] = value
+        stack.extend(f"{current}/{subdir}" for subdir in subdirs)
+    return refs
+
+
+class Refs:
+    """Git references of a repository, read directly from the file-system.
+
+    Loose refs and `packed-refs` are parsed without spawning Git
+    or instantiating GitPython objects. Parsed files are cached
+    by modification time, so reading refs of an unchanged repository
+    only costs a few `stat` calls.
+
+    References are read once per instance (see `all`): create
+    a new instance to see references updated in the meantime.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the reader.
+
+        Parameters:
+            path: Path to the repository (working tree or bare repository).
+        """
+        self.git_dir, self.common_dir = _git_dirs(Path(path))
+
+    @cached_property
+    def all(self) -> dict[str, str]:
+        """All references, as a mapping of full ref names to SHAs.
+
+        Symbolic references (like `refs/remotes/origin/HEAD`) are resolved.
+        They are read on first access, then shared by other properties and methods.
+        """
+        refs, _ = _read_packed_refs(self.common_dir / "packed-refs")
+        refs = {**refs, **_read_loose_refs(self.common_dir, "refs")}
+        for name, value in list(refs.items()):
+            if value.startswith("ref:"):
+                target = refs.get(value[4:].strip())
+                if target is None:
+                    del refs[name]
+                else:
+                    refs[name] = target
+        return refs
+
+    def _prefixed(self, prefix: str) -> dict[str, str]:
+        start = len(prefix)
+        return {name[start:]: sha for name, sha in self.all.items() if name.startswith(prefix)}
+
+    @property
+    def heads(self) -> dict[str, str]:
+        """Local branches, as a mapping of branch names to SHAs."""
+        return self._prefixed("refs/heads/")
+
+    @property
+    def tags(self) -> dict[str, str]:
+        """Tags, as a mapping of tag names to SHAs (of tag objects for annotated tags)."""
+        return self._prefixed("refs/tags/")
+
+    @property
+    def peeled_tags(self) -> dict[str, str]:
+        """Tags, as a mapping of tag names to commit SHAs, when known without reading objects.
+
+        Annotated tags are only peeled when Git recorded it in `packed-refs`,
+        otherwise their tag object SHA is used.
+        """
+        _, peeled = _read_packed_refs(self.common_dir / "packed-refs")
+        return {name: peeled.get(f"refs/tags/{name}", sha) for name, sha in self.tags.items()}
+
+    @property
+    def remotes(self) -> dict[str, str]:
+        """Remote-tracking branches, as a mapping of `remote/branch` names to SHAs."""
+        return self._prefixed("refs/remotes/")
+
+    def remote_heads(self, remote: str = "origin") -> dict[str, str]:
+        """Remote-tracking branches of a single remote, as a mapping of branch names to SHAs."""
+        return self._prefixed(f"refs/remotes/{remote}/")
+
+    @property
+    def head(self) -> str | None:
+        """Currently checked out branch name, or `None` when the HEAD is detached."""
+        content = self.git_dir.joinpath("HEAD").read_text(encoding="utf8").strip()
+        if content.startswith("ref: refs/heads/"):
+            return content[len("ref: refs/heads/") :]
+        return None
+
+    def tracked(self, remote: str = "origin") -> dict[str, tuple[str, str]]:
+        """Local branches having a remote-tracking branch.
+
+        Parameters:
+            remote: The remote name.
+
+        Returns:
+            A mapping of branch names to local and remote SHAs.
+        """
+        remote_heads = self.remote_heads(remote)
+        return {branch: (sha, remote_heads[branch]) for branch, sha in self.heads.items() if branch in remote_heads}
+
+    def diverged(self, remote: str = "origin") -> dict[str, tuple[str, str]]:
+        """Local branches whose SHA differs from their remote-tracking branch.
+
+        Branches without a remote-tracking branch are ignored.
+        An empty result means there is nothing to pull or push
+        for this remote, and no Git command needs to be run.
+
+        Parameters:
+            remote: The remote name.
+
+        Returns:
+            A mapping of branch names to local and remote SHAs.
+        """
+        return {branch: shas for branch, shas in self.tracked(remote).items() if shas[0] != shas[1]}
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import pickle
+import signal
+import sys
+import time
+from contextlib import contextmanager
+from importlib.util import module_from_spec, spec_from_file_location
+from multiprocessing import forkserver, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock, Timer
+from typing import TYPE_CHECKING, Any
+
+from devboard._internal.projects import Project
+
+if sys.platform != "win32":
+    import resource
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from multiprocessing.context import BaseContext
+    from multiprocessing.pool import Pool
+    from types import FrameType
+
+    _Rows = list[tuple[Any, ...]]
+    _Result = tuple[int, "_Rows | tuple[str, int] | _Failure", float, "tuple[int, int] | None"]
+
+
+class _ProjectRef:
+    # Placeholder for the scanned project in rows sent back by workers.
+    # It pickles as a reference to the module-level instance,
+    # memoized once per result, instead of a full project.
+    def __reduce__(self) -> str:
+        return "_PROJECT"
+
+
+_PROJECT = _ProjectRef()
+
+
+class _Failure:
+    # Sent back by workers instead of rows when populating a project failed.
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+
+_populate_rows: Callable[[Project], _Rows] | None = None
+"""Function populating rows in workers, set by `_init_worker`."""
+_projects: Sequence[Project] = ()
+"""Projects scanned by workers, set by `_init_worker`."""
+_shm_threshold: int | None = None
+"""Pickled size above which results go through shared memory, set by `_init_worker`."""
+_timeout: float | None = None
+"""Time budget to populate a project, in seconds, set by `_init_worker`."""
+_own_group = False
+"""Whether the worker leads its own process group, containing the subprocesses it spawns."""
+_GRACE_DELAY = 5.0
+"""Additional time given to workers after their time budget, in seconds."""
+
+_board_modules: dict[str, str] = {}
+"""Modules loaded from files (boards), by name, loaded again by workers of the shared pool."""
+_board_generation = 0
+"""Incremented each time a board is (re)loaded."""
+_pool: Pool | None = None
+"""Shared pool of workers, started by `_shared_pool`."""
+_pool_state: tuple[dict[str, str], dict[str, str], int] = ({}, {}, 0)
+"""Board modules loaded by workers of the shared pool, their environment, and the board generation."""
+_pool_users: dict[Pool, int] = {}
+"""Number of scans using each pool: the current one, and replaced ones still in use."""
+_pool_lock = Lock()
+_scans: dict[str, tuple[Sequence[Project], Callable[[Project], _Rows], int | None, float | None]] = {}
+"""Scans loaded by a worker of the shared pool (see `_shared_scan`), by name of their shared memory block."""
+_MAX_SCANS = 16
+"""Maximum number of scans kept by each worker of the shared pool."""
+_worker_memory: dict[int, int] = {}
+"""Peak memory usage (resident set size, in bytes) of workers, by process ID, as reported with their results."""
+
+
+def _kill_subprocesses() -> None:
+    # Terminate subprocesses (such as Git commands) by signaling the worker's process group,
+    # which the worker itself ignores. Stopped processes (waiting for a terminal) are continued.
+    if not _own_group:
+        return
+    handler = signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    try:
+        os.killpg(os.getpid(), signal.SIGTERM)
+        os.killpg(os.getpid(), signal.SIGCONT)
+    finally:
+        signal.signal(signal.SIGTERM, handler)
+
+
+def _on_terminate(signum: int, frame: FrameType | None) -> None:  # noqa: ARG001
+    # The pool is terminated (refresh or exit): don't leave subprocesses behind.
+    _kill_subprocesses()
+    os._exit(1)
+
+
+def _on_alarm(signum: int, frame: FrameType | None) -> None:  # noqa: ARG001
+    _kill_subprocesses()
+    raise TimeoutError(f"timed out after {_timeout:g}s")
+
+
+def _on_stuck() -> None:
+    # Called from a watchdog thread when the time budget was exceeded and the alarm had no effect
+    # (stuck in a system call, or in native code): exit, and let the pool start a new worker instead.
+    # Signal handlers can't be changed from threads: the worker's own one never runs, since it exits first.
+    os.killpg(os.getpid(), signal.SIGTERM)
+    os.killpg(os.getpid(), signal.SIGCONT)
+    os._exit(1)
+
+
+@contextmanager
+def _time_limit(timeout: float | None) -> Iterator[None]:
+    if timeout is None or not _own_group:
+        yield
+        return
+    watchdog = Timer(timeout + _GRACE_DELAY, _on_stuck)
+    watchdog.daemon = True
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    watchdog.start()
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        watchdog.cancel()
+
+
+def _init_worker(
+    populate_rows: Callable[[Project], _Rows],
+    projects: Sequence[Project],
+    shm_threshold: int | None,
+    timeout: float | None = None,
+) -> None:
+    # Projects are given once per worker (inherited when forking),
+    # so that tasks only need to transfer project indices.
+    global _populate_rows, _projects, _shm_threshold, _timeout  # noqa: PLW0603
+    _populate_rows = populate_rows
+    _projects = projects
+    _shm_threshold = shm_threshold
+    _timeout = timeout
+    _setup_worker()
+
+
+def _setup_worker() -> None:
+    global _own_group  # noqa: PLW0603
+    # Nobody can answer prompts in workers: fail instead of hanging.
+    os.environ["GIT_TERMINAL_PROMPT"] = "0"
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+        _own_group = True
+        signal.signal(signal.SIGTERM, _on_terminate)
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+
+def _compact(rows: _Rows, project: Project) -> _Rows:
+    return [
+        tuple(_PROJECT if isinstance(value, Project) and value == project else value for value in row) for row in rows
+    ]
+
+
+def _rehydrate(rows: _Rows, project: Project) -> _Rows:
+    return [tuple(project if value is _PROJECT else value for value in row) for row in rows]
+
+
+def _init_shared_worker(modules: dict[str, str], environ: dict[str, str]) -> None:
+    # Workers of the shared pool don't inherit anything from the application: use its current
+    # environment, and load board modules so that their columns' functions and projects can be unpickled.
+    os.environ.clear()
+    os.environ.update(environ)
+    for name, path in modules.items():
+        if name not in sys.modules:
+            spec = spec_from_file_location(name, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Could not get import spec from '{path}'")
+            module = module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+    _setup_worker()
+
+
+def _register_board_module(name: str, path: str) -> None:
+    # Called when a board is loaded (or reloaded) from a file, for workers of the shared pool to load it too.
+    global _board_generation  # noqa: PLW0603
+    _board_modules[name] = path
+    _board_generation += 1
+
+
+def _picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+@contextmanager
+def _shared_pool() -> Iterator[Pool]:
+    # Use the pool of long-lived workers, started on first use.
+    # Workers are forked from a fork server (or spawned) rather than from the application,
+    # so they don't duplicate its memory, threads and event loop, and are reused across refreshes.
+    # A new pool is started if boards were loaded or the environment changed in the meantime.
+    # The previous one is terminated once scans still using it are done.
+    # Stuck workers exit by themselves (see `_time_limit`), and are replaced by the pool.
+    global _pool, _pool_state  # noqa: PLW0603
+    state = (dict(_board_modules), dict(os.environ), _board_generation)
+    with _pool_lock:
+        if _pool is not None and _pool_state != state:
+            if not _pool_users.get(_pool):
+                _pool.terminate()
+            _pool = None
+        if _pool is None:
+            _pool_state = state
+            _pool = _context().Pool(initializer=_init_shared_worker, initargs=state[:2])
+        pool = _pool
+        _pool_users[pool] = _pool_users.get(pool, 0) + 1
+    try:
+        yield pool
+    finally:
+        with _pool_lock:
+            _pool_users[pool] -= 1
+            if not _pool_users[pool]:
+                del _pool_users[pool]
+                if pool is not _pool:
+                    pool.terminate()
+
+
+@atexit.register
+def _stop_shared_pool() -> None:
+    # Terminate the shared pool (once scans still using it are done): the next scan starts new workers.
+    # Also called on exit, rather than leaving the pool to be garbage-collected while modules are torn down.
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is not None and not _pool_users.get(_pool):
+            _pool.terminate()
+        _pool = None
+
+
+def _context() -> BaseContext:
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    if context.get_start_method() == "forkserver":
+        # Imported once in the fork server, and shared by workers.
+        context.set_forkserver_preload(["git", __name__])
+    return context
+
+
+def _start_fork_server() -> None:
+    # The fork server and resource tracker are given the standard error of the process when started:
+    # they must be started before the application captures it, not lazily by the shared pool.
+    if _context().get_start_method() == "forkserver":
+        forkserver.ensure_running()
+
+
+def _populate_project(index: int) -> _Result:
+    return _populate(index, _projects[index], _populate_rows)  # type: ignore[arg-type]
+
+
+@contextmanager
+def _shared_scan(
+    projects: Sequence[Project],
+    populate_rows: Callable[[Project], _Rows],
+    shm_threshold: int | None,
+    timeout: float | None,
+) -> Iterator[tuple[str, int]]:
+    # Publish what tasks of a scan have in common in a shared memory block, that workers of the shared pool
+    # load once per scan (see `_load_scan`), so that tasks only need to transfer project indices.
+    # Yield the name and size of the block. Leaving the context removes it: remaining tasks
+    # are skipped by workers that didn't load the scan yet.
+    data = pickle.dumps(
+        (list(projects), populate_rows, hasattr(populate_rows, "rows_cache"), shm_threshold, timeout),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    shm = SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[: len(data)] = data  # type: ignore[index]
+        yield shm.name, len(data)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _load_scan(name: str, size: int) -> tuple[Sequence[Project], Callable[[Project], _Rows], int | None, float | None]:
+    if (scan := _scans.get(name)) is not None:
+        return scan
+    # The main process owns the block, and unlinks it (workers share its resource tracker).
+    shm = SharedMemory(name=name)
+    try:
+        projects, populate_rows, unwrap, shm_threshold, timeout = pickle.loads(bytes(shm.buf[:size]))  # type: ignore[index]  # noqa: S301
+    finally:
+        shm.close()
+    # Memoized functions are sent (by reference) as is, and unwrapped here.
+    if unwrap:
+        populate_rows = populate_rows.__wrapped__
+    if len(_scans) >= _MAX_SCANS:
+        del _scans[next(iter(_scans))]
+    scan = _scans[name] = (projects, populate_rows, shm_threshold, timeout)
+    return scan
+
+
+def _populate_task(task: tuple[str, int, int]) -> _Result:
+    # Tasks of the shared pool only carry the scan's shared memory block, and the project index.
+    global _shm_threshold, _timeout
+    name, size, index = task
+    try:
+        projects, populate_rows, _shm_threshold, _timeout = _load_scan(name, size)
+    except FileNotFoundError:
+        # The scan was cancelled (or gave up on results) before this task started.
+        return index, _Failure("cancelled"), 0.0, None
+    return _populate(index, projects[index], populate_rows)
+
+
+def _populate(
+    index: int,
+    project: Project,
+    populate_rows: Callable[[Project], _Rows],
+) -> _Result:
+    # Returns the project index with compact rows,
+    # or with the name and size of a shared memory block containing pickled rows,
+    # or with a failure if populating rows raised an exception or took too long,
+    # with the time it took, and with the worker's process ID and peak memory usage.
+    start = time.perf_counter()
+    try:
+        with _time_limit(_timeout):
+            rows = populate_rows(project)
+    except Exception as error:  # noqa: BLE001
+        return index, _Failure(str(error) or error.__class__.__name__), time.perf_counter() - start, _memory()
+    duration = time.perf_counter() - start
+    rows = _compact(rows, project)
+    if _shm_threshold is None or not rows:
+        return index, rows, duration, _memory()
+    data = pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) <= _shm_threshold:
+        return index, rows, duration, _memory()
+    shm = SharedMemory(create=True, size=len(data))
+    # The main process takes ownership of the block and unlinks it.
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    try:
+        shm.buf[: len(data)] = data  # type: ignore[index]
+    finally:
+        shm.close()
+    return index, (shm.name, len(data)), duration, _memory()
+
+
+def _memory() -> tuple[int, int] | None:
+    # The process ID and peak resident set size of the current process, in bytes.
+    # It is given in bytes on macOS, in KiB on other platforms, and not available on Windows.
+    if sys.platform == "win32":
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return os.getpid(), max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _receive(payload: _Rows | tuple[str, int], project: Project) -> _Rows:
+    if isinstance(payload, tuple):
+        name, size = payload
+        shm = SharedMemory(name=name)
+        try:
+            payload = pickle.loads(bytes(shm.buf[:size]))  # type: ignore[index]  # noqa: S301
+        finally:
+            shm.close()
+            shm.unlink()
+    return _rehydrate(payload, project)  # type: ignore[arg-type]
@@ -0,0 +1,28 @@
+"""Helpers for the test suite."""
+
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run a Git command in a repository, returning its output."""
+    return subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=dev", "-c", "user.email=dev@example.com", *args],  # noqa: S607
+        cwd=repo,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+
+
+def init_repo(repo: Path) -> str:
+    """Initialize a repository with an empty commit, returning the commit SHA."""
+    repo.mkdir(parents=True)
+    git(repo, "init", "-b", "main")
+    git(repo, "commit", "--allow-empty", "-m", "Initial commit")
+    return git(repo, "rev-parse", "HEAD")
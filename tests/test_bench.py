@@ -0,0 +1,77 @@
+"""Tests for the benchmark command."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from devboard import Column, Project, benchmark_columns, format_bench_report
+from devboard._internal import workers
+from tests.helpers import init_repo
+
+
+class _Column(Column):
+    TITLE = "Dirty"
+    HEADERS = ("Project", "Dirty")
+
+    def __init__(self, projects: list[Project]) -> None:
+        super().__init__()
+        self.projects = projects
+
+    def list_projects(self) -> list[Project]:
+        return self.projects
+
+    @staticmethod
+    async def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        return [(project, await project.is_dirty_async())]
+
+
+class _PidColumn(Column):
+    TITLE = "Pid"
+    HEADERS = ("Project", "Pid")
+
+    def list_projects(self) -> list[Project]:
+        return [Project(Path(__file__).parent.parent)]
+
+    @staticmethod
+    def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        return [(project, os.getpid())]
+
+
+def test_benchmark_columns(tmp_path: Path) -> None:
+    """Timings, rows and Git processes are reported per column and project.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    projects = []
+    for path in (tmp_path / "a", tmp_path / "b", tmp_path / "other" / "a"):
+        init_repo(path)
+        projects.append(Project(path))
+    report = benchmark_columns([_Column(projects)], runs=2)
+    column = report["columns"]["Dirty"]
+    assert column["cold"]["rows"] == 3
+    assert column["cold"]["git_processes"] >= 3
+    assert len(column["warm"]) == 2
+    assert len(column["projects"]) == 3
+    for path in (tmp_path / "a", tmp_path / "other" / "a"):
+        assert column["projects"][str(path)]["name"] == "a"
+        assert column["projects"][str(path)]["git_processes"] >= 1
+        assert column["projects"][str(path)]["seconds"] > 0
+    assert "Dirty" in format_bench_report(report)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Peak memory usage is not available on Windows")
+def test_benchmark_workers() -> None:
+    """The cold run starts new workers, and peak memory usage of workers is reported, in bytes."""
+    pids = {row[1] for row in _PidColumn()._populate()}
+    report = benchmark_columns([_PidColumn], runs=1)
+    with workers._shared_pool() as pool:
+        assert pids.isdisjoint(process.pid for process in pool._pool)  # type: ignore[attr-defined]
+    assert report["peak_memory"]["self"] > 2**20
+    assert report["peak_memory"]["workers"] > 2**20
+    assert "MiB (largest worker)" in format_bench_report(report)
@@ -0,0 +1,608 @@
+"""Tests for board columns."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import ProgressBar
+
+from devboard import BulkOperation, Column, DataTable, Devboard, ErrorCell, Project, Row, memoize_rows
+from devboard._internal import workers
+from tests.helpers import git, init_repo
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_PROJECTS = [Project(Path("a")), Project(Path("b"))]
+
+
+class _Column(Column):
+    def list_projects(self) -> list[Project]:
+        return _PROJECTS
+
+    @staticmethod
+    def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        return [(project, "x" * 100, 1), (project, "y", 2)]
+
+
+@pytest.mark.parametrize("threshold", [None, 0, 10_000])
+def test_populate_in_workers(threshold: int | None) -> None:
+    """Rows computed in workers are sent back with projects rehydrated.
+
+    Parameters:
+        threshold: Shared memory threshold.
+    """
+    column = _Column()
+    column.SHARED_MEMORY_THRESHOLD = threshold
+    rows = column._populate()
+    assert rows == [row for project in _PROJECTS for row in _Column.populate_rows(project)]
+    assert [row[0] for row in rows] == [_PROJECTS[0], _PROJECTS[0], _PROJECTS[1], _PROJECTS[1]]
+    assert all(row[0] is _PROJECTS[0] for row in rows[:2])
+
+
+class _PidColumn(Column):
+    def list_projects(self) -> list[Project]:
+        return _PROJECTS
+
+    @staticmethod
+    def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        return [(project, os.getpid())]
+
+
+def test_shared_workers_reused_across_refreshes() -> None:
+    """Workers are started once, without the application, and reused. Closures run in forked workers."""
+    column = _PidColumn()
+    rows = column._populate()
+    with workers._shared_pool() as pool:
+        pids = {process.pid for process in pool._pool}  # type: ignore[attr-defined]
+        assert {row[1] for row in rows} <= pids
+        assert os.getpid() not in pids
+        assert {row[1] for row in column._populate()} <= pids
+        with workers._shared_pool() as same_pool:
+            assert same_pool is pool
+    column.populate_rows = lambda project: [(project, os.getpid())]  # type: ignore[method-assign]
+    assert {row[1] for row in column._populate()}.isdisjoint(pids | {os.getpid()})
+
+
+def test_shared_workers_receive_project_indices() -> None:
+    """Tasks of the shared pool carry project indices. Tasks of scans that ended are skipped."""
+    with workers._shared_pool() as pool:
+        with workers._shared_scan(_PROJECTS, _Column.populate_rows, None, None) as (name, size):
+            for index, project in enumerate(_PROJECTS):
+                assert pool.apply(workers._populate_task, ((name, size, index),))[:2] == (
+                    index,
+                    workers._compact(_Column.populate_rows(project), project),
+                )
+        with workers._shared_scan(_PROJECTS, _Column.populate_rows, None, None) as (name, size):
+            pass
+        assert isinstance(pool.apply(workers._populate_task, ((name, size, 0),))[1], workers._Failure)
+
+
+class _StuckColumn(Column):
+    HEADERS = ("Project", "Details")
+    TIMEOUT = 1
+
+    def list_projects(self) -> list[Project]:
+        return _PROJECTS[:1]
+
+    @staticmethod
+    def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        # Ignore the time budget, like a worker stuck in a system call.
+        signal.signal(signal.SIGALRM, signal.SIG_IGN)
+        time.sleep(60)
+        return [(project, "never")]
+
+
+class _UnboundedColumn(Column):
+    TIMEOUT = None
+
+    def list_projects(self) -> list[Project]:
+        return _PROJECTS[1:]
+
+    @staticmethod
+    def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        time.sleep(0.5)
+        return [(project, "done")]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX signals")
+def test_stuck_worker_does_not_affect_other_columns() -> None:
+    """A stuck worker is replaced, while other columns sharing the pool still get their rows."""
+    with ThreadPoolExecutor() as executor:
+        stuck = executor.submit(_StuckColumn()._populate)
+        time.sleep(0.5)
+        unbounded = executor.submit(_UnboundedColumn()._populate)
+        assert unbounded.result(timeout=30) == [(_PROJECTS[1], "done")]
+        assert str(stuck.result(timeout=30)[0][1]) == "⚠ timed out after 1s"
+    # Columns now share a pool that works again.
+    assert _UnboundedColumn()._populate() == [(_PROJECTS[1], "done")]
+
+
+class _TableApp(App):
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+
+def _ordered_data(table: DataTable) -> list[list[Any]]:
+    return [table.get_row_at(index)[1:] for index in range(table.row_count)]
+
+
+def test_multi_key_sort() -> None:
+    """Rows are sorted on precomputed keys, and re-sorted when updated."""
+
+    async def _test() -> None:
+        async with _TableApp().run_test() as pilot:
+            table = pilot.app.query_one(DataTable)
+            table.clear(columns=True)
+            table.add_column("Project", key="project")
+            table.add_column("Commits", key="commits")
+            table.sort_keys = {"project": str.lower}
+            table.sort_columns = [("commits", True), ("project", False)]
+            keys = table.add_rows([("b", 1), ("C", 2), ("a", 1)])
+            assert _ordered_data(table) == [["C", 2], ["a", 1], ["b", 1]]
+            table.update_cell(keys[0], "commits", 3)
+            assert _ordered_data(table) == [["b", 3], ["C", 2], ["a", 1]]
+
+    asyncio.run(_test())
+
+
+def test_batched_updates_from_threads() -> None:
+    """Updates made from other threads are coalesced and applied on the application thread."""
+
+    async def _test() -> None:
+        async with _TableApp().run_test() as pilot:
+            table = pilot.app.query_one(DataTable)
+            table.clear(columns=True)
+            table.add_column("Project", key="project")
+            table.add_column("Commits", key="commits")
+            table.sort_columns = [("project", False)]
+            kept = table.add_rows([("a", 1), ("b", 1)])
+
+            def _work() -> None:
+                keys = table.batch_add_rows((f"p{index:03}", index) for index in range(200))
+                table.batch_remove_row(keys[0])
+                table.batch_update_cell(keys[1], "commits", -1)
+                table.get_selectable_row(kept[0]).remove()
+                table.get_selectable_row(kept[1]).update("commits", 2)
+
+            await asyncio.to_thread(_work)
+            table.flush_batch()
+            rows = _ordered_data(table)
+            assert len(rows) == 200
+            assert rows[:2] == [["b", 2], ["p001", -1]]
+
+    asyncio.run(_test())
+
+
+def test_fuzzy_filter() -> None:
+    """Rows are filtered as a query changes, and selection only applies to shown rows."""
+
+    async def _test() -> None:
+        async with _TableApp().run_test() as pilot:
+            table = pilot.app.query_one(DataTable)
+            table.clear(columns=True)
+            table.add_column("Project", key="project")
+            table.add_column("Branch", key="branch")
+            table.sort_columns = [("project", False)]
+            table.add_rows([("devboard", "main"), ("duty", "feat/parallel"), ("failprint", "main")])
+            table.filter("dvb")
+            assert _ordered_data(table) == [["devboard", "main"]]
+            table.filter("fpar")
+            assert _ordered_data(table) == [["duty", "feat/parallel"]]
+            table.action_toggle_select_all()
+            table.filter("main")
+            assert _ordered_data(table) == [["devboard", "main"], ["failprint", "main"]]
+            keys = table.add_rows([("archan", "main"), ("mkdocs", "dev")])
+            assert _ordered_data(table) == [["archan", "main"], ["devboard", "main"], ["failprint", "main"]]
+            # Hidden rows are still available through the public API.
+            assert table.get_row(keys[1])[1:] == ["mkdocs", "dev"]
+            assert table.get_cell(keys[1], "branch") == "dev"
+            table.update_cell(keys[1], "branch", "main")
+            assert _ordered_data(table)[-1] == ["mkdocs", "main"]
+            table.filter("dev")
+            assert len(table.all_row_keys) == 5
+            assert table.get_row_cells(keys[0])["project"] == "archan"
+            table.remove_row(keys[0])
+            assert keys[0] not in table._row_sort_keys
+            table.filter("")
+            assert len(_ordered_data(table)) == 4
+            assert [row.data for row in table.selected_rows] == [["duty", "feat/parallel"]]
+            table.clear()
+            assert not table._row_sort_keys
+
+    asyncio.run(_test())
+
+
+class _BranchRow(Row):
+    project: Project
+    branch: str
+
+
+def test_typed_rows() -> None:
+    """Typed fields give access to row values, and row objects are cached."""
+
+    async def _test() -> None:
+        async with _TableApp().run_test() as pilot:
+            table = pilot.app.query_one(DataTable)
+            table.ROW = _BranchRow
+            table.clear(columns=True)
+            table.add_column("Project", key="project")
+            table.add_column("Branch", key="branch")
+            keys = table.add_rows([(_PROJECTS[0], "main"), (_PROJECTS[1], "dev")])
+            row = table.get_selectable_row(keys[1])
+            assert isinstance(row, _BranchRow)
+            assert (row.project, row.branch) == (_PROJECTS[1], "dev")
+            assert row.data == [_PROJECTS[1], "dev"]
+            assert table.get_selectable_row(keys[1]) is row
+            table.filter("main")
+            assert row.branch == "dev"
+            row.update("branch", "main")
+            assert len(_ordered_data(table)) == 2
+            assert row.project is _PROJECTS[1]
+            table.add_column("Extra", key="extra")
+            table.filter("dev")
+            table.remove_column("project")
+            assert row.data == ["main", None]
+            assert table.get_selectable_row(keys[0]).data == ["main", None]
+
+    asyncio.run(_test())
+
+
+class _MemoizedColumn(Column):
+    @staticmethod
+    @memoize_rows()
+    def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        # Count calls in a file, since rows may be populated in other processes.
+        counter = project.path.parent / "calls"
+        calls = int(counter.read_text()) + 1 if counter.exists() else 1
+        counter.write_text(str(calls))
+        return [(project, calls)]
+
+
+def test_memoized_rows(tmp_path: Path) -> None:
+    """Rows are computed again only when the project fingerprint changes.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    init_repo(tmp_path / "repo")
+    project = Project(tmp_path / "repo")
+    column = _MemoizedColumn()
+    column.list_projects = lambda: [project]  # type: ignore[method-assign]
+    assert column._populate() == [(project, 1)]
+    assert column.populate_rows(project) == [(project, 1)]
+    git(project.path, "commit", "--allow-empty", "-m", "Other commit")
+    assert column.populate_rows(project) == [(project, 2)]
+    assert column._populate() == [(project, 2)]
+    # Vanished projects (not Git repositories anymore) are not cached.
+    shutil.rmtree(project.path)
+    project = Project(project.path)
+    assert column._populate() == [(project, 3)]
+    assert column.populate_rows(project) == [(project, 4)]
+
+
+class _FailingColumn(Column):
+    HEADERS = ("Project", "Details", "Count")
+    TIMEOUT = 1
+
+    def list_projects(self) -> list[Project]:
+        return [Project(Path("ok")), Project(Path("hang")), Project(Path("fail"))]
+
+    @staticmethod
+    def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        if project.name == "hang":
+            subprocess.run(["sleep", "30"], check=False)  # noqa: S607
+        elif project.name == "fail":
+            raise ValueError("no such repository")
+        return [(project, "fine", 1)]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX signals")
+def test_populate_isolates_failures() -> None:
+    """Projects failing or exceeding their time budget get error rows, without affecting others."""
+    start = time.monotonic()
+    rows = _FailingColumn()._populate()
+    assert time.monotonic() - start < 10
+    assert [(row[0].name, str(row[1])) for row in rows] == [
+        ("ok", "fine"),
+        ("hang", "⚠ timed out after 1s"),
+        ("fail", "⚠ no such repository"),
+    ]
+    assert isinstance(rows[1][1], ErrorCell)
+    assert rows[1][2] == ""
+
+
+_values = {"a": 1, "b": 1}
+
+
+@pytest.fixture
+def values() -> Iterator[dict[str, int]]:
+    """Provide values returned by async columns, reset after each test."""
+    yield _values
+    _values.update(a=1, b=1)
+
+
+class _AsyncColumn(Column):
+    HEADERS = ("Project", "Value")
+
+    def list_projects(self) -> list[Project]:
+        return _PROJECTS
+
+    @staticmethod
+    async def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        await asyncio.sleep(0.01)
+        return [(project, _values[project.name])]
+
+
+class _ColumnApp(App):
+    def compose(self) -> ComposeResult:
+        yield _AsyncColumn()
+
+
+def test_refresh_single_project_and_coalesce(values: dict[str, int]) -> None:
+    """A single project can be refreshed, and refreshes requested while loading are coalesced.
+
+    Parameters:
+        values: Values returned by async columns.
+    """
+
+    async def _test() -> None:
+        async with _ColumnApp().run_test() as pilot:
+            column = pilot.app.query_one(_AsyncColumn)
+            column.update()
+            column.update()
+            assert column._update_pending
+            values["b"] = 2
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
+            await pilot.app.workers.wait_for_complete()
+            assert _ordered_data(column.table) == [[_PROJECTS[0], 1], [_PROJECTS[1], 2]]
+            values["a"] = 3
+            column.update_project(_PROJECTS[0])
+            await pilot.app.workers.wait_for_complete()
+            assert _ordered_data(column.table) == [[_PROJECTS[0], 3], [_PROJECTS[1], 2]]
+            # A full update drops rows of projects being updated.
+            column.update_project(_PROJECTS[1])
+            column.update()
+            await pilot.app.workers.wait_for_complete([worker for worker in column.workers if not worker.is_cancelled])
+            assert _ordered_data(column.table) == [[_PROJECTS[0], 3], [_PROJECTS[1], 2]]
+
+    asyncio.run(_test())
+
+
+class _TagsColumn(_AsyncColumn):
+    DEPENDS_ON = frozenset({"tags"})
+
+
+class _RefsColumn(_AsyncColumn):
+    DEPENDS_ON = frozenset({"refs"})
+
+
+class _InvalidationApp(Devboard):
+    def compose(self) -> ComposeResult:
+        yield _TagsColumn()
+        yield _RefsColumn()
+
+
+def test_invalidation_by_data_kind(values: dict[str, int]) -> None:
+    """Only columns depending on changed kinds of data update the changed projects.
+
+    Parameters:
+        values: Values returned by async columns.
+    """
+
+    async def _test() -> None:
+        async with _InvalidationApp(background_tasks=False).run_test() as pilot:
+            await pilot.pause()
+            await pilot.app.workers.wait_for_complete()
+            tags_column = pilot.app.query_one(_TagsColumn)
+            refs_column = pilot.app.query_one(_RefsColumn)
+            values["a"] = 4
+            refs_column.invalidate(_PROJECTS[0], kinds=("refs", "worktree"))
+            await pilot.pause(0.5)
+            await pilot.app.workers.wait_for_complete()
+            assert _ordered_data(refs_column.table)[0] == [_PROJECTS[0], 4]
+            assert _ordered_data(tags_column.table)[0] != [_PROJECTS[0], 4]
+
+    asyncio.run(_test())
+
+
+_events: list[str] = []
+
+
+class _SlowColumn(_AsyncColumn):
+    DEFAULT_CSS = "_SlowColumn { width: 90; }"
+
+    async def populate_rows(self, project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        _events.append(f"start {self.id}")
+        await asyncio.sleep(0.05)
+        _events.append(f"end {self.id}")
+        return [(project, 1)]
+
+
+class _WideApp(App):
+    CSS = "Screen { layout: horizontal; }"
+
+    def compose(self) -> ComposeResult:
+        yield _SlowColumn(id="visible")
+        yield _SlowColumn(id="offscreen")
+
+
+def test_offscreen_columns_are_deferred() -> None:
+    """Off-screen columns are loaded after visible ones."""
+
+    async def _test() -> None:
+        async with _WideApp().run_test(size=(80, 24)) as pilot:
+            offscreen = pilot.app.query_one("#offscreen", _SlowColumn)
+            for _ in range(20):
+                await pilot.pause(0.05)
+                await pilot.app.workers.wait_for_complete()
+            assert offscreen.table.row_count == 2
+            assert (
+                _events == ["start visible"] * 2 + ["end visible"] * 2 + ["start offscreen"] * 2 + ["end offscreen"] * 2
+            )
+
+    asyncio.run(_test())
+
+
+class _DependentColumn(_SlowColumn):
+    DEFAULT_CSS = "_DependentColumn { width: 30; }"
+    DEPENDS_ON_OTHER_COLUMNS = True
+
+
+class _NarrowColumn(_SlowColumn):
+    DEFAULT_CSS = "_NarrowColumn { width: 30; }"
+
+
+class _DependentApp(App):
+    CSS = "Screen { layout: horizontal; }"
+
+    def compose(self) -> ComposeResult:
+        yield _DependentColumn(id="dependent")
+        yield _NarrowColumn(id="visible")
+
+
+def test_dependent_columns_are_loaded_last() -> None:
+    """Visible columns depending on other columns are loaded once other columns are done loading."""
+
+    async def _test() -> None:
+        _events.clear()
+        async with _DependentApp().run_test(size=(80, 24)) as pilot:
+            dependent = pilot.app.query_one("#dependent", _DependentColumn)
+            for _ in range(20):
+                await pilot.pause(0.05)
+                await pilot.app.workers.wait_for_complete()
+            assert dependent.table.row_count == 2
+            assert (
+                _events == ["start visible"] * 2 + ["end visible"] * 2 + ["start dependent"] * 2 + ["end dependent"] * 2
+            )
+
+    asyncio.run(_test())
+
+
+class _BulkColumn(_AsyncColumn):
+    def apply(self, action: str, row: Row) -> None:  # noqa: ARG002
+        self.notify_info(f"Started: {row.project}")
+        if row.project.name == "b":
+            self.notify_error(f"Failed: {row.project}")
+        else:
+            self.notify_success(f"Finished: {row.project}")
+
+
+class _BulkApp(App):
+    def compose(self) -> ComposeResult:
+        yield _BulkColumn()
+
+
+def test_bulk_actions_are_aggregated() -> None:
+    """Actions applied to several rows show a progress bar, then a single notification, logging the rest."""
+
+    async def _test() -> None:
+        async with _BulkApp().run_test() as pilot:
+            column = pilot.app.query_one(_BulkColumn)
+            await pilot.pause(0.2)
+            column.table.action_toggle_select_all()
+            column.action_apply()
+            operation = BulkOperation.history[-1]
+            for _ in range(20):
+                await pilot.pause(0.1)
+                if operation.finished and not pilot.app.query(ProgressBar):
+                    break
+            assert (operation.done, operation.failed, operation.remaining) == (1, 1, 0)
+            assert operation.ended is not None
+            severities = [severity for _, severity, _ in operation.log]
+            assert (severities.count("info"), severities.count("success"), severities.count("error")) == (2, 1, 1)
+            assert not pilot.app.query(ProgressBar)
+            assert "Failed: b" in operation.render_log().plain
+
+    asyncio.run(_test())
+
+
+_BOARD = """
+from pathlib import Path
+
+from devboard import Column, Project
+
+
+class BoardProject(Project):
+    pass
+
+
+class First(Column):
+    HEADERS = ("Project", "{header}")
+
+    def list_projects(self):
+        return [BoardProject(Path("a"))]
+
+    @staticmethod
+    async def populate_rows(project):
+        return [(project, {first})]
+
+
+def value():
+    return {second}
+
+
+class Second(First):
+    @staticmethod
+    async def populate_rows(project):
+        return [(project, value())]
+
+
+columns = [First, Second]
+"""
+
+
+def test_reload_board(tmp_path: Path) -> None:
+    """Reloading the board replaces changed columns only, keeping unchanged classes and widgets.
+
+    Columns are changed when their source changes, or when classes or functions they use change.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    board = tmp_path / "board.py"
+    board.write_text(_BOARD.format(first=1, second=2, header="Value"))
+
+    async def _test() -> None:
+        async with Devboard(board=board, background_tasks=False).run_test() as pilot:
+            await pilot.pause(0.3)
+            first, second = pilot.app.query(Column)
+            project_class = sys.modules["devboard.user_board"].BoardProject
+            board.write_text(_BOARD.format(first=1, second=3, header="Value"))
+            await pilot.app.action_reload_board()
+            await pilot.pause(0.3)
+            columns = list(pilot.app.query(Column))
+            assert columns[0] is first
+            assert columns[1] is not second
+            assert type(columns[1]).__name__ == "Second"
+            # The changed subclass inherits from the kept class, not from a copy of it.
+            assert type(columns[1]).__mro__[1] is type(first)
+            assert sys.modules["devboard.user_board"].BoardProject is project_class
+            assert columns[0].table.get_row_at(0)[2] == 1
+            assert columns[1].table.get_row_at(0)[2] == 3
+            board.write_text(_BOARD.format(first=1, second=3, header="Count"))
+            await pilot.app.action_reload_board()
+            await pilot.pause(0.3)
+            first, second = pilot.app.query(Column)
+            assert first is not columns[0]
+            assert second is not columns[1]
+            assert type(second).__mro__[1] is type(first)
+            assert type(second).HEADERS == ("Project", "Count")
+            columns = [first, second]
+            board.write_text(_BOARD.format(first=1, second="(", header="Count"))
+            await pilot.app.action_reload_board()
+            assert list(pilot.app.query(Column)) == columns
+
+    asyncio.run(_test())
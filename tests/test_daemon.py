@@ -0,0 +1,133 @@
+"""Tests for the daemon."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+from typing import TYPE_CHECKING, Any
+
+from devboard import BoardDaemon, Column, DaemonClient, Project
+from devboard._internal.daemon import _socket_path
+
+if TYPE_CHECKING:
+    import pytest
+
+_PROJECTS = [Project(Path("a")), Project(Path("b"))]
+_values = {"a": 1, "b": 1}
+
+
+class _Column(Column):
+    HEADERS = ("Project", "Value")
+
+    def list_projects(self) -> list[Project]:
+        return _PROJECTS
+
+    @staticmethod
+    async def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        return [(project, _values[project.name])]
+
+
+def _connect(path: Path) -> DaemonClient:
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            return DaemonClient(path)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def _run(loop: asyncio.AbstractEventLoop, task: asyncio.Task) -> None:
+    with contextlib.suppress(asyncio.CancelledError):
+        loop.run_until_complete(task)
+    loop.close()
+
+
+def test_daemon_serves_and_pushes_rows(tmp_path: Path) -> None:
+    """The daemon serves rows from memory, recomputes them on demand, and pushes changes to subscribers."""
+    path = tmp_path / "daemon.sock"
+    daemon = BoardDaemon([_Column], poll_interval=3600)
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(daemon.serve(path))
+    thread = Thread(target=_run, args=(loop, task), daemon=True)
+    thread.start()
+    client = _connect(path)
+    subscriber = _connect(path)
+    changes: Queue = Queue()
+    subscriber.subscribe(lambda *change: changes.put(change))
+    try:
+        assert path.stat().st_mode & 0o077 == 0
+        assert sorted(client.rows("_Column", timeout=5)) == [(_PROJECTS[0], 1), (_PROJECTS[1], 1)]
+        _values["a"] = 2
+        assert client.rows("_Column", [_PROJECTS[0]], timeout=5) == [(_PROJECTS[0], 1)]
+        assert client.rows("_Column", [_PROJECTS[0]], refresh=True, timeout=5) == [(_PROJECTS[0], 2)]
+        assert changes.get(timeout=5) == ("_Column", [_PROJECTS[0]], [(_PROJECTS[0], 2)])
+    finally:
+        client.close()
+        subscriber.close()
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join(5)
+    assert not path.exists()
+
+
+class _FlakyColumn(_Column):
+    failing = False
+
+    def list_projects(self) -> list[Project]:
+        if self.failing:
+            raise OSError("projects directory is unavailable")
+        return _PROJECTS[1:]
+
+
+def test_daemon_survives_watch_errors(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Errors while watching projects are logged, and the daemon keeps watching them.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        caplog: Pytest fixture to capture logs.
+    """
+    path = tmp_path / "daemon.sock"
+    column = _FlakyColumn()
+    daemon = BoardDaemon([column], poll_interval=0.05, full_refresh_interval=0)
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(daemon.serve(path))
+    thread = Thread(target=_run, args=(loop, task), daemon=True)
+    thread.start()
+    subscriber = _connect(path)
+    changes: Queue = Queue()
+    subscriber.subscribe(lambda *change: changes.put(change))
+    try:
+        column.failing = True
+        deadline = time.monotonic() + 5
+        while "projects directory is unavailable" not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert "Failed to update rows" in caplog.text
+        column.failing = False
+        _values["b"] = 3
+        assert changes.get(timeout=5) == ("_FlakyColumn", [_PROJECTS[1]], [(_PROJECTS[1], 3)])
+    finally:
+        _values["b"] = 1
+        subscriber.close()
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join(5)
+
+
+def test_socket_path_of_configured_board(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The configured board, its name and its path are served by the same daemon.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to set environment variables.
+    """
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    config_dir = tmp_path / "devboard"
+    config_dir.mkdir()
+    config_dir.joinpath("config.toml").write_text('board = "mine"')
+    config_dir.joinpath("mine.py").write_text("columns = []")
+    assert _socket_path(None) == _socket_path("mine") == _socket_path(config_dir / "mine.py")
+    assert _socket_path("other") != _socket_path(None)
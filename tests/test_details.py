@@ -0,0 +1,64 @@
+"""Tests for the details cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from devboard import DetailsCache, Project
+from tests.helpers import git, init_repo
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_details_cache_validation() -> None:
+    """Entries are only returned for the same fingerprint, before they expire, within size limits."""
+    cache = DetailsCache(max_size=10, max_entry_size=6)
+    cache.set(("a",), 1, b"12345")
+    assert cache.get(("a",), 1, ttl=10) == b"12345"
+    assert cache.get(("a",), 2, ttl=10) is None
+    assert cache.get(("a",), 1, ttl=-1) is None
+    cache.set(("b",), 1, b"1234567")
+    assert cache.get(("b",), 1, ttl=10) is None
+    cache.set(("c",), 1, b"123456")
+    assert cache.get(("a",), 1, ttl=10) is None
+    assert cache.get(("c",), 1, ttl=10) == b"123456"
+
+
+def test_project_fingerprint(tmp_path: Path) -> None:
+    """The fingerprint changes when the index or references change."""
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    project = Project(repo)
+    fingerprint = project.fingerprint
+    assert project.fingerprint == fingerprint
+    repo.joinpath("new").write_text("new\n")
+    git(repo, "add", "new")
+    assert project.fingerprint != fingerprint
+    fingerprint = project.fingerprint
+    git(repo, "commit", "-qm", "new")
+    assert project.fingerprint != fingerprint
+
+
+def test_project_dirty_fingerprint(tmp_path: Path) -> None:
+    """The dirty fingerprint also changes when changed files are modified again, without refreshing the index.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    repo.joinpath("file").write_text("one\n")
+    git(repo, "add", "file")
+    git(repo, "commit", "-qm", "file")
+    project = Project(repo)
+    fingerprint, dirty_fingerprint = project.fingerprint, project.dirty_fingerprint
+    assert project.dirty_fingerprint == dirty_fingerprint
+    repo.joinpath("file").write_text("two\n")
+    modified = project.dirty_fingerprint
+    assert modified != dirty_fingerprint
+    repo.joinpath("file").write_text("three\n")
+    assert project.dirty_fingerprint != modified
+    repo.joinpath("untracked").write_text("new\n")
+    assert project.dirty_fingerprint[-1] != modified[-1]
+    assert project.fingerprint == fingerprint
@@ -0,0 +1,49 @@
+"""Tests for projects discovery."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from devboard import discover_projects
+from tests.helpers import git, init_repo
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_discover_nested_layout(tmp_path: Path) -> None:
+    """Repositories are found at any depth, within limits and ignore patterns.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    init_repo(tmp_path / "org1" / "repo1")
+    init_repo(tmp_path / "org1" / "repo1" / "vendor" / "inner")
+    init_repo(tmp_path / "org2" / "repo2")
+    init_repo(tmp_path / "org2" / "archive" / "old")
+    git(tmp_path, "init", "--bare", "-b", "main", "org2/bare.git")
+
+    assert discover_projects(tmp_path, max_depth=1) == []
+    assert discover_projects(tmp_path, max_depth=2) == [tmp_path / "org1" / "repo1", tmp_path / "org2" / "repo2"]
+    assert discover_projects(tmp_path, ignore=["org2/archive"], bare=True) == [
+        tmp_path / "org1" / "repo1",
+        tmp_path / "org2" / "bare.git",
+        tmp_path / "org2" / "repo2",
+    ]
+    assert tmp_path / "org1" / "repo1" / "vendor" / "inner" in discover_projects(tmp_path, nested=True)
+
+
+def test_persisted_index(tmp_path: Path) -> None:
+    """The index of scanned directories can be persisted in a file.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    init_repo(tmp_path / "projects" / "repo")
+    index_file = tmp_path / "cache" / "index.json"
+    assert discover_projects(tmp_path / "projects", index_file=index_file) == [tmp_path / "projects" / "repo"]
+    init_repo(tmp_path / "projects" / "other")
+    assert discover_projects(tmp_path / "projects", index_file=index_file) == [
+        tmp_path / "projects" / "other",
+        tmp_path / "projects" / "repo",
+    ]
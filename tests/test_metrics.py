@@ -0,0 +1,39 @@
+"""Tests for the metrics exporter."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from devboard import Column, MetricsExporter, Project
+
+_PROJECTS = [Project(Path("a")), Project(Path("b"))]
+
+
+class _Column(Column):
+    TITLE = "To Push"
+    HEADERS = ("Project", "Branch", "Commits")
+
+    def list_projects(self) -> list[Project]:
+        return _PROJECTS
+
+    @staticmethod
+    async def populate_rows(project: Project) -> list[tuple[Any, ...]]:  # type: ignore[override]
+        if project.name == "b":
+            raise ValueError("failed")
+        return [(project, "main", 2), (project, "dev", 3)]
+
+
+def test_export_metrics(tmp_path: Path) -> None:
+    """Row counts, numeric values and scan durations are exported per column and project."""
+    exporter = MetricsExporter([_Column])
+    exporter.scan()
+    textfile = tmp_path / "devboard.prom"
+    exporter.write_textfile(textfile)
+    metrics = textfile.read_text()
+    assert 'devboard_column_rows{column="To Push"} 2' in metrics
+    assert 'devboard_column_errors{column="To Push"} 1' in metrics
+    assert 'devboard_project_rows{column="To Push",project="a",path="a"} 2' in metrics
+    assert 'devboard_project_value{column="To Push",project="a",path="a",header="Commits"} 5' in metrics
+    assert 'devboard_scan_duration_seconds{column="To Push",phase="populate"}' in metrics
+    assert metrics.endswith("# EOF\n")
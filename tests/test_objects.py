@@ -0,0 +1,68 @@
+"""Tests for the objects reader."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from devboard import ObjectReader, Project
+from tests.helpers import git, init_repo
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _log(repo: Path, *args: str) -> list[tuple[str, str]]:
+    lines = git(repo, "log", "--format=%H %s", *args).splitlines()
+    return [tuple(line.split(" ", 1)) for line in lines]  # type: ignore[misc]
+
+
+def test_read_loose_and_packed_objects(tmp_path: Path) -> None:
+    """History walks match `git log`, with loose objects, and with deltified objects in packs.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    content = "".join(f"line {number}\n" for number in range(200))
+    for number in range(10):
+        content += f"change {number}\n"
+        repo.joinpath("file.txt").write_text(content)
+        git(repo, "add", "file.txt")
+        git(repo, "commit", "-m", f"feat: Change {number}\n\nDetails.")
+        if number == 4:
+            git(repo, "tag", "-a", "v0.1.0", "-m", "v0.1.0")
+            git(repo, "checkout", "-q", "-b", "topic")
+            git(repo, "commit", "--allow-empty", "-m", "fix: Topic")
+            git(repo, "checkout", "-q", "main")
+            git(repo, "merge", "--no-ff", "-m", "Merge topic", "topic")
+    for _ in range(2):
+        reader = ObjectReader(repo)
+        head = git(repo, "rev-parse", "HEAD")
+        assert list(reader.walk(head)) == _log(repo)
+        assert list(reader.walk(head, first_parent=True)) == _log(repo, "--first-parent")
+        assert reader.read(git(repo, "rev-parse", "HEAD:file.txt")) == ("blob", content.encode())
+        old_blob = reader.read(git(repo, "rev-parse", "HEAD~5:file.txt"))[1]
+        assert old_blob.decode().strip() == git(repo, "show", "HEAD~5:file.txt")
+        assert reader.peel(git(repo, "rev-parse", "v0.1.0")) == git(repo, "rev-parse", "v0.1.0^{commit}")
+        git(repo, "gc", "-q", "--aggressive")
+
+
+class _GitProject(Project):
+    OBJECT_READER = False
+
+
+def test_unreleased_subjects_without_git(tmp_path: Path) -> None:
+    """Unreleased commits read from the file-system match those listed by Git.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    git(repo, "tag", "v0.1.0")
+    git(repo, "commit", "--allow-empty", "-m", "feat: Feature")
+    git(repo, "commit", "--allow-empty", "-m", "fix: Fix")
+    expected = _log(repo, "v0.1.0..main")
+    assert Project(repo).unreleased_subjects() == expected
+    assert _GitProject(repo).unreleased_subjects() == expected
@@ -0,0 +1,48 @@
+"""Tests for the pager."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from textual.app import App
+
+from devboard import Pager, PagerView
+
+
+def test_pager_reads_output_lazily() -> None:
+    """Lines are indexed as output is read, and file headers can be jumped to."""
+    script = "for i in range(3): print(f'\\x1b[1mdiff --git a/{i} b/{i}\\x1b[m\\n+line\\n-line')"
+
+    async def _test() -> None:
+        app = App()
+        async with app.run_test() as pilot:
+            app.push_screen(Pager([sys.executable, "-c", script]))
+            await pilot.pause()
+            view = app.screen.query_one(PagerView)
+            while not view.complete:
+                await pilot.pause(0.05)
+            assert view.line_count == 9
+            assert view._file_starts == [0, 3, 6]
+            assert view.render_line(0).text.startswith("diff --git a/0 b/0")
+            await pilot.press("q")
+            assert not isinstance(app.screen, Pager)
+
+    asyncio.run(_test())
+
+
+def test_pager_shows_given_output() -> None:
+    """Already computed output is shown without running a command."""
+
+    async def _test() -> None:
+        app = App()
+        async with app.run_test() as pilot:
+            app.push_screen(Pager(output=b"one\ntwo\nthree"))
+            await pilot.pause()
+            view = app.screen.query_one(PagerView)
+            while not view.complete:
+                await pilot.pause(0.05)
+            assert view.line_count == 3
+            assert view.render_line(2).text.startswith("three")
+
+    asyncio.run(_test())
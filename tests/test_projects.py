@@ -0,0 +1,132 @@
+"""Tests for projects."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from devboard import Project, Status
+from tests.helpers import git, init_repo
+
+
+def test_async_variants_match_sync_ones(tmp_path: Path) -> None:
+    """Asynchronous query methods return the same results as synchronous ones.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    init_repo(tmp_path / "remote")
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", str(tmp_path / "remote"), str(clone))
+    clone.joinpath("tracked.txt").write_text("tracked\n", encoding="utf8")
+    git(clone, "add", "tracked.txt")
+    git(clone, "commit", "-m", "Add tracked file")
+    clone.joinpath("tracked.txt").write_text("modified\n", encoding="utf8")
+    clone.joinpath("untracked.txt").touch()
+    project = Project(clone)
+
+    async def _query() -> list:
+        return await asyncio.gather(
+            project.is_dirty_async(),
+            project.status_line_async(),
+            project.unpushed_async(),
+            project.unpulled_async(),
+        )
+
+    assert asyncio.run(_query()) == [True, "1M 1U", {"main": 1}, {"main": 0}]
+    assert project.is_dirty
+    assert project.status_line == "1M 1U"
+    assert project.unpushed() == {"main": 1}
+
+
+def test_status_paths_and_counts(tmp_path: Path) -> None:
+    """Status paths are materialized on access, and counts can be queried alone.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    for name in ("kept.txt", "deleted.txt"):
+        repo.joinpath(name).write_text(name, encoding="utf8")
+    git(repo, "add", ".")
+    git(repo, "commit", "-m", "Add files")
+    repo.joinpath("kept.txt").write_text("modified\n", encoding="utf8")
+    repo.joinpath("deleted.txt").unlink()
+    repo.joinpath("new dir").mkdir()
+    repo.joinpath("new dir", "untracked é.txt").touch()
+    project = Project(repo)
+
+    status = project.status
+    assert status.modified == [Path("kept.txt")]
+    assert status.deleted == [Path("deleted.txt")]
+    assert status.untracked == [Path("new dir", "untracked é.txt")]
+    assert status.counts == project.status_counts
+    assert project.status_counts == {
+        "added": 0,
+        "deleted": 1,
+        "modified": 1,
+        "renamed": 0,
+        "typechanged": 0,
+        "untracked": 1,
+    }
+    assert asyncio.run(project.status_async()) == status
+    assert project.status_line == "1D 1M 1U"
+    assert status == Status([], ["deleted.txt"], ["kept.txt"], [], [], [Path("new dir", "untracked é.txt")])
+
+
+def test_maintenance_state(tmp_path: Path) -> None:
+    """Object statistics and commit-graph/multi-pack-index presence reflect maintenance.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    project = Project(repo)
+    counts = project.object_counts
+    assert counts["count"] > 0
+    assert counts["packs"] == 0
+    assert asyncio.run(project.object_counts_async()) == counts
+    assert not project.has_commit_graph
+    project.write_commit_graph()
+    assert project.has_commit_graph
+    project.repack()
+    assert project.has_multi_pack_index
+    assert project.object_counts["packs"] == 1
+    assert project.object_counts["count"] == 0
+
+
+class _LargeProject(Project):
+    LARGE_REPO_THRESHOLD = 2
+
+
+def test_large_repo_mode(tmp_path: Path) -> None:
+    """Projects above the threshold run status with tuning options, until they're configured.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    repo = tmp_path / "repo"
+    init_repo(repo)
+    repo.joinpath("file.txt").write_text("file", encoding="utf8")
+    git(repo, "add", ".")
+    project = _LargeProject(repo)
+    assert project.index_entries == 1
+    assert not project.is_large
+    assert project.large_repo_options == []
+    repo.joinpath("other.txt").write_text("other", encoding="utf8")
+    git(repo, "add", ".")
+    git(repo, "commit", "-m", "Add files")
+    repo.joinpath("untracked.txt").touch()
+    assert project.is_large
+    assert "core.untrackedCache=true" in project.large_repo_options
+    assert not any(option.startswith("core.fsmonitor") for option in project.large_repo_options)
+    assert "core.splitIndex" in project.missing_large_repo_settings
+    assert project.is_dirty
+    assert project.status.untracked == [Path("untracked.txt")]
+    project.enable_large_repo_settings()
+    assert project.index_entries == 2
+    assert project.large_repo_options == []
+    assert project.missing_large_repo_settings == []
+    assert asyncio.run(project.status_async()).untracked == [Path("untracked.txt")]
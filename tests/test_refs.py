@@ -0,0 +1,53 @@
+"""Tests for the references reader."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from devboard import Project, Refs
+from tests.helpers import git, init_repo
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_read_loose_and_packed_refs(tmp_path: Path) -> None:
+    """Loose refs override packed ones, annotated tags are peeled from `packed-refs`.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    repo = tmp_path / "repo"
+    first = init_repo(repo)
+    git(repo, "tag", "-a", "v0.1.0", "-m", "v0.1.0")
+    git(repo, "branch", "feat/thing")
+    git(repo, "pack-refs", "--all")
+    git(repo, "commit", "--allow-empty", "-m", "Second commit")
+    second = git(repo, "rev-parse", "HEAD")
+
+    refs = Refs(repo)
+    assert refs.heads == {"main": second, "feat/thing": first}
+    assert refs.peeled_tags == {"v0.1.0": first}
+    assert refs.tags["v0.1.0"] != first
+    assert refs.head == "main"
+
+
+def test_diverged_branches(tmp_path: Path) -> None:
+    """Only branches differing from their remote-tracking branch are reported.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    remote = tmp_path / "remote"
+    init_repo(remote)
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", str(remote), str(clone))
+    assert Refs(clone).diverged() == {}
+    assert Project(clone).unpushed() == {"main": 0}
+
+    git(clone, "commit", "--allow-empty", "-m", "Local commit")
+    refs = Refs(clone)
+    assert set(refs.diverged()) == {"main"}
+    assert refs.tracked()["main"] == refs.diverged()["main"]
+    assert Project(clone).unpushed() == {"main": 1}
+    assert Project(clone).unpulled() == {"main": 0}